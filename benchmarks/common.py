@@ -0,0 +1,181 @@
+"""
+Helpers shared by the benchmark suites: percentiles, JSON reports and baseline comparison.
+
+Reports are JSON documents with a `results` list. Every result is identified by its `key`
+(e.g. `order/detail/c8`) and holds the measured values; `compare` matches the results of
+two reports by key and flags the regressions beyond a relative tolerance.
+"""
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values (Sequence[float]): Values sorted in ascending order.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+def latency_summary(latencies: Sequence[float]) -> dict[str, float]:
+    """
+    Summarize latencies measured in seconds as p50/p95/p99/max in milliseconds.
+
+    Args:
+        latencies (Sequence[float]): Latencies in seconds.
+
+    Returns:
+        dict[str, float]: The latency percentiles in milliseconds.
+    """
+    values = sorted(latencies)
+    return {
+        "p50": round(percentile(values, 50) * 1000, 3),
+        "p95": round(percentile(values, 95) * 1000, 3),
+        "p99": round(percentile(values, 99) * 1000, 3),
+        "max": round(values[-1] * 1000, 3) if values else 0.0
+    }
+
+def build_report(suite: str, parameters: dict[str, Any], results: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Wrap benchmark results with the metadata needed to interpret them later.
+
+    Args:
+        suite (str): Name of the benchmark suite.
+        parameters (dict[str, Any]): Parameters of the run (volumes, concurrency, ...).
+        results (list[dict[str, Any]]): One entry per measured case, each with a unique `key`.
+
+    Returns:
+        dict[str, Any]: The report, ready to be dumped as JSON.
+    """
+    return {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine()
+        },
+        "parameters": parameters,
+        "results": results
+    }
+
+def write_report(report: dict[str, Any], path: str | None) -> None:
+    """
+    Write the report as JSON to `path`, or to stdout when no path is given.
+
+    Args:
+        report (dict[str, Any]): The report to write.
+        path (str | None): Destination file.
+    """
+    content = json.dumps(report, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(content + "\n")
+    else:
+        print(content)
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+    higher_is_better: Sequence[str],
+    lower_is_better: Sequence[str]
+) -> list[str]:
+    """
+    Compare a report against a stored baseline.
+
+    A value regresses when it is worse than the baseline by more than `tolerance`
+    (relative, e.g. 0.1 for 10%). Cases missing from either report are ignored.
+
+    Args:
+        current (dict[str, Any]): Report of the current run.
+        baseline (dict[str, Any]): Stored baseline report.
+        tolerance (float): Allowed relative degradation.
+        higher_is_better (Sequence[str]): Dotted paths of values that should not decrease (e.g. 'throughput_rps').
+        lower_is_better (Sequence[str]): Dotted paths of values that should not increase (e.g. 'latency_ms.p95').
+
+    Returns:
+        list[str]: One human-readable line per regression; empty when there is none.
+    """
+    baseline_results = {result["key"]: result for result in baseline.get("results", [])}
+    regressions = []
+
+    for result in current.get("results", []):
+        reference = baseline_results.get(result["key"])
+        if reference is None:
+            continue
+
+        for path in higher_is_better:
+            value, expected = _lookup(result, path), _lookup(reference, path)
+            if value is not None and expected and value < expected * (1 - tolerance):
+                regressions.append(f"{result['key']}: {path} {value} < baseline {expected} (-{_change(value, expected)}%)")
+
+        for path in lower_is_better:
+            value, expected = _lookup(result, path), _lookup(reference, path)
+            if value is not None and expected and value > expected * (1 + tolerance):
+                regressions.append(f"{result['key']}: {path} {value} > baseline {expected} (+{_change(value, expected)}%)")
+
+    return regressions
+
+def load_report(path: str) -> dict[str, Any]:
+    """Read a JSON report from disk."""
+    with open(path) as f:
+        return json.load(f)
+
+def run_in_subprocess(module: str, service: str, argv: list[str], workdir: str) -> list[dict[str, Any]]:
+    """
+    Run a benchmark module for one service in a child process and return its results.
+
+    Both services ship a top-level `app` package, so a process can only load one of them.
+
+    Args:
+        module (str): Benchmark module, run with `python -m`.
+        service (str): Service passed as `--service`.
+        argv (list[str]): Remaining command line arguments.
+        workdir (str): Directory where the child writes its report.
+
+    Returns:
+        list[dict[str, Any]]: The results of the child report.
+    """
+    out = os.path.join(workdir, f"{service}.json")
+    command = [sys.executable, "-m", module, *argv, "--service", service, "--out", out]
+    subprocess.run(command, cwd=ROOT, check=True)
+    return load_report(out)["results"]
+
+def strip_options(argv: list[str], options: tuple[str, ...]) -> list[str]:
+    """Remove options (and their values) that the parent process handles itself."""
+    stripped, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in options:
+            skip = True
+        elif not arg.startswith(tuple(option + "=" for option in options)):
+            stripped.append(arg)
+    return stripped
+
+def _lookup(result: dict[str, Any], path: str) -> Any:
+    value: Any = result
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+def _change(value: float, expected: float) -> float:
+    return round(abs(value - expected) / expected * 100, 1)
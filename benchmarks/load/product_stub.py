@@ -0,0 +1,69 @@
+"""
+Minimal in-process stand-in for service-product.
+
+It answers `POST /api/v1/products/lookup` like service-product does, for product ids
+1..`product_count`, so service-order can create and price orders without the real service.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class ProductStub:
+    """
+    Threaded HTTP server emulating the product lookup endpoint.
+
+    Attributes:
+        product_count (int): Products 1..product_count exist; every other id is unknown.
+        url (str): Base URL of the running stub.
+        lookups (list[list[int]]): Ids of every lookup received, in order.
+        delay (float): Seconds waited before answering, to emulate a slow service.
+        status (int): Status code answered; anything but 200 comes with an empty body.
+    """
+    def __init__(self, product_count: int, host: str = "127.0.0.1"):
+        self.product_count = product_count
+        self.lookups: list[list[int]] = []
+        self.delay = 0.0
+        self.status = 200
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                ids = json.loads(self.rfile.read(length) or b"{}").get("ids", [])
+                stub.lookups.append(ids)
+                if stub.delay:
+                    time.sleep(stub.delay)
+                products = [
+                    {"id": product_id, "name": f"product {product_id}", "description": "stub", "price": stub.price(product_id)}
+                    for product_id in ids if 0 < product_id <= stub.product_count
+                ]
+                body = json.dumps(products).encode() if stub.status == 200 else b""
+
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer((host, 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @staticmethod
+    def price(product_id: int) -> float:
+        return round(5 + (product_id % 50) * 0.75, 2)
+
+    def start(self) -> "ProductStub":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
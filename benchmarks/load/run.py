@@ -0,0 +1,213 @@
+"""
+Load-test harness for service-order and service-product.
+
+Each service is built with `create_app()` (testing configuration) against a seeded database
+stand-in, then every scenario is driven at fixed concurrency levels through the Flask test
+client, one client per worker thread. service-order's calls to service-product are answered
+by an in-process stub (`product_stub.py`), so only the service under test is measured.
+
+Usage (from the repository root):
+
+    python -m benchmarks.load.run --rows 10k --concurrency 1,8,32 --out load.json
+    python -m benchmarks.load.run --service order --rows 1M --database-url sqlite:////tmp/orders.db
+    python -m benchmarks.load.run --compare load.json --tolerance 0.15
+
+With `--compare`, the run exits with status 1 when the throughput or the p95/p99 latency of
+any case regressed beyond the tolerance against the baseline report.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from benchmarks.common import (
+    build_report, compare, latency_summary, load_report, run_in_subprocess, strip_options, write_report
+)
+
+SUITE = "load"
+SERVICES = ("order", "product")
+HIGHER_IS_BETTER = ("throughput_rps",)
+LOWER_IS_BETTER = ("latency_ms.p95", "latency_ms.p99")
+
+def parse_count(value: str) -> int:
+    """Parse a row count such as '10000', '10k' or '1M'."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    suffix = value[-1].lower()
+    if suffix in multipliers:
+        return int(float(value[:-1]) * multipliers[suffix])
+    return int(value)
+
+def parse_override(value: str) -> tuple[str, Any]:
+    """Parse a `KEY=VALUE` configuration override; the value is read as JSON when possible."""
+    key, _, raw = value.partition("=")
+    if not key or not _:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got '{value}'")
+    try:
+        return key, json.loads(raw)
+    except json.JSONDecodeError:
+        return key, raw
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--service", choices=(*SERVICES, "all"), default="all")
+    parser.add_argument("--rows", type=parse_count, default=parse_count("10k"), help="Rows seeded in the service table (e.g. 10k, 1M)")
+    parser.add_argument("--products", type=int, default=100, help="Distinct products referenced by the seeded orders")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma separated worker counts")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario and concurrency level")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests before each scenario")
+    parser.add_argument("--scenarios", help="Comma separated subset of scenarios to run")
+    parser.add_argument("--database-url", help="Database to seed; defaults to a SQLite file in a temporary directory")
+    parser.add_argument("--set", dest="overrides", type=parse_override, action="append", default=[], help="Configuration override KEY=VALUE")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed of the request generators")
+    parser.add_argument("--out", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative regression (0.1 = 10%%)")
+    return parser
+
+def run_scenario(app: Any, scenario: Any, concurrency: int, total: int, seed: int) -> dict[str, Any]:
+    """
+    Send `total` requests of a scenario split across `concurrency` worker threads.
+
+    Args:
+        app (Flask): The application under test.
+        scenario (Scenario): The scenario to drive.
+        concurrency (int): Number of worker threads.
+        total (int): Number of requests to send.
+        seed (int): Seed of the per-worker random generators.
+
+    Returns:
+        dict[str, Any]: Request and error counts, throughput and latency percentiles.
+    """
+    per_worker = [total // concurrency + (1 if i < total % concurrency else 0) for i in range(concurrency)]
+
+    def worker(index: int) -> tuple[list[float], int]:
+        rng = random.Random(seed + index)
+        client = app.test_client()
+        latencies, errors = [], 0
+        for _ in range(per_worker[index]):
+            method, url, body = scenario.make_request(rng)
+            start = time.perf_counter()
+            response = client.open(url, method=method, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            response.close()
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for worker_latencies, _ in outcomes for latency in worker_latencies]
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in outcomes),
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": latency_summary(latencies)
+    }
+
+def run_service(service: str, args: argparse.Namespace, workdir: str) -> list[dict[str, Any]]:
+    """
+    Build, seed and load-test one service in the current process.
+
+    Returns:
+        list[dict[str, Any]]: One result per scenario and concurrency level.
+    """
+    # Relative paths of the services (logs directory) land in the scratch directory
+    os.chdir(workdir)
+
+    stub = None
+    if service == "order":
+        from benchmarks.load.product_stub import ProductStub
+        stub = ProductStub(args.products).start()
+        os.environ["PRODUCT_SERVICE_URL"] = stub.url
+
+    from benchmarks.load import services
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, service + '.db')}"
+    app = services.build_app(service, database_url, dict(args.overrides))
+
+    print(f"[{service}] seeding {args.rows} rows", file=sys.stderr)
+    started = time.perf_counter()
+    services.seed(service, app, args.rows, args.products)
+    print(f"[{service}] seeded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+    levels = [int(level) for level in args.concurrency.split(",")]
+    results = []
+
+    try:
+        for scenario in services.scenarios(service, args.rows, args.products):
+            if selected is not None and scenario.name not in selected:
+                continue
+
+            budget = scenario.max_requests
+            warmup = min(args.warmup, budget) if budget is not None else args.warmup
+            if warmup:
+                run_scenario(app, scenario, 1, warmup, args.seed)
+                if budget is not None:
+                    budget -= warmup
+
+            for concurrency in levels:
+                total = args.requests if budget is None else min(args.requests, budget)
+                if total <= 0:
+                    break
+                if budget is not None:
+                    budget -= total
+
+                result = run_scenario(app, scenario, concurrency, total, args.seed)
+                results.append({"key": f"{service}/{scenario.name}/c{concurrency}", "service": service,
+                                "scenario": scenario.name, "concurrency": concurrency, **result})
+                print(f"[{service}] {scenario.name} c={concurrency}: {result['throughput_rps']} req/s, "
+                      f"p95 {result['latency_ms']['p95']} ms, {result['errors']} errors", file=sys.stderr)
+    finally:
+        if stub is not None:
+            stub.stop()
+
+    return results
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    # The services run from a scratch directory: resolve user paths first
+    args.out = os.path.abspath(args.out) if args.out else None
+    args.compare = os.path.abspath(args.compare) if args.compare else None
+
+    with tempfile.TemporaryDirectory(prefix="load-bench-") as workdir:
+        if args.service == "all":
+            # Both services ship a top-level `app` package: one process per service
+            child_argv = strip_options(argv, ("--service", "--out", "--compare", "--tolerance"))
+            results = [result for service in SERVICES for result in run_in_subprocess("benchmarks.load.run", service, child_argv, workdir)]
+        else:
+            results = run_service(args.service, args, workdir)
+
+    parameters = {
+        "service": args.service,
+        "rows": args.rows,
+        "products": args.products,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "database": (args.database_url or "sqlite").split(":", 1)[0],
+        "overrides": dict(args.overrides)
+    }
+    report = build_report(SUITE, parameters, results)
+    write_report(report, args.out)
+
+    if args.compare:
+        regressions = compare(report, load_report(args.compare), args.tolerance, HIGHER_IS_BETTER, LOWER_IS_BETTER)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
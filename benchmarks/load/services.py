@@ -0,0 +1,184 @@
+"""
+Builds each service against a local database stand-in and describes its load scenarios.
+
+Both services ship a top-level `app` package, so a process can only load one of them;
+`run.py` starts one process per service.
+"""
+import itertools
+import logging
+import os
+import random
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Optional
+
+from flask import Flask
+from sqlalchemy import insert, text
+
+from benchmarks.common import ROOT
+
+SERVICE_DIRS = {
+    "order": os.path.join(ROOT, "service-order"),
+    "product": os.path.join(ROOT, "service-product"),
+}
+SEED_CHUNK = 10000
+
+# A request factory returns (method, url, json body) for the next request
+RequestFactory = Callable[[random.Random], tuple[str, str, Optional[Any]]]
+
+@dataclass
+class Scenario:
+    """
+    One kind of request driven against a service.
+
+    Attributes:
+        name (str): Scenario name, used in the result keys.
+        make_request (RequestFactory): Builds the next request.
+        max_requests (Optional[int]): Upper bound on the requests of a run, for destructive scenarios.
+    """
+    name: str
+    make_request: RequestFactory
+    max_requests: Optional[int] = None
+
+def build_app(service: str, database_url: str, overrides: dict[str, Any]) -> Flask:
+    """
+    Create the service application with its testing configuration pointed at `database_url`.
+
+    Args:
+        service (str): 'order' or 'product'.
+        database_url (str): SQLAlchemy URL of the database stand-in.
+        overrides (dict[str, Any]): Configuration values overriding the testing configuration.
+
+    Returns:
+        Flask: The application, with its tables created.
+    """
+    sys.path.insert(0, SERVICE_DIRS[service])
+    os.environ["APP_SETTINGS"] = "testing"
+    os.environ["TEST_DATABASE_URL"] = database_url
+
+    import config
+    for key, value in overrides.items():
+        setattr(config.TestingConfig, key, value)
+
+    from app import create_app
+    app = create_app()
+    logging.getLogger(app.name).setLevel(logging.WARNING)
+
+    db = _db(service)
+    with app.app_context():
+        db.create_all()
+        if db.engine.dialect.name == "sqlite":
+            with db.engine.connect() as conn:
+                conn.execute(text("PRAGMA journal_mode=WAL"))
+    return app
+
+def seed(service: str, app: Flask, rows: int, products: int) -> None:
+    """
+    Fill the service table with `rows` synthetic rows, in chunks of bulk inserts.
+
+    Args:
+        service (str): 'order' or 'product'.
+        app (Flask): The application returned by `build_app`.
+        rows (int): Number of rows to insert.
+        products (int): Number of distinct products referenced by the orders.
+    """
+    db = _db(service)
+    if service == "order":
+        from app.models.model import Order as model
+        make_row = _order_row(products)
+    else:
+        from app.models.model import Products as model
+        make_row = _product_row
+
+    with app.app_context():
+        for start in range(0, rows, SEED_CHUNK):
+            chunk = [make_row(i) for i in range(start, min(start + SEED_CHUNK, rows))]
+            db.session.execute(insert(model), chunk)
+            db.session.commit()
+
+        # The bulk inserts bypass the repository: derive the order statistics and the search
+        # index from the seeded rows
+        if service == "order" and "order_stats" in app.extensions:
+            app.extensions["order_stats"].rebuild()
+        if service == "order" and "order_search" in app.extensions:
+            app.extensions["order_search"].build()
+
+def scenarios(service: str, rows: int, products: int) -> list[Scenario]:
+    """
+    Describe the requests driven against a service seeded with `rows` rows.
+
+    service-product only exposes reads, so it has no write scenarios.
+
+    Args:
+        service (str): 'order' or 'product'.
+        rows (int): Number of seeded rows.
+        products (int): Number of distinct products.
+
+    Returns:
+        list[Scenario]: The scenarios, destructive ones last.
+    """
+    if service == "product":
+        return [
+            Scenario("list", lambda rng: ("GET", f"/api/v1/products?offset={rng.randrange(max(rows - 50, 1))}&limit=50", None)),
+            Scenario("lookup", lambda rng: ("GET", "/api/v1/products?ids=" + ",".join(str(rng.randint(1, rows)) for _ in range(20)), None)),
+        ]
+
+    from app.utils.pagination import encode_cursor
+
+    # Deleted ids are handed out once, from the highest id down
+    delete_ids = itertools.count(rows, -1)
+
+    def new_order(rng: random.Random) -> dict[str, Any]:
+        return {
+            "customer_name": f"Load Customer {rng.randrange(1_000_000)}",
+            "customer_phone": "600000000",
+            "customer_email": "load@example.com",
+            "id_product": rng.randint(1, products),
+            "delivery_date": (date.today() + timedelta(days=rng.randint(1, 60))).isoformat(),
+        }
+
+    return [
+        Scenario("list", lambda rng: ("GET", f"/api/v1/orders?limit=100&after={encode_cursor('id', {'id': rng.randrange(rows)})}", None)),
+        Scenario("list_filtered", lambda rng: (
+            "GET", f"/api/v1/orders?limit=50&sort=-delivery_date&status={rng.choice(('pending', 'recived', 'ready'))}"
+                   f"&id_product={rng.randint(1, products)}", None)),
+        Scenario("detail", lambda rng: ("GET", f"/api/v1/orders/{rng.randint(1, rows)}", None)),
+        Scenario("search", lambda rng: ("GET", f"/api/v1/orders/search?q=mer {rng.randrange(rows)}&limit=20", None)),
+        Scenario("stats", lambda rng: ("GET", f"/api/v1/orders/stats?dimension={rng.choice(('day', 'status', 'product'))}", None)),
+        Scenario("changes", lambda rng: ("GET", "/api/v1/orders/changes?since=0&limit=100", None)),
+        Scenario("post", lambda rng: ("POST", "/api/v1/orders", new_order(rng))),
+        Scenario("put", lambda rng: ("PUT", f"/api/v1/orders/{rng.randint(1, rows)}", {"customer_name": f"Updated {rng.randrange(1000)}"})),
+        Scenario("delete", lambda rng: ("DELETE", f"/api/v1/orders/{next(delete_ids)}", None), max_requests=rows),
+    ]
+
+def _db(service: str) -> Any:
+    if service == "order":
+        from app.extensions import db
+    else:
+        from app import db
+    return db
+
+def _order_row(products: int) -> Callable[[int], dict[str, Any]]:
+    start = date.today() + timedelta(days=1)
+
+    def make_row(i: int) -> dict[str, Any]:
+        product_id = i % products + 1
+        return {
+            "customer_name": f"Customer {i}",
+            "customer_phone": f"6{i:08d}"[:15],
+            "customer_email": f"customer{i}@example.com",
+            "id_product": product_id,
+            "delivery_date": start + timedelta(days=i % 365),
+            "status": ("pending", "recived", "ready")[i % 3],
+            "total_amount": round(5 + (product_id % 50) * 0.75, 2),
+        }
+    return make_row
+
+def _product_row(i: int) -> dict[str, Any]:
+    return {
+        "name": f"Product {i}",
+        "description": f"Synthetic product number {i}",
+        "price": round(5 + (i % 50) * 0.75, 2),
+        "created_at": date(2024, 1, 1) + timedelta(days=i % 365),
+    }
@@ -0,0 +1,27 @@
+"""
+Micro-benchmark cases for the functions that run on every request.
+
+Each service module (`order_cases`, `product_cases`) returns a list of `Case` built against the
+real application, so changes to the application setup (JSON provider, error handlers, ...) are
+reflected in the timings.
+"""
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager
+
+@dataclass
+class Case:
+    """
+    One function measured in isolation.
+
+    Attributes:
+        name (str): Case name, used in the result keys.
+        fn (Callable[[], Any]): The call being measured, with its arguments already bound.
+        context (Callable[[], ContextManager[Any]]): Context (application or request) the calls run in;
+            it is entered once around the whole measurement, so its cost is not timed.
+        size (int): Number of items processed per call (rows, fields, ...), for per-item figures.
+    """
+    name: str
+    fn: Callable[[], Any]
+    context: Callable[[], ContextManager[Any]] = field(default=contextlib.nullcontext)
+    size: int = 1
@@ -0,0 +1,81 @@
+"""Micro-benchmark cases of service-order."""
+from datetime import date, timedelta
+from typing import Any
+
+from flask import Flask
+from sqlalchemy import select
+
+from benchmarks.micro.cases import Case
+
+def build_cases(app: Flask, page_size: int) -> list[Case]:
+    """
+    Build the service-order cases.
+
+    Args:
+        app (Flask): The application, with at least `page_size` seeded orders.
+        page_size (int): Rows per page for the list conversions and responses.
+
+    Returns:
+        list[Case]: The cases.
+    """
+    from pydantic import ValidationError
+
+    from app.exceptions.api_exceptions import OrderNotFoundError
+    from app.exceptions.database_exceptions import QueryError
+    from app.exceptions.pydantic_exceptions import PydanticValidationError
+    from app.extensions import db
+    from app.models.model import Order
+    from app.resources.error_handler import handle_http_exception
+    from app.resources.succes_response import wrap_success_response
+    from app.schema.schema_order import SchemaOrderId, SchemaOrderPost
+    from app.utils.utils import result_to_dicts, str_to_object_date
+
+    with app.app_context():
+        rows = db.session.execute(select(Order).order_by(Order.id).limit(page_size)).scalars().all()
+        mappings = db.session.execute(select(Order.__table__).order_by(Order.id).limit(page_size)).mappings().all()
+        frozen = db.session.execute(select(Order.__table__).order_by(Order.id).limit(page_size)).freeze()
+        order = rows[0]
+        db.session.expunge_all()
+
+    page = [row.to_dict() for row in rows]
+
+    payload = {
+        "customer_name": "  Jane Customer  ",
+        "customer_phone": "600123456",
+        "customer_email": "jane.customer@example.com",
+        "id_product": 7,
+        "delivery_date": (date.today() + timedelta(days=10)).isoformat(),
+    }
+    invalid = {**payload, "customer_email": "not-an-email", "id_product": 0}
+    try:
+        SchemaOrderPost(**invalid)
+    except ValidationError as e:
+        validation_error = PydanticValidationError(e)
+
+    @wrap_success_response("Orders retrieved")
+    def list_view() -> list[dict[str, Any]]:
+        return page
+
+    @wrap_success_response("Order retrieved", etag=lambda order_id: f"order-{order_id}-v1")
+    def detail_view(order_id: int) -> dict[str, Any]:
+        return page[0]
+
+    def get_request(path: str) -> Any:
+        return lambda: app.test_request_context(path, method="GET")
+
+    return [
+        Case("order_to_dict", order.to_dict, app.app_context),
+        Case("result_to_dicts", lambda: result_to_dicts(frozen()), size=len(mappings)),
+        # Serialization of a page through the installed JSON provider, as rows or as row mappings
+        Case("json_dumps_rows", lambda: app.json.dumps(result_to_dicts(frozen())), size=len(mappings)),
+        Case("json_dumps_mappings", lambda: app.json.dumps(mappings), size=len(mappings)),
+        Case("str_to_object_date", lambda: str_to_object_date("2031-07-15")),
+        Case("wrap_success_response_list", list_view, get_request("/api/v1/orders"), size=len(page)),
+        Case("wrap_success_response_detail", lambda: detail_view(order_id=1), get_request("/api/v1/orders/1")),
+        Case("handle_http_exception_api_error", lambda: handle_http_exception(OrderNotFoundError("Order not found")), app.app_context),
+        Case("handle_http_exception_database_error", lambda: handle_http_exception(QueryError()), app.app_context),
+        Case("handle_http_exception_validation", lambda: handle_http_exception(validation_error), app.app_context),
+        Case("handle_http_exception_unexpected", lambda: handle_http_exception(RuntimeError("boom")), app.app_context),
+        Case("schema_order_post", lambda: SchemaOrderPost(**payload)),
+        Case("schema_order_id", lambda: SchemaOrderId(order_id=42)),
+    ]
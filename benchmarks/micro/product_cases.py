@@ -0,0 +1,46 @@
+"""Micro-benchmark cases of service-product."""
+import logging
+from typing import Any
+
+from flask import Flask
+
+from benchmarks.micro.cases import Case
+
+class _FixedProductService:
+    """Product service answering from memory, so only the endpoint's own work is measured."""
+
+    def __init__(self, products: list[dict[str, Any]]):
+        self.products = products
+
+    def get_products_etag(self, offset: int, limit: int) -> str:
+        return f"products-{offset}-{limit}"
+
+    def get_product(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        return self.products[:limit]
+
+def build_cases(app: Flask, page_size: int) -> list[Case]:
+    """
+    Build the service-product cases.
+
+    Args:
+        app (Flask): The application.
+        page_size (int): Products returned by the listing endpoint.
+
+    Returns:
+        list[Case]: The cases.
+    """
+    from app.resources.resource import EndpointProduct
+
+    products = [
+        {"id": i, "name": f"Product {i}", "description": f"Synthetic product number {i}", "price": 9.5}
+        for i in range(1, page_size + 1)
+    ]
+    logger = logging.getLogger("benchmarks.micro.product")
+    logger.disabled = True
+    endpoint = EndpointProduct(_FixedProductService(products), logger)
+    query = f"/api/v1/products?offset=20&limit={page_size}"
+
+    return [
+        # Argument parsing plus the response of GET /products, with the data access stubbed out
+        Case("endpoint_product_get", endpoint.get, lambda: app.test_request_context(query), size=page_size),
+    ]
@@ -0,0 +1,132 @@
+"""
+Micro-benchmarks of the functions that run on every request.
+
+Each case (see `order_cases.py` and `product_cases.py`) calls one function in isolation with a
+realistic payload, inside the application or request context it needs. The timings use
+`timeit`: the number of calls per sample is calibrated with `autorange`, and the report keeps
+the best and the median time per call over `--repeat` samples.
+
+Usage (from the repository root):
+
+    python -m benchmarks.micro.run --out micro.json
+    python -m benchmarks.micro.run --service order --cases order_to_dict,schema_order_post
+    python -m benchmarks.micro.run --compare micro.json --tolerance 0.2
+
+With `--compare`, the run exits with status 1 when the median time per call of any case
+regressed beyond the tolerance against the baseline report.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+from typing import Any
+
+from benchmarks.common import build_report, compare, load_report, run_in_subprocess, strip_options, write_report
+from benchmarks.micro.cases import Case
+
+SUITE = "micro"
+SERVICES = ("order", "product")
+LOWER_IS_BETTER = ("per_call_us.median",)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--service", choices=(*SERVICES, "all"), default="all")
+    parser.add_argument("--page-size", type=int, default=100, help="Rows per page in the list cases")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing samples per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum duration of a sample, in seconds")
+    parser.add_argument("--cases", help="Comma separated subset of cases to run")
+    parser.add_argument("--out", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative regression (0.1 = 10%%)")
+    return parser
+
+def time_case(case: Case, repeat: int, min_time: float) -> dict[str, Any]:
+    """
+    Time a case with `timeit`.
+
+    Args:
+        case (Case): The case to measure.
+        repeat (int): Number of samples.
+        min_time (float): Minimum duration of a sample, used to calibrate the calls per sample.
+
+    Returns:
+        dict[str, Any]: Calls per sample and the best/median time per call in microseconds.
+    """
+    timer = timeit.Timer(case.fn)
+    with case.context():
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        samples = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+    best, median = min(samples), statistics.median(samples)
+    return {
+        "calls_per_sample": number,
+        "size": case.size,
+        "per_call_us": {"min": round(best * 1e6, 3), "median": round(median * 1e6, 3)},
+        "per_item_us": round(median * 1e6 / case.size, 3),
+        "calls_per_second": round(1 / median, 1)
+    }
+
+def run_service(service: str, args: argparse.Namespace, workdir: str) -> list[dict[str, Any]]:
+    """
+    Build one service in the current process and time its cases.
+
+    Returns:
+        list[dict[str, Any]]: One result per case.
+    """
+    os.chdir(workdir)
+
+    from benchmarks.load import services
+
+    app = services.build_app(service, f"sqlite:///{os.path.join(workdir, service + '.db')}", {})
+    if service == "order":
+        from benchmarks.micro.order_cases import build_cases
+        services.seed(service, app, args.page_size, products=10)
+    else:
+        from benchmarks.micro.product_cases import build_cases
+
+    selected = set(args.cases.split(",")) if args.cases else None
+    results = []
+    for case in build_cases(app, args.page_size):
+        if selected is not None and case.name not in selected:
+            continue
+
+        result = time_case(case, args.repeat, args.min_time)
+        results.append({"key": f"{service}/{case.name}", "service": service, "case": case.name, **result})
+        print(f"[{service}] {case.name}: {result['per_call_us']['median']} us/call", file=sys.stderr)
+    return results
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    # The services run from a scratch directory: resolve user paths first
+    args.out = os.path.abspath(args.out) if args.out else None
+    args.compare = os.path.abspath(args.compare) if args.compare else None
+
+    with tempfile.TemporaryDirectory(prefix="micro-bench-") as workdir:
+        if args.service == "all":
+            child_argv = strip_options(argv, ("--service", "--out", "--compare", "--tolerance"))
+            results = [
+                result for service in SERVICES
+                for result in run_in_subprocess("benchmarks.micro.run", service, child_argv, workdir)
+            ]
+        else:
+            results = run_service(args.service, args, workdir)
+
+    parameters = {"service": args.service, "page_size": args.page_size, "repeat": args.repeat, "min_time": args.min_time}
+    report = build_report(SUITE, parameters, results)
+    write_report(report, args.out)
+
+    if args.compare:
+        regressions = compare(report, load_report(args.compare), args.tolerance, (), LOWER_IS_BETTER)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
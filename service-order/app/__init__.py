@@ -1,15 +1,35 @@
 import os
 
+import click
 from flask import Flask
 
 from config import config
-from .extensions import db, migrate, api
+from .extensions import db, api, init_migrate
 from .exceptions.internal_exceptions import AppInitializationError, ComponentInitializationError, BlueprintRegistrationError
+from .cli import orders_cli
+from .compression import ResponseCompressor
+from .json_provider import init_json_provider
 from .logger import setup_logging
+from .metrics import init_metrics
+from .profiler import QueryProfiler
 from .resources.api_v1 import api_bp, register_resources
 from .repository.repository_order import RepositoryOrder
+from .repository.repository_order_stats import RepositoryOrderStats
+from .repository.repository_order_changes import RepositoryOrderChanges
+from .repository.repository_order_search import RepositoryOrderSearch, build_search_index
+from .repository.cached_repository_order import CachedRepositoryOrder
 from .services.ServiceOrder import ServiceOrder
 from .utils.initialization_component import InitializationComponent
+from .utils.cache import TTLCache
+from .utils.change_follower import ChangeFollower
+from .utils.ngram_index import NgramIndex
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.group_commit import GroupCommitter
+from .utils.pool import log_pool_stats_at_exit, warm_up_pool
+from .utils.replica_router import ReplicaRouter
+from .utils.startup import StartupTimings
+from .utils.warmup import warm_up_requests
+from .clients.product_client import ProductClient
 
 def create_app() -> Flask:
     """"    
@@ -18,21 +38,30 @@ def create_app() -> Flask:
     This function follows the factory application pattern. It performs the following steps:
     - Configures logging.
     - Loads the configuration according to the environment defined by the environment variable APP_SETTINGS.
-    - Initializes components such as the database and migrations.
+    - Initializes components such as the database and, under the `flask` command, migrations.
+    - Warms up the database connection pool and logs its statistics at shutdown.
+    - Builds the in-memory customer search index.
     - Registers the API resources and the main blueprint.
+    - Registers the `flask orders` maintenance commands.
+    - Warms up the request paths (statements, validators, serializer) before serving.
+
+    The duration of every phase is logged once startup is over and kept in
+    `app.extensions['startup_timings']`.
 
     Raises:
-        AppInitializationError: If the APP_SETTINGS variable is invalid.
+        AppInitializationError: If the APP_SETTINGS variable is invalid, or the orders do not fit in the search index.
         ComponentInitializationError: If any component (DB, migrations) fails to initialize.
         BlueprintRegistrationError: If an error occurs when registering API endpoints.
 
     Returns:
         Flask: The fully configured instance of the Flask application.
     """
+    timings = StartupTimings()
     app = Flask(__name__)
     
     # Set up logging
-    app_logger = setup_logging(app)
+    with timings.phase('Logging'):
+        app_logger = setup_logging(app)
 
     # Load the environment-specific configuration
     env = os.environ.get('APP_SETTINGS', 'development')
@@ -43,26 +72,142 @@ def create_app() -> Flask:
     # Load the configuration class based on the environment
     cfg_class = config[env]
     app.config.from_object(cfg_class)
+    init_json_provider(app)
     
+    migrations_enabled = app.config['MIGRATIONS_ENABLED']
+    if migrations_enabled is None:
+        # Migrations only run through the `flask db` commands, which load the app inside a click context
+        migrations_enabled = click.get_current_context(silent=True) is not None
+
     try:
-        InitializationComponent(app, init_fn=db.init_app, name='Database')
-        InitializationComponent(app, db, init_fn=migrate.init_app, name='Migrate')
+        InitializationComponent(app, init_fn=db.init_app, name='Database', timings=timings)
+        if migrations_enabled:
+            InitializationComponent(app, db, init_fn=init_migrate, name='Migrate', timings=timings)
         app_logger.info("Components initialized successfully.")
     except ComponentInitializationError as cie:
         app_logger.critical("Failed to initialize application components: %s", cie)
         raise 
 
-    from .models.model import Order
+    if app.config['METRICS_ENABLED']:
+        with timings.phase('Metrics'):
+            init_metrics(app, db)
+
+    if app.config['SQL_PROFILER_ENABLED']:
+        QueryProfiler(
+            slow_query_ms=app.config['SQL_SLOW_QUERY_MS'],
+            n_plus_one_threshold=app.config['SQL_N_PLUS_ONE_THRESHOLD'],
+            add_headers=app.config['SQL_PROFILER_HEADERS']
+        ).init_app(app, db)
+        app_logger.info("SQL query profiler enabled.")
+
+    if app.config['COMPRESSION_ENABLED']:
+        compressor = ResponseCompressor.from_app(app)
+        compressor.init_app(app)
+        app_logger.info("Response compression enabled: %s.", ", ".join(compressor.codecs))
+
+    if app.config['DB_POOL_WARMUP']:
+        with timings.phase('Pool warm-up'):
+            warm_up_pool(app, db, app_logger)
+    log_pool_stats_at_exit(app, db, app_logger)
+
+    from .models.model import Order, OrderStat, OrderChange
+
+    # Reads are spread over the read replicas, if any are configured
+    router = ReplicaRouter.from_app(app, db)
+    router.init_app(app)
+    stats_repository = None
+    if app.config['ORDER_STATS_ENABLED']:
+        # Summary statistics are updated in the same transaction as each order write
+        stats_repository = RepositoryOrderStats(db.session, OrderStat, Order, router)
+        app.extensions['order_stats'] = stats_repository
 
-    repository = RepositoryOrder(db.session, Order)
-    service = ServiceOrder(repository)
+    changes_repository = None
+    if app.config['ORDER_CHANGES_ENABLED']:
+        # Every order write is appended to the change log in its own transaction
+        changes_repository = RepositoryOrderChanges(db.session, OrderChange, Order, router)
+        app.extensions['order_changes'] = changes_repository
+
+    search_repository = None
+    if app.config['ORDER_SEARCH_ENABLED'] and changes_repository is None:
+        app_logger.warning("Order search disabled: its index is kept up to date from the order change log.")
+    elif app.config['ORDER_SEARCH_ENABLED']:
+        search_repository = RepositoryOrderSearch(
+            db.session,
+            Order,
+            NgramIndex(max_bytes=app.config['ORDER_SEARCH_MAX_MEMORY_MB'] * 1024 * 1024),
+            ChangeFollower(changes_repository, gap_timeout=app.config['ORDER_CHANGES_GAP_TIMEOUT']),
+            router,
+            sync_interval=app.config['ORDER_SEARCH_SYNC_INTERVAL']
+        )
+        with timings.phase('Search index'):
+            build_search_index(app, search_repository, app_logger)
+        app.extensions['order_search'] = search_repository
+
+    repository = RepositoryOrder(db.session, Order, router, stats_repository, search_repository, changes_repository)
+    if app.config['ORDER_GROUP_COMMIT_ENABLED']:
+        # Concurrent order creations are inserted together, one transaction per batch
+        repository.group_commit = GroupCommitter(
+            app,
+            repository.add_orders,
+            max_rows=app.config['ORDER_GROUP_COMMIT_MAX_ROWS'],
+            max_delay=app.config['ORDER_GROUP_COMMIT_MAX_DELAY_MS'] / 1000,
+            flush_timeout=app.config['ORDER_GROUP_COMMIT_FLUSH_TIMEOUT'],
+            on_failure=app.config['ORDER_GROUP_COMMIT_ON_FAILURE'],
+            logger=app_logger.getChild('group_commit')
+        )
+    if app.config['STARTUP_WARMUP']:
+        with timings.phase('Warm-up'):
+            warm_up_requests(app, repository, stats_repository, app_logger)
+
+    if app.config['ORDER_CACHE_ENABLED'] and changes_repository is None:
+        app_logger.warning("Order cache disabled: it needs the order change log to see the writes of the other workers.")
+    elif app.config['ORDER_CACHE_ENABLED']:
+        # Serve hot order lookups from memory; writes, from any worker, invalidate the affected entry
+        order_cache = TTLCache(app.config['ORDER_CACHE_MAX_SIZE'], app.config['ORDER_CACHE_TTL'])
+        repository = CachedRepositoryOrder(
+            repository,
+            order_cache,
+            ChangeFollower(changes_repository, gap_timeout=app.config['ORDER_CHANGES_GAP_TIMEOUT']),
+            sync_interval=app.config['ORDER_CACHE_SYNC_INTERVAL']
+        )
+        app.extensions['order_cache'] = order_cache
+
+    product_client = ProductClient(
+        app.config['PRODUCT_SERVICE_URL'],
+        TTLCache(app.config['PRODUCT_CACHE_MAX_SIZE'], app.config['PRODUCT_CACHE_TTL']),
+        CircuitBreaker(app.config['PRODUCT_BREAKER_FAILURE_THRESHOLD'], app.config['PRODUCT_BREAKER_RESET_TIMEOUT']),
+        timeout=(app.config['PRODUCT_CLIENT_CONNECT_TIMEOUT'], app.config['PRODUCT_CLIENT_READ_TIMEOUT']),
+        pool_size=app.config['PRODUCT_CLIENT_POOL_SIZE'],
+        batch_size=app.config['PRODUCT_CLIENT_BATCH_SIZE']
+    )
+
+    service = ServiceOrder(
+        repository,
+        product_client,
+        default_page_size=app.config['ORDERS_PAGE_DEFAULT_LIMIT'],
+        max_page_size=app.config['ORDERS_PAGE_MAX_LIMIT'],
+        stream_chunk_size=app.config['ORDERS_STREAM_CHUNK_SIZE'],
+        max_batch_size=app.config['ORDERS_BATCH_MAX_SIZE'],
+        stats_repository=stats_repository,
+        search_repository=search_repository,
+        changes_repository=changes_repository,
+        changes_default_limit=app.config['ORDER_CHANGES_DEFAULT_LIMIT'],
+        changes_max_limit=app.config['ORDER_CHANGES_MAX_LIMIT'],
+        changes_gap_timeout=app.config['ORDER_CHANGES_GAP_TIMEOUT']
+    )
 
     try:
-        register_resources(api, service)
-        app.register_blueprint(api_bp, url_prefix='/api/v1')
+        with timings.phase('Resources'):
+            register_resources(api, service)
+            app.register_blueprint(api_bp, url_prefix='/api/v1')
         app_logger.info("API blueprint registered successfully.")
     except Exception as e:
         app_logger.critical("Failed to register API blueprint: %s", e)
         raise BlueprintRegistrationError(f"Failed to register API blueprint: {e}")
+
+    app.cli.add_command(orders_cli)
+
+    app.extensions['startup_timings'] = timings
+    timings.report(app_logger)
     
     return app
\ No newline at end of file
@@ -0,0 +1,102 @@
+import os
+
+from quart import Quart
+
+from config import config
+from .exceptions.internal_exceptions import AppInitializationError, BlueprintRegistrationError
+from .json_provider import init_json_provider
+from .logger import setup_logging
+from .resources.async_api import create_async_api_blueprint, handle_async_exception
+from .repository.async_repository_order import AsyncRepositoryOrder
+from .repository.async_repository_order_stats import AsyncRepositoryOrderStats
+from .repository.async_repository_order_changes import AsyncRepositoryOrderChanges
+from .services.async_service_order import AsyncServiceOrder
+from .utils.async_db import init_async_db
+from .utils.cache import TTLCache
+from .utils.circuit_breaker import CircuitBreaker
+from .clients.async_product_client import AsyncProductClient
+
+def create_asgi_app() -> Quart:
+    """
+    Create and initialize the async (ASGI) application, served by an ASGI server such as Hypercorn.
+
+    It serves the same `/api/v1/orders` API as `create_app`, from the same configuration
+    (APP_SETTINGS) and database, with an async SQLAlchemy engine and an async client of
+    service-product: a request waiting on I/O does not hold a worker thread, and the number of
+    database and service-product connections stays bounded by their pool sizes.
+
+    The order cache, the customer search index, the metrics and the SQL profiler are only
+    available in the synchronous application.
+
+    Raises:
+        AppInitializationError: If the APP_SETTINGS variable is invalid.
+        BlueprintRegistrationError: If an error occurs when registering API endpoints.
+
+    Returns:
+        Quart: The fully configured instance of the Quart application.
+    """
+    # Same application name as the Flask application, so the same logger is configured
+    app = Quart(__package__)
+
+    # Set up logging
+    app_logger = setup_logging(app)
+
+    # Load the environment-specific configuration
+    env = os.environ.get('APP_SETTINGS', 'development')
+    if env not in config:
+        app_logger.critical("Invalid APP_SETTINGS: %s. Valid options are: %s", env, list(config.keys()))
+        raise AppInitializationError(f"Invalid APP_SETTINGS: {env}. Valid options are: {list(config.keys())}")
+
+    app.config.from_object(config[env])
+    init_json_provider(app)
+
+    session_factory = init_async_db(app, app_logger)
+
+    from .models.model import Order, OrderStat, OrderChange
+
+    stats_repository = None
+    if app.config['ORDER_STATS_ENABLED']:
+        # Summary statistics are updated in the same transaction as each order write
+        stats_repository = AsyncRepositoryOrderStats(session_factory, OrderStat, Order)
+
+    changes_repository = None
+    if app.config['ORDER_CHANGES_ENABLED']:
+        # Every order write is appended to the change log in its own transaction
+        changes_repository = AsyncRepositoryOrderChanges(session_factory, OrderChange, Order)
+
+    product_client = AsyncProductClient(
+        app.config['PRODUCT_SERVICE_URL'],
+        TTLCache(app.config['PRODUCT_CACHE_MAX_SIZE'], app.config['PRODUCT_CACHE_TTL']),
+        CircuitBreaker(app.config['PRODUCT_BREAKER_FAILURE_THRESHOLD'], app.config['PRODUCT_BREAKER_RESET_TIMEOUT']),
+        timeout=(app.config['PRODUCT_CLIENT_CONNECT_TIMEOUT'], app.config['PRODUCT_CLIENT_READ_TIMEOUT']),
+        pool_size=app.config['PRODUCT_CLIENT_POOL_SIZE'],
+        batch_size=app.config['PRODUCT_CLIENT_BATCH_SIZE']
+    )
+
+    @app.after_serving
+    async def close_product_client() -> None:
+        await product_client.aclose()
+
+    service = AsyncServiceOrder(
+        AsyncRepositoryOrder(session_factory, Order, stats_repository, changes_repository),
+        product_client,
+        default_page_size=app.config['ORDERS_PAGE_DEFAULT_LIMIT'],
+        max_page_size=app.config['ORDERS_PAGE_MAX_LIMIT'],
+        stream_chunk_size=app.config['ORDERS_STREAM_CHUNK_SIZE'],
+        max_batch_size=app.config['ORDERS_BATCH_MAX_SIZE'],
+        stats_repository=stats_repository,
+        changes_repository=changes_repository,
+        changes_default_limit=app.config['ORDER_CHANGES_DEFAULT_LIMIT'],
+        changes_max_limit=app.config['ORDER_CHANGES_MAX_LIMIT'],
+        changes_gap_timeout=app.config['ORDER_CHANGES_GAP_TIMEOUT']
+    )
+
+    try:
+        app.register_blueprint(create_async_api_blueprint(service), url_prefix='/api/v1')
+        app.register_error_handler(Exception, handle_async_exception)
+        app_logger.info("Async API blueprint registered successfully.")
+    except Exception as e:
+        app_logger.critical("Failed to register async API blueprint: %s", e)
+        raise BlueprintRegistrationError(f"Failed to register async API blueprint: {e}")
+
+    return app
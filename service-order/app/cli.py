@@ -0,0 +1,53 @@
+"""
+Maintenance commands of service-order, available as `flask orders <command>`.
+"""
+from datetime import timedelta
+from typing import Optional
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.utils.utils import utc_now
+
+orders_cli = AppGroup('orders', help='Order maintenance commands.')
+
+@orders_cli.command('rebuild-stats')
+def rebuild_stats() -> None:
+    """
+    Recompute the order summary statistics from the orders table.
+
+    Use it after enabling the statistics on an existing database, or to repair them. Writes
+    committed while it runs may be miscounted, so run it while the service is idle.
+    """
+    stats_repository = current_app.extensions.get('order_stats')
+    if stats_repository is None:
+        raise click.ClickException('Order statistics are disabled (ORDER_STATS_ENABLED).')
+
+    rows = stats_repository.rebuild()
+    click.echo(f'Rebuilt {rows} order statistics rows.')
+
+@orders_cli.command('compact-changes')
+@click.option('--retention-days', type=click.IntRange(min=0), default=None,
+              help='Delete the changes older than this many days (default: ORDER_CHANGES_RETENTION_DAYS).')
+@click.option('--batch-size', type=click.IntRange(min=1), default=1000, show_default=True,
+              help='Number of changes deleted per transaction.')
+def compact_changes(retention_days: Optional[int], batch_size: int) -> None:
+    """
+    Bound the order change log: purge the changes older than the retention period, then drop
+    the changes superseded by a newer change of the same order.
+
+    Consumers whose last sequence number falls before the retained log get `410 Gone` from the
+    change feed and must resynchronize. Safe to run while the service is serving; schedule it
+    (e.g. daily with cron).
+    """
+    changes_repository = current_app.extensions.get('order_changes')
+    if changes_repository is None:
+        raise click.ClickException('The order change feed is disabled (ORDER_CHANGES_ENABLED).')
+
+    if retention_days is None:
+        retention_days = current_app.config['ORDER_CHANGES_RETENTION_DAYS']
+
+    purged = changes_repository.purge(utc_now() - timedelta(days=retention_days), batch_size)
+    compacted = changes_repository.compact(batch_size)
+    click.echo(f'Purged {purged} order changes older than {retention_days} days and compacted {compacted}.')
@@ -0,0 +1,94 @@
+import logging
+from typing import Any, Iterable
+
+import httpx
+
+from app.clients.product_client import BaseProductClient
+from app.exceptions.client_exceptions import CircuitOpenError, ProductServiceError
+from app.interfaces.interfaces_cache import ICache
+from app.utils.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+class AsyncProductClient(BaseProductClient):
+    """
+    Asynchronous HTTP client of service-product, used by the async (ASGI) mode.
+
+    Same behavior as `ProductClient` (batched lookups, timeouts, circuit breaker, product cache),
+    on an `httpx.AsyncClient`: a request waiting on service-product does not hold a thread, and
+    at most `pool_size` connections to service-product are open at once.
+
+    Attributes:
+        base_url: Base URL of service-product (e.g. `http://localhost:5001`).
+        cache: Cache of resolved products by id. Unknown ids are cached as missing.
+        breaker: Circuit breaker protecting the remote calls.
+        timeout: `(connect, read)` timeouts in seconds.
+        batch_size: Maximum number of ids sent in a single lookup request.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        cache: ICache,
+        breaker: CircuitBreaker,
+        timeout: tuple[float, float] = (0.5, 2.0),
+        pool_size: int = 10,
+        batch_size: int = 200
+    ):
+        super().__init__(base_url, cache, breaker, timeout, batch_size)
+
+        connect_timeout, read_timeout = timeout
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    async def get_products(self, product_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """
+        Resolve products by id, from the cache when possible and from service-product otherwise.
+
+        Args:
+            product_ids (Iterable[int]): Ids of the products to resolve. Duplicates are ignored.
+
+        Returns:
+            dict[int, dict[str, Any]]: The existing products by id; unknown ids are left out.
+
+        Raises:
+            ProductServiceError: If service-product is unavailable or answers with an error.
+        """
+        products, pending = self._from_cache(product_ids)
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            self._remember(chunk, await self._lookup(chunk), products)
+
+        return products
+
+    async def _lookup(self, product_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        Fetch a batch of products from service-product through the circuit breaker.
+
+        Args:
+            product_ids (list[int]): Ids of the products to fetch.
+
+        Returns:
+            list[dict[str, Any]]: The products found.
+        """
+        async def request() -> list[dict[str, Any]]:
+            response = await self.client.post(self.LOOKUP_PATH, json={"ids": product_ids})
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            return self._parse_products(await self.breaker.call_async(request))
+
+        except CircuitOpenError as e:
+            logger.warning("Product service call skipped: %s", e)
+            raise ProductServiceError("Product service unavailable")
+
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            logger.error("Product service request failed: %s", e)
+            raise ProductServiceError("Product service unavailable")
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
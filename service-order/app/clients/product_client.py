@@ -0,0 +1,157 @@
+import logging
+from typing import Any, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.exceptions.client_exceptions import CircuitOpenError, ProductServiceError
+from app.interfaces.interfaces_cache import ICache
+from app.interfaces.interfaces_clients import IProductClient
+from app.utils.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+class BaseProductClient(IProductClient):
+    """
+    Product cache and lookup batching shared by the synchronous and the asynchronous clients.
+
+    Attributes:
+        base_url: Base URL of service-product (e.g. `http://localhost:5001`).
+        cache: Cache of resolved products by id. Unknown ids are cached as missing.
+        breaker: Circuit breaker protecting the remote calls.
+        timeout: `(connect, read)` timeouts in seconds.
+        batch_size: Maximum number of ids sent in a single lookup request.
+    """
+    LOOKUP_PATH = "/api/v1/products/lookup"
+    MISSING = {"exists": False}
+
+    def __init__(
+        self,
+        base_url: str,
+        cache: ICache,
+        breaker: CircuitBreaker,
+        timeout: tuple[float, float] = (0.5, 2.0),
+        batch_size: int = 200
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.breaker = breaker
+        self.timeout = timeout
+        self.batch_size = batch_size
+
+    def _from_cache(self, product_ids: Iterable[int]) -> tuple[dict[int, dict[str, Any]], list[int]]:
+        """
+        Split the requested ids into the products answered by the cache and the ids to fetch.
+
+        Returns:
+            tuple[dict[int, dict[str, Any]], list[int]]: Cached existing products by id, and the uncached ids.
+        """
+        products: dict[int, dict[str, Any]] = {}
+        pending = []
+
+        for product_id in dict.fromkeys(product_ids):
+            cached = self.cache.get(product_id)
+            if cached is None:
+                pending.append(product_id)
+            elif cached is not self.MISSING:
+                products[product_id] = cached
+
+        return products, pending
+
+    def _remember(self, chunk: list[int], found: list[dict[str, Any]], products: dict[int, dict[str, Any]]) -> None:
+        """Cache the outcome of a lookup, unknown ids included, and add the found products to `products`."""
+        found_by_id = {product["id"]: product for product in found}
+        for product_id in chunk:
+            product = found_by_id.get(product_id)
+            self.cache.set(product_id, product if product is not None else self.MISSING)
+            if product is not None:
+                products[product_id] = product
+
+    @staticmethod
+    def _parse_products(products: Any) -> list[dict[str, Any]]:
+        """Keep the id and price of the products returned by a lookup."""
+        return [{"id": product["id"], "price": product["price"]} for product in products]
+
+class ProductClient(BaseProductClient):
+    """
+    HTTP client of service-product, used to validate products and read their prices.
+
+    Products are resolved in batches through `POST /api/v1/products/lookup`. The client:
+    - Reuses keep-alive connections from a bounded pool (`requests.Session` + `HTTPAdapter`).
+    - Applies connect and read timeouts to every request.
+    - Goes through a circuit breaker, so an unavailable service-product fails fast.
+    - Caches the price and existence of every product it has resolved; cached products are
+      answered without any network call.
+
+    Attributes:
+        base_url: Base URL of service-product (e.g. `http://localhost:5001`).
+        cache: Cache of resolved products by id. Unknown ids are cached as missing.
+        breaker: Circuit breaker protecting the remote calls.
+        timeout: `(connect, read)` timeouts in seconds.
+        batch_size: Maximum number of ids sent in a single lookup request.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        cache: ICache,
+        breaker: CircuitBreaker,
+        timeout: tuple[float, float] = (0.5, 2.0),
+        pool_size: int = 10,
+        batch_size: int = 200
+    ):
+        super().__init__(base_url, cache, breaker, timeout, batch_size)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_products(self, product_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """
+        Resolve products by id, from the cache when possible and from service-product otherwise.
+
+        Args:
+            product_ids (Iterable[int]): Ids of the products to resolve. Duplicates are ignored.
+
+        Returns:
+            dict[int, dict[str, Any]]: The existing products by id; unknown ids are left out.
+
+        Raises:
+            ProductServiceError: If service-product is unavailable or answers with an error.
+        """
+        products, pending = self._from_cache(product_ids)
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            self._remember(chunk, self._lookup(chunk), products)
+
+        return products
+
+    def _lookup(self, product_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        Fetch a batch of products from service-product through the circuit breaker.
+
+        Args:
+            product_ids (list[int]): Ids of the products to fetch.
+
+        Returns:
+            list[dict[str, Any]]: The products found.
+        """
+        def request() -> list[dict[str, Any]]:
+            response = self.session.post(
+                f"{self.base_url}{self.LOOKUP_PATH}",
+                json={"ids": product_ids},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            return self._parse_products(self.breaker.call(request))
+
+        except CircuitOpenError as e:
+            logger.warning("Product service call skipped: %s", e)
+            raise ProductServiceError("Product service unavailable")
+
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            logger.error("Product service request failed: %s", e)
+            raise ProductServiceError("Product service unavailable")
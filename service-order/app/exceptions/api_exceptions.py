@@ -29,4 +29,13 @@ class BadRequestError(APIError):
     Inherits from APIError and sets a default HTTP status code of 400.
     """
     def __init__(self, message="Bad request"):
-        super().__init__(message, status_code=400)
\ No newline at end of file
+        super().__init__(message, status_code=400)
+
+class ChangesExpiredError(APIError):
+    """
+    Exception raised when a change feed consumer asks for changes older than the retained log.
+
+    Inherits from APIError and sets a default HTTP status code of 410.
+    """
+    def __init__(self, message="Changes are no longer available"):
+        super().__init__(message, status_code=410)
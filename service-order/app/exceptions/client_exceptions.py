@@ -0,0 +1,19 @@
+from .api_exceptions import APIError
+
+class CircuitOpenError(Exception):
+    """
+    Exception raised by a circuit breaker when it rejects a call because it is open.
+
+    The protected dependency failed repeatedly, so calls are short-circuited until
+    the reset timeout elapses.
+    """
+    pass
+
+class ProductServiceError(APIError):
+    """
+    Exception raised when service-product cannot be reached or returns an invalid response.
+
+    Inherits from APIError and sets a default HTTP status code of 503.
+    """
+    def __init__(self, message="Product service unavailable"):
+        super().__init__(message, status_code=503)
@@ -23,4 +23,12 @@ class BlueprintRegistrationError(Exception):
     For example, it may be due to a failed import, dependency error, or internal error
     during path registration.
     """
-    pass
\ No newline at end of file
+    pass
+
+class IndexMemoryError(Exception):
+    """
+    Exception thrown when an in-memory index would grow beyond its configured memory limit.
+
+    The index keeps its previous content; callers fall back to querying the database.
+    """
+    pass
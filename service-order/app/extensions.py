@@ -1,7 +1,17 @@
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_restful import Api
 
 db = SQLAlchemy()
-migrate = Migrate()
-api = Api()
\ No newline at end of file
+api = Api()
+
+def init_migrate(app: Flask, db: SQLAlchemy) -> None:
+    """
+    Register Flask-Migrate on the application.
+
+    Flask-Migrate is imported here rather than at module level: it pulls in Alembic (and its
+    template engine), which only the `flask db` commands need.
+    """
+    from flask_migrate import Migrate
+
+    Migrate(app, db)
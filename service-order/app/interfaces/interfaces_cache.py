@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Any, Hashable, Optional
+
+class ICache(ABC):
+    """
+    Interface for in-process key/value caches.
+
+    Defines the contract used by the cached repositories, so the cache implementation
+    (bounded LRU, no-op, external store...) can be swapped without touching them.
+    """
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def peek(self, key: Hashable) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+class IProductClient(ABC):
+    """
+    Interface for clients of service-product.
+
+    Defines the contract used by the order service to check that products exist
+    and to read their prices.
+    """
+    @abstractmethod
+    def get_products(self, product_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        pass
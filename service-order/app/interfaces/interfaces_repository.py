@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
+from typing import Any, Collection, Iterable, Mapping, Optional, Iterator, Sequence
 
 class IReadRepository(ABC):
     """
@@ -8,13 +9,23 @@ class IReadRepository(ABC):
     Defines the contract for retrieving order data from the persistence layer.
     """
     @abstractmethod
-    def get_all_orders(self) -> list[dict[str, Any]]:
+    def get_orders_page(
+        self, limit: int, after: Optional[tuple[Any, ...]] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def stream_orders(self, chunk_size: int = 1000) -> Iterator[dict[str, Any]]:
         pass
 
     @abstractmethod
     def get_order(self, order_id: int) -> dict[str, Any]:
         pass
 
+    @abstractmethod
+    def get_order_version(self, order_id: int) -> int:
+        pass
+
 class IWriteRepository(ABC):
     """
     Interface for write operations on the Order repository.
@@ -26,7 +37,11 @@ class IWriteRepository(ABC):
         pass
 
     @abstractmethod
-    def update_order(self, order_id: int, order_data: dict[str, Any]) -> bool:
+    def add_orders(self, orders_data: list[dict[str, Any]]) -> int:
+        pass
+
+    @abstractmethod
+    def update_order(self, order_id: int, order_data: dict[str, Any], locked_statuses: Sequence[str] = ()) -> bool:
         pass
 
 class IDeleteRepository(ABC):
@@ -46,4 +61,77 @@ class IOrderRepository(IReadRepository, IWriteRepository, IDeleteRepository):
     Inherits read, write, and delete capabilities to define the complete contract
     for interacting with Order entities in the persistence layer.
     """
-    pass
\ No newline at end of file
+    pass
+
+class IOrderStatsRepository(ABC):
+    """
+    Interface for the pre-aggregated order statistics.
+
+    Defines the contract for applying incremental changes, reading and rebuilding the
+    per-dimension order counts and revenue.
+    """
+    @abstractmethod
+    def apply(self, deltas: Mapping[tuple[str, str], tuple[int, float]]) -> None:
+        pass
+
+    @abstractmethod
+    def get_stats(self, dimension: str, key_from: Optional[str] = None, key_to: Optional[str] = None) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        pass
+
+class IOrderSearchRepository(ABC):
+    """
+    Interface for the substring search over the customers of the orders.
+
+    Defines the contract for building the search index, keeping it in sync with the order
+    writes and answering searches.
+    """
+    @abstractmethod
+    def build(self) -> int:
+        pass
+
+    @abstractmethod
+    def after_insert(self) -> None:
+        pass
+
+    @abstractmethod
+    def after_update(self, order_id: int, changes: Mapping[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def after_delete(self, order_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def search(self, text: str, limit: int) -> list[dict[str, Any]]:
+        pass
+
+class IOrderChangesRepository(ABC):
+    """
+    Interface for the append-only log of the order writes.
+
+    Defines the contract for recording the changes of every write, reading them incrementally
+    by sequence number and keeping the log bounded.
+    """
+    @abstractmethod
+    def record(self, operation: str, order_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def get_changes(self, since: Optional[int], limit: int) -> tuple[list[dict[str, Any]], Optional[int], Optional[int]]:
+        pass
+
+    @abstractmethod
+    def follow(self, after: int, missing: Collection[int], limit: int) -> list[tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def purge(self, before: datetime, batch_size: int = 1000) -> int:
+        pass
+
+    @abstractmethod
+    def compact(self, batch_size: int = 1000) -> int:
+        pass
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import date
+from typing import Any, Optional, Iterator
+
+from app.utils.pagination import ChangePage, Page
 
 class IReadOrder(ABC):
     """
@@ -8,13 +11,37 @@ class IReadOrder(ABC):
     Defines the contract for retrieving order data from the persistence layer.
     """
     @abstractmethod
-    def get_all_order(self) -> list[dict[str, Any]]:
+    def get_orders_page(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> Page:
+        pass
+
+    @abstractmethod
+    def stream_orders(self) -> Iterator[dict[str, Any]]:
         pass
 
     @abstractmethod
     def get_order(self, order_id: int) -> dict[str, Any]:
         pass
 
+    @abstractmethod
+    def get_order_etag(self, order_id: int) -> str:
+        pass
+
+    @abstractmethod
+    def search_orders(self, text: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def get_order_stats(
+        self, dimension: str, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def get_order_changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> ChangePage:
+        pass
+
 class IWriteOrder(ABC):
     """
     Interface for write operations on the Order repository.
@@ -25,6 +52,14 @@ class IWriteOrder(ABC):
     def add_Order(self, order_data:  dict[str, Any]) -> bool:
         pass
 
+    @abstractmethod
+    def check_batch_size(self, size: int) -> None:
+        pass
+
+    @abstractmethod
+    def add_orders(self, orders_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        pass
+
     @abstractmethod
     def update_order(self, order_id: int, order_data: dict[str, Any]) -> bool:
         pass
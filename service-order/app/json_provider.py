@@ -0,0 +1,105 @@
+"""
+JSON provider of the application.
+
+Every JSON body (`jsonify`, `current_app.json.dumps`) goes through the provider installed by
+`init_json_provider`, selected with the `JSON_PROVIDER` setting:
+- `orjson` (default): `OrjsonProvider`, which encodes with orjson in a single C pass and
+  writes the response bytes directly.
+- `default`: `DateJSONProvider`, Flask's standard library provider.
+
+Both write the same wire format: dates as `DD-MM-YYYY`, datetimes in ISO 8601, `Decimal` as
+a string and row mappings as objects, so views can return rows and dates as they come from
+the database. If orjson is not installed, the standard library provider is used.
+"""
+import dataclasses
+import decimal
+import functools
+import logging
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=4096)
+def format_date(value: date) -> str:
+    """
+    Format a date as `DD-MM-YYYY`.
+
+    A list holds few distinct dates compared to its rows, so the formatted strings are cached.
+    """
+    return f"{value.day:02d}-{value.month:02d}-{value.year:04d}"
+
+def _default(o: Any) -> Any:
+    """Convert the values the encoders do not handle natively."""
+    if type(o) is date:
+        return format_date(o)
+    if isinstance(o, datetime):
+        return o.isoformat()
+    if isinstance(o, date):
+        return format_date(o)
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if isinstance(o, Mapping):
+        return dict(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+class DateJSONProvider(DefaultJSONProvider):
+    """Standard library provider writing the same wire format as `OrjsonProvider`."""
+    default = staticmethod(_default)
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Dates and datetimes are passed through to `_default` (`OPT_PASSTHROUGH_DATETIME`) to keep
+    the `DD-MM-YYYY` format. Non-string keys are allowed, as with the standard library. Output
+    is indented when the application runs in debug mode.
+    """
+    mimetype = "application/json"
+
+    def _options(self) -> int:
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self._app.debug:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def init_json_provider(app: Flask) -> None:
+    """
+    Install the JSON provider selected by the `JSON_PROVIDER` setting.
+
+    Args:
+        app (Flask): The application whose provider is replaced.
+    """
+    provider_class: type[JSONProvider] = DateJSONProvider
+    if app.config['JSON_PROVIDER'] == 'orjson':
+        if orjson is not None:
+            provider_class = OrjsonProvider
+        else:
+            logger.warning("orjson is not installed, using the standard library JSON provider")
+
+    app.json_provider_class = provider_class
+    app.json = provider_class(app)
@@ -1,15 +1,34 @@
 import os
+import queue
+import atexit
 import logging
+import threading
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, DEFAULT_TCP_LOGGING_PORT
+from typing import Any, Optional
 
 from flask import Flask
 
+from .metrics import LOG_RECORDS_DROPPED
+
+LOG_DIR = 'logs'
+
+# Logging pipeline settings, read from the environment because logging is configured
+# before the application configuration is loaded
+LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
+LOG_QUEUE_DROP_POLICY = os.environ.get('LOG_QUEUE_DROP_POLICY', 'drop_new')
+# 'file' (rotating files), 'socket' (the log server) or 'stream' (standard output only).
+# `serve.py` makes 'stream' the default when it runs more than one worker
+LOG_SINK = os.environ.get('LOG_SINK', 'file')
+LOG_SOCKET_HOST = os.environ.get('LOG_SOCKET_HOST', 'localhost')
+LOG_SOCKET_PORT = int(os.environ.get('LOG_SOCKET_PORT', DEFAULT_TCP_LOGGING_PORT))
+
 class MaxLevelFilter(logging.Filter):
     """Filter that allows log messages up to a specified maximum level.
 
     This is useful for directing lower-severity logs (e.g., INFO, DEBUG) to a specific handler
     while excluding higher-severity messages (e.g., ERROR)
-    
+
     Attributes:
         max_level (int): The maximum log level to allow. Messages with a level higher than this will be filtered out.
     """
@@ -21,12 +40,161 @@ class MaxLevelFilter(logging.Filter):
         """Filter method to determine if a log record should be processed.
         Args:
             record (logging.LogRecord): The log record to evaluate.
-        
+
         Returns:
             bool: True if the log record's level is less than or equal to max_level, False otherwise.
         """
         return record.levelno <= self.max_level
 
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the calling thread.
+
+    Records are put on a bounded queue without waiting. When the queue is full, the drop
+    policy decides which record is lost and the drop counters (`dropped` and the
+    `log_records_dropped_total` metric) are incremented:
+    - `drop_new`: the incoming record is discarded.
+    - `drop_oldest`: the oldest queued record is discarded to make room for the incoming one.
+
+    Attributes:
+        drop_policy (str): Either 'drop_new' or 'drop_oldest'.
+        dropped (int): Number of records discarded since the handler was created.
+    """
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = 'drop_new'):
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue, applying the drop policy if it is full.
+
+        Args:
+            record (logging.LogRecord): The prepared log record.
+        """
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.drop_policy == 'drop_oldest':
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+
+        with self._drop_lock:
+            self.dropped += 1
+        LOG_RECORDS_DROPPED.inc()
+
+class LogQueueListener(QueueListener):
+    """Queue listener whose stop sentinel waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        try:
+            self.queue.put(self._sentinel, timeout=1)
+        except queue.Full:
+            pass
+
+class QueueLoggingPipeline:
+    """Moves log I/O off the request threads.
+
+    The application logger only gets a `DroppingQueueHandler`; a background `QueueListener`
+    thread takes the records from the queue and passes them to the real handlers (console,
+    files or socket). The listener is restarted in child processes after a fork, since
+    threads do not survive it.
+
+    Attributes:
+        handler (DroppingQueueHandler): Handler attached to the application logger.
+        handlers (list[logging.Handler]): Handlers fed by the listener thread.
+    """
+    def __init__(self, handlers: list[logging.Handler], max_size: int, drop_policy: str):
+        self.handlers = handlers
+        self.max_size = max_size
+        self.handler = DroppingQueueHandler(queue.Queue(max_size), drop_policy)
+        self.listener: Optional[LogQueueListener] = None
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        self.listener = LogQueueListener(self.handler.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Flush the queued records and stop the listener thread."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def restart_after_fork(self) -> None:
+        """Give the child process a fresh queue and its own listener thread."""
+        self.handler.queue = queue.Queue(self.max_size)
+        self.handler.dropped = 0
+        self.start()
+
+_pipeline: Optional[QueueLoggingPipeline] = None
+
+def _restart_pipeline_after_fork() -> None:
+    if _pipeline is not None and _pipeline.listener is not None:
+        _pipeline.restart_after_fork()
+
+def _stop_pipeline() -> None:
+    if _pipeline is not None:
+        _pipeline.stop()
+
+os.register_at_fork(after_in_child=_restart_pipeline_after_fork)
+atexit.register(_stop_pipeline)
+
+def file_handlers_config(log_dir: str) -> dict[str, dict[str, Any]]:
+    """Build the `dictConfig` entries of the rotating file handlers.
+
+    Shared by the in-process file sink and by the log server (`app.log_server`), which is the
+    single writer of the files when several worker processes log through a socket.
+
+    Args:
+        log_dir (str): Directory where the log files are written.
+
+    Returns:
+        dict[str, dict[str, Any]]: The `error_file` and `info_file` handler definitions.
+    """
+    return {
+        'error_file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'formatter': 'detailed',
+            'level': 'ERROR',
+            'filename': os.path.join(log_dir, 'error_file.log'),
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5
+        },
+        'info_file': {
+            'class': 'logging.handlers.TimedRotatingFileHandler',
+            'formatter': 'standard',
+            'level': 'INFO',
+            'filters': ['max_info_level'],
+            'filename': os.path.join(log_dir, 'info_file.log'),
+            'when': 'midnight',
+            'backupCount': 7
+        },
+    }
+
+FORMATTERS = {
+    'standard': {
+        'format': '%(asctime)s [%(levelname)s] [%(name)s] %(message)s',
+        'datefmt': '%Y-%m-%d %H:%M:%S'
+    },
+    'detailed': {
+        'format': '%(asctime)s [%(levelname)s] [%(name)s] [%(module)s:%(funcName)s:%(lineno)d] %(message)s',
+        'datefmt': '%Y-%m-%d %H:%M:%S'
+    }
+}
+
+FILTERS = {
+    'max_info_level': {
+        '()': MaxLevelFilter,
+        'max_level': logging.WARNING
+    },
+}
+
 def setup_logging(app: Flask) -> logging.Logger:
     """
     Configures structured logging for the Flask application.
@@ -38,11 +206,20 @@ def setup_logging(app: Flask) -> logging.Logger:
         - `info_file.log`: stores INFO and WARNING logs up to the specified max level.
     - Custom formatting and log separation by severity.
     - Automatic log directory creation.
+    - Non-blocking delivery: the logger only enqueues records on a bounded queue and a
+      background listener thread performs the actual I/O.
 
     Features:
     - Traceability: Detailed logs include module, function, and line info.
     - Log rotation: Prevents uncontrolled growth of log files.
     - Level separation: Ensures clearer organization of log data.
+    - Multi-process safety: with `LOG_SINK=socket`, records are sent to the log server
+      (`python -m app.log_server`), the only process writing and rotating the files; with
+      `LOG_SINK=stream`, records only go to standard output.
+
+    The pipeline is tuned through the environment variables `LOG_QUEUE_SIZE`,
+    `LOG_QUEUE_DROP_POLICY` ('drop_new' or 'drop_oldest'), `LOG_SINK` ('file', 'socket' or 'stream'),
+    `LOG_SOCKET_HOST` and `LOG_SOCKET_PORT`.
 
     Args:
         app (Flask): Flask application instance used for logger naming.
@@ -53,38 +230,40 @@ def setup_logging(app: Flask) -> logging.Logger:
     Raises:
         OSError: If the log directory cannot be created.
     """
-    
-    LOG_DIR = 'logs'
-
-    # create the log directory if it doesn't exist
-    try:
-        os.makedirs('logs', exist_ok=True)
-    except OSError as e:
-        # Basic logging configuration in case of an error creating the logs directory
-        logging.basicConfig(level=logging.ERROR)
-        logging.error(f"Error creating logs directory: {e}")
-        raise
+    global _pipeline
+
+    if LOG_SINK == 'stream':
+        # The console handler below is the only one
+        sink_handlers = {}
+    elif LOG_SINK == 'socket':
+        sink_handlers = {
+            'socket': {
+                'class': 'logging.handlers.SocketHandler',
+                'level': 'INFO',
+                'host': LOG_SOCKET_HOST,
+                'port': LOG_SOCKET_PORT
+            }
+        }
+    else:
+        # create the log directory if it doesn't exist
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+        except OSError as e:
+            # Basic logging configuration in case of an error creating the logs directory
+            logging.basicConfig(level=logging.ERROR)
+            logging.error(f"Error creating logs directory: {e}")
+            raise
+        sink_handlers = file_handlers_config(LOG_DIR)
+
+    # Stop the pipeline of a previous application instance before replacing its handlers
+    _stop_pipeline()
 
     # Configure the logging system
     dictConfig({
         'version': 1,
         'disable_existing_loggers': False,
-        'formatters': {
-            'standard': {
-                'format': '%(asctime)s [%(levelname)s] [%(name)s] %(message)s',
-                'datefmt': '%Y-%m-%d %H:%M:%S'
-            },
-            'detailed': {
-                'format': '%(asctime)s [%(levelname)s] [%(name)s] [%(module)s:%(funcName)s:%(lineno)d] %(message)s',
-                'datefmt': '%Y-%m-%d %H:%M:%S'
-            }
-        },
-        'filters': {
-        'max_info_level': {
-            '()': MaxLevelFilter,
-            'max_level': logging.WARNING
-        },
-    },
+        'formatters': FORMATTERS,
+        'filters': FILTERS,
         'handlers': {
             'console': {
                 'class': 'logging.StreamHandler',
@@ -92,23 +271,7 @@ def setup_logging(app: Flask) -> logging.Logger:
                 'level': 'DEBUG',
                 'stream': 'ext://sys.stdout',
             },
-            'error_file': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'formatter': 'detailed',
-                'level': 'ERROR',
-                'filename': os.path.join(LOG_DIR, 'error_file.log'),
-                'maxBytes': 10000,
-                'backupCount': 5
-            },
-            'info_file': {
-                'class': 'logging.handlers.TimedRotatingFileHandler',
-                'formatter': 'standard',
-                'level': 'INFO',    
-                'filters': ['max_info_level'],
-                'filename': os.path.join(LOG_DIR, 'info_file.log'),
-                'when': 'midnight',
-                'backupCount': 7
-            },
+            **sink_handlers,
         },
         'root': {
             'handlers': [],
@@ -116,7 +279,7 @@ def setup_logging(app: Flask) -> logging.Logger:
         },
         'loggers': {
             f'{app.name}': {
-                'handlers': ['console', 'error_file', 'info_file'],
+                'handlers': ['console', *sink_handlers],
                 'level': 'DEBUG',
                 'propagate': False
             },
@@ -127,5 +290,16 @@ def setup_logging(app: Flask) -> logging.Logger:
         }
     })
 
+    # Move the configured handlers behind the queue, so requests never wait on log I/O
+    app_logger = logging.getLogger(app.name)
+    handlers = list(app_logger.handlers)
+    for handler in handlers:
+        app_logger.removeHandler(handler)
+
+    _pipeline = QueueLoggingPipeline(handlers, LOG_QUEUE_SIZE, LOG_QUEUE_DROP_POLICY)
+    app_logger.addHandler(_pipeline.handler)
+    _pipeline.start()
+    app.extensions['log_queue_handler'] = _pipeline.handler
+
     # return the app.logger cnfigured
-    return app.logger
\ No newline at end of file
+    return app.logger
@@ -0,0 +1,154 @@
+"""
+Prometheus metrics for the application.
+
+Exposes, on `GET /metrics` in the Prometheus text format:
+- Request count and latency histogram per resource (Flask endpoint), method and status.
+- Database statement count and duration per statement type, from SQLAlchemy engine events.
+- Connections checked out of, and overflowing, the pool of every engine.
+- Log records dropped because the logging queue was full.
+- Batch size, flush duration, caller wait, failures and timeouts of the group commit of order creations.
+
+Recording is a counter/histogram update per request or statement, cheap enough to leave on
+in production. When `PROMETHEUS_MULTIPROC_DIR` is set (pre-fork servers), the values of every
+worker process are aggregated at scrape time.
+"""
+import os
+import time
+from typing import Any
+
+from flask import Flask, Response, g, request
+from flask_sqlalchemy import SQLAlchemy
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+STATEMENT_TYPES = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE'})
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_COUNT = Counter(
+    'http_requests_total', 'HTTP requests processed', ['resource', 'method', 'status']
+)
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'HTTP request latency', ['resource', 'method'], buckets=LATENCY_BUCKETS
+)
+DB_QUERY_COUNT = Counter(
+    'db_queries_total', 'Database statements executed', ['bind', 'statement']
+)
+DB_QUERY_LATENCY = Histogram(
+    'db_query_duration_seconds', 'Database statement duration', ['bind', 'statement'], buckets=LATENCY_BUCKETS
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections', 'Connections checked out of the pool', ['bind'], multiprocess_mode='livesum'
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow_connections', 'Connections open beyond the pool size', ['bind'], multiprocess_mode='livesum'
+)
+LOG_RECORDS_DROPPED = Counter(
+    'log_records_dropped_total', 'Log records discarded because the logging queue was full'
+)
+GROUP_COMMIT_BATCH_ROWS = Histogram(
+    'group_commit_batch_rows', 'Rows written per group commit', buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+GROUP_COMMIT_FLUSH_DURATION = Histogram(
+    'group_commit_flush_duration_seconds', 'Duration of a group commit transaction', buckets=LATENCY_BUCKETS
+)
+GROUP_COMMIT_WAIT = Histogram(
+    'group_commit_wait_seconds', 'Time from submitting a row to its group commit', buckets=LATENCY_BUCKETS
+)
+GROUP_COMMIT_FAILED_BATCHES = Counter(
+    'group_commit_failed_batches_total', 'Group commits that failed', ['on_failure']
+)
+GROUP_COMMIT_FAILED_ROWS = Counter(
+    'group_commit_failed_rows_total', 'Rows whose group commit failed'
+)
+GROUP_COMMIT_TIMEOUTS = Counter(
+    'group_commit_timeouts_total', 'Rows whose caller stopped waiting for their group commit'
+)
+
+def init_metrics(app: Flask, db: SQLAlchemy) -> None:
+    """
+    Register the request hooks, the engine event listeners and the `/metrics` endpoint.
+
+    Request hooks are used instead of wrapping each view, so successful responses
+    (`wrap_success_response`) and error responses (`handle_http_exception`) are measured alike.
+
+    Args:
+        app (Flask): The application to instrument.
+        db (SQLAlchemy): The database extension whose engines are instrumented.
+    """
+    app.before_request(_start_timer)
+    app.after_request(_record_request)
+
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            _instrument_engine(engine, bind_key or 'default')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+
+def metrics_view() -> Response:
+    """Render every metric in the Prometheus text exposition format."""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+    return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
+
+def _start_timer() -> None:
+    g.metrics_start = time.perf_counter()
+
+def _record_request(response: Response) -> Response:
+    start = g.pop('metrics_start', None)
+    if start is None or request.endpoint == 'metrics':
+        return response
+
+    resource = request.endpoint or 'unmatched'
+    REQUEST_LATENCY.labels(resource, request.method).observe(time.perf_counter() - start)
+    REQUEST_COUNT.labels(resource, request.method, str(response.status_code)).inc()
+    return response
+
+def _instrument_engine(engine: Engine, bind: str) -> None:
+    """
+    Attach the statement timing and pool usage listeners to an engine.
+
+    Args:
+        engine (Engine): Engine to instrument.
+        bind (str): Label identifying the engine in the metrics.
+    """
+    # The start time is kept on the execution context of the statement rather than on the
+    # connection, so a statement that fails (no `after_cursor_execute`) leaves nothing behind
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is not None:
+            context.metrics_query_start = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        start = getattr(context, 'metrics_query_start', None)
+        if start is None:
+            return
+
+        # Only the statement verb is used as label, to keep the series count bounded
+        statement_type = statement.lstrip()[:6].upper()
+        if statement_type not in STATEMENT_TYPES:
+            statement_type = 'OTHER'
+
+        DB_QUERY_LATENCY.labels(bind, statement_type).observe(time.perf_counter() - start)
+        DB_QUERY_COUNT.labels(bind, statement_type).inc()
+
+    @event.listens_for(engine, 'checkout')
+    def checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        DB_POOL_CHECKED_OUT.labels(bind).inc()
+        _record_overflow(engine, bind)
+
+    @event.listens_for(engine, 'checkin')
+    def checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        DB_POOL_CHECKED_OUT.labels(bind).dec()
+        _record_overflow(engine, bind)
+
+def _record_overflow(engine: Engine, bind: str) -> None:
+    overflow = getattr(engine.pool, 'overflow', None)
+    if overflow is not None:
+        DB_POOL_OVERFLOW.labels(bind).set(max(overflow(), 0))
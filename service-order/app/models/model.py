@@ -1,9 +1,10 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Enum
 from ..extensions import db
+from ..utils.utils import utc_now
 
 class Order(db.Model):
     """
@@ -11,6 +12,12 @@ class Order(db.Model):
     """
 
     __tablename__ = 'orders'
+    # Composite indexes backing the list filters: equality on the first column, then the rows
+    # come out already ordered by (delivery_date, id) for keyset pagination
+    __table_args__ = (
+        db.Index('ix_orders_status_delivery_date', 'status', 'delivery_date', 'id'),
+        db.Index('ix_orders_id_product_delivery_date', 'id_product', 'delivery_date', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     customer_name: Mapped[str] = mapped_column(db.String(100), nullable=False, index=True)
@@ -20,11 +27,15 @@ class Order(db.Model):
     delivery_date: Mapped[date] = mapped_column(db.Date, nullable=False, index=True, default=date.today)
     status: Mapped[str] = mapped_column(Enum('pending','recived','ready'), default='pending', nullable=False)
     total_amount: Mapped[float] = mapped_column(db.Float, nullable=False)
+    # Row version, bumped on every update; used to build cheap ETags
+    version: Mapped[int] = mapped_column(db.Integer, nullable=False, default=1, server_default="1")
 
     def to_dict(self) -> dict[str, Any]:
         """
         Converts the Order instance to a serializable dictionary.
 
+        Dates are kept as `date` objects; the JSON provider writes them as `DD-MM-YYYY`.
+
         Returns:
             dict[str, Any]: Dictionary with the order data.
         """
@@ -34,7 +45,52 @@ class Order(db.Model):
             "customer_phone": self.customer_phone,
             "customer_email": self.customer_email,
             "id_product": self.id_product,
-            "delivery_date": self.delivery_date.strftime("%d-%m-%Y"),
+            "delivery_date": self.delivery_date,
             "status": self.status,
-            "total_amount": self.total_amount
-    }
\ No newline at end of file
+            "total_amount": self.total_amount,
+            "version": self.version
+    }
+
+class OrderStat(db.Model):
+    """
+    Pre-aggregated order count and revenue for one value of a dimension.
+
+    Rows are maintained incrementally by `RepositoryOrder` in the same transaction as every
+    order write, so dashboards read a handful of rows instead of grouping the orders table.
+    Dimensions:
+    - `day`: the delivery date, as an ISO date (`YYYY-MM-DD`), so keys sort chronologically.
+    - `status`: the order status.
+    - `product`: the product id.
+    """
+
+    __tablename__ = 'order_stats'
+
+    dimension: Mapped[str] = mapped_column(db.String(16), primary_key=True)
+    key: Mapped[str] = mapped_column(db.String(32), primary_key=True)
+    orders: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    # Exact decimal storage, so repeated increments and decrements do not drift
+    revenue: Mapped[float] = mapped_column(db.Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+
+class OrderChange(db.Model):
+    """
+    Append-only log of the order writes, read by the change feed (`GET /orders/changes`).
+
+    `RepositoryOrder` appends one entry per inserted, updated or deleted order in the same
+    transaction as the write, so a change is visible exactly when the order is. `seq` only grows:
+    the table is created with `AUTOINCREMENT` on SQLite, so sequence numbers are never reused
+    after old entries are purged.
+    """
+
+    __tablename__ = 'order_changes'
+    __table_args__ = (
+        # Finds the newest entry of an order when compacting
+        db.Index('ix_order_changes_order_id_seq', 'order_id', 'seq'),
+        {'sqlite_autoincrement': True},
+    )
+
+    seq: Mapped[int] = mapped_column(
+        db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True, autoincrement=True
+    )
+    order_id: Mapped[int] = mapped_column(db.Integer, nullable=False)
+    operation: Mapped[str] = mapped_column(Enum('insert', 'update', 'delete', name='order_change_operation'), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=False, index=True, default=utc_now)
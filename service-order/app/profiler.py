@@ -0,0 +1,117 @@
+"""
+Opt-in SQL query profiler.
+
+Hooks `before_cursor_execute`/`after_cursor_execute` on every engine to time each statement and:
+- Log statements slower than `SQL_SLOW_QUERY_MS`, with the resource and method that ran them.
+  Statements run outside of a request (startup, background threads, CLI commands) are logged too.
+- Flag requests that execute the same statement shape `SQL_N_PLUS_ONE_THRESHOLD` times or
+  more (a typical N+1 pattern, or redundant reads of the same row).
+- Optionally add `X-DB-Query-Count` and `X-DB-Query-Time-Ms` headers to every response.
+"""
+import logging
+import time
+from collections import Counter
+from typing import Any
+
+from flask import Flask, Response, g, has_request_context, request
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    """
+    Statements executed while serving one request.
+
+    Attributes:
+        count (int): Number of statements executed.
+        total_time (float): Time spent executing them, in seconds.
+        shapes (Counter[str]): Executions per statement text. Parameters are bound separately,
+            so the text identifies the shape of the statement.
+    """
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter[str] = Counter()
+
+class QueryProfiler:
+    """
+    Times the SQL statements executed by the application and reports the slow and repeated ones.
+
+    Attributes:
+        slow_query_ms (float): Statements slower than this are logged, in milliseconds.
+        n_plus_one_threshold (int): Repetitions of a statement shape in one request that get it flagged.
+        add_headers (bool): Whether the per-request query count and DB time are added as response headers.
+    """
+    def __init__(self, slow_query_ms: float = 100, n_plus_one_threshold: int = 5, add_headers: bool = False):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.add_headers = add_headers
+
+    def init_app(self, app: Flask, db: SQLAlchemy) -> None:
+        """
+        Register the request hooks and the engine event listeners.
+
+        Args:
+            app (Flask): The application to profile.
+            db (SQLAlchemy): The database extension whose engines are profiled.
+        """
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+        with app.app_context():
+            for engine in db.engines.values():
+                self._instrument_engine(engine)
+
+    def _start_request(self) -> None:
+        g.query_stats = QueryStats()
+
+    def _finish_request(self, response: Response) -> Response:
+        stats = g.pop('query_stats', None)
+        if stats is None:
+            return response
+
+        for statement, executions in stats.shapes.items():
+            if executions >= self.n_plus_one_threshold:
+                logger.warning(
+                    "Possible N+1: statement executed %d times in %s %s: %s",
+                    executions, request.method, request.endpoint, statement
+                )
+
+        if self.add_headers:
+            response.headers['X-DB-Query-Count'] = str(stats.count)
+            response.headers['X-DB-Query-Time-Ms'] = f"{stats.total_time * 1000:.2f}"
+        return response
+
+    def _instrument_engine(self, engine: Engine) -> None:
+        # The start time is kept on the execution context of the statement rather than on the
+        # connection, so a statement that fails (no `after_cursor_execute`) leaves nothing behind
+        @event.listens_for(engine, 'before_cursor_execute')
+        def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+            if context is not None:
+                context.profiler_query_start = time.perf_counter()
+
+        @event.listens_for(engine, 'after_cursor_execute')
+        def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+            start = getattr(context, 'profiler_query_start', None)
+            if start is None:
+                return
+            elapsed = time.perf_counter() - start
+
+            if not has_request_context():
+                if elapsed * 1000 >= self.slow_query_ms:
+                    logger.warning("Slow query (%.1f ms) outside of a request: %s", elapsed * 1000, statement)
+                return
+
+            stats = g.get('query_stats')
+            if stats is not None:
+                stats.count += 1
+                stats.total_time += elapsed
+                stats.shapes[statement] += 1
+
+            if elapsed * 1000 >= self.slow_query_ms:
+                logger.warning(
+                    "Slow query (%.1f ms) in %s %s: %s",
+                    elapsed * 1000, request.method, request.endpoint, statement
+                )
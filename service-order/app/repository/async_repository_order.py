@@ -0,0 +1,330 @@
+from typing import Type, Dict, Any, Optional, AsyncIterator, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import select, insert, delete
+
+from app.models.model import Order
+from app.exceptions.api_exceptions import OrderNotFoundError
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderRepository
+from app.repository.async_repository_order_changes import AsyncRepositoryOrderChanges
+from app.repository.async_repository_order_stats import AsyncRepositoryOrderStats
+from app.repository.repository_order import OrderStatements
+from app.repository.repository_order_stats import STATS_COLUMNS, Deltas, add_order_deltas
+from app.utils.utils import result_to_dicts
+
+class AsyncRepositoryOrder(OrderStatements, IOrderRepository):
+    """
+    Asynchronous counterpart of `RepositoryOrder`, used by the async (ASGI) mode.
+
+    This class allows:
+    - List all existing orders from the database.
+    - List orders page by page using keyset (cursor) pagination, optionally filtered.
+    - Stream every order through a server-side cursor.
+    - Retrieve a single order by ID.
+    - Retrieve the row version of an order without loading the row.
+    - Create a new order record.
+    - Create many order records in a single statement.
+    - Update an existing order.
+    - Delete an order.
+
+    The statements are the ones of `RepositoryOrder` (see `OrderStatements`), run on an async
+    engine: while a query waits on the database the event loop serves other requests. Every
+    method opens its own session, so a connection is only held for the duration of one call.
+
+    When a statistics repository is given, every write also applies its change to the
+    pre-aggregated order statistics, in the same transaction as the order itself. When a change
+    log repository is given, every inserted, updated or deleted order is also appended to the
+    change log in that transaction.
+
+    Attributes:
+        session_factory: Factory of the async sessions.
+        model: SQLAlchemy model class representing the Order entity.
+        stats: Optional repository of the order statistics kept in sync with the writes.
+        changes: Optional repository of the change log appended to by the writes.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+        - OrderNotFoundError: When the requested order does not exist.
+    """
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], model: Type[Order],
+        stats: Optional[AsyncRepositoryOrderStats] = None, changes: Optional[AsyncRepositoryOrderChanges] = None
+    ):
+        self.session_factory = session_factory
+        self.model = model
+        self.stats = stats
+        self.changes = changes
+
+    async def get_orders_page(
+        self, limit: int, after: Optional[tuple[Any, ...]] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one page of orders using keyset pagination; see `RepositoryOrder.get_orders_page`.
+
+        Raises:
+            BadRequestError: If a filter is not supported.
+        """
+        try:
+            smt = self._page_statement(limit, after, sort, filters)
+            async with self.session_factory() as session:
+                return result_to_dicts(await session.execute(smt))
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def stream_orders(self, chunk_size: int = 1000) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream every order, one row at a time, through a server-side cursor.
+
+        The statement is executed eagerly, so connection and query errors are raised here, before
+        any row is consumed. The session (and its connection) is released once the iterator is
+        exhausted or closed.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the cursor per round trip.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Lazy iterator over the orders ordered by id.
+        """
+        session = self.session_factory()
+        try:
+            smt = self._list_statement().order_by(self.model.id).execution_options(yield_per=chunk_size)
+            result = await session.stream(smt)
+            return self._iter_rows(session, result)
+
+        except OperationalError as e:
+            await session.close()
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            await session.close()
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            await session.close()
+            raise
+
+    @staticmethod
+    async def _iter_rows(session: AsyncSession, result: AsyncResult[Any]) -> AsyncIterator[dict[str, Any]]:
+        """Yield the rows of a streamed result as dictionaries, closing the cursor and session when done."""
+        try:
+            keys = tuple(result.keys())
+            async for row in result:
+                yield dict(zip(keys, row))
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        finally:
+            await result.close()
+            await session.close()
+
+    async def get_order(self, order_id: int) -> Dict[str, Any]:
+        try:
+            async with self.session_factory() as session:
+                order = (await session.execute(select(self.model).filter_by(id=order_id))).scalar_one_or_none()
+            if not order:
+                raise OrderNotFoundError(f"Order with id {order_id} not found")
+
+            return order.to_dict()
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def get_order_version(self, order_id: int) -> int:
+        """Read only the row version of an order, through its primary key."""
+        try:
+            async with self.session_factory() as session:
+                version = (await session.execute(select(self.model.version).filter_by(id=order_id))).scalar_one_or_none()
+            if version is None:
+                raise OrderNotFoundError(f"Order with id {order_id} not found")
+
+            return version
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def add_Order(self, order_data: Dict[str, Any]) -> bool:
+        try:
+            async with self.session_factory() as session, session.begin():
+                new_order = self.model(**order_data)
+                session.add(new_order)
+                if self.stats or self.changes:
+                    # Flush first so the id and the column defaults (status, delivery date) are applied
+                    await session.flush()
+                if self.stats:
+                    deltas: Deltas = {}
+                    add_order_deltas(deltas, {column: getattr(new_order, column) for column in STATS_COLUMNS}, 1)
+                    await self.stats.apply(deltas, session)
+                if self.changes:
+                    await self.changes.record("insert", [new_order.id], session)
+
+            return True
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def add_orders(self, orders_data: list[Dict[str, Any]]) -> int:
+        """Insert many orders in one transaction with a single INSERT; see `RepositoryOrder.add_orders`."""
+        try:
+            async with self.session_factory() as session, session.begin():
+                if self.changes:
+                    await self.changes.record("insert", await self._insert_returning_ids(session, orders_data), session)
+                else:
+                    await session.execute(insert(self.model), orders_data)
+                if self.stats:
+                    deltas: Deltas = {}
+                    for order in orders_data:
+                        add_order_deltas(deltas, self._with_defaults(order), 1)
+                    await self.stats.apply(deltas, session)
+
+            return len(orders_data)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def update_order(self, order_id: int, order_data: Dict[str, Any], locked_statuses: Sequence[str] = ()) -> bool:
+        """
+        Update an order with a single conditional `UPDATE ... WHERE id = :id AND status NOT IN (...)`;
+        see `RepositoryOrder.update_order`.
+
+        Returns:
+            bool: True if the order was updated, False if its status does not allow modifications.
+        """
+        try:
+            async with self.session_factory() as session:
+                if order_data:
+                    async with session.begin():
+                        # The statistics need the values before the change: lock the row while reading them
+                        before = None
+                        if self.stats and STATS_COLUMNS & order_data.keys():
+                            row = (await session.execute(self._before_image_statement(order_id, locked_statuses))).one_or_none()
+                            before = dict(row._mapping) if row is not None else None
+
+                        result = await session.execute(self._update_statement(order_id, order_data, locked_statuses))
+                        if result.rowcount and before is not None:
+                            deltas: Deltas = {}
+                            add_order_deltas(deltas, before, -1)
+                            add_order_deltas(deltas, {**before, **order_data}, 1)
+                            await self.stats.apply(deltas, session)
+                        if result.rowcount and self.changes:
+                            await self.changes.record("update", [order_id], session)
+                    if result.rowcount:
+                        return True
+
+                status = (await session.execute(select(self.model.status).filter_by(id=order_id))).scalar_one_or_none()
+            if status is None:
+                raise OrderNotFoundError(f"Order with id {order_id} not found")
+
+            return status not in locked_statuses
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def delete_order(self, order_id: int) -> bool:
+        """
+        Delete an order with a single `DELETE ... WHERE id = :id` statement. With statistics, the
+        deleted values come back with `DELETE ... RETURNING` where the dialect supports it and are
+        read first with `SELECT ... FOR UPDATE` elsewhere.
+
+        Returns:
+            bool: True once the order has been deleted.
+        """
+        try:
+            smt = delete(self.model).where(self.model.id == order_id).execution_options(synchronize_session=False)
+            async with self.session_factory() as session, session.begin():
+                if not self.stats:
+                    deleted = bool((await session.execute(smt)).rowcount)
+                    if deleted and self.changes:
+                        await self.changes.record("delete", [order_id], session)
+                else:
+                    if session.get_bind().dialect.delete_returning:
+                        columns = [getattr(self.model, column) for column in STATS_COLUMNS]
+                        row = (await session.execute(smt.returning(*columns))).one_or_none()
+                    else:
+                        row = (await session.execute(self._before_image_statement(order_id))).one_or_none()
+                        if row is not None:
+                            await session.execute(smt)
+
+                    deleted = row is not None
+                    if deleted:
+                        deltas: Deltas = {}
+                        add_order_deltas(deltas, dict(row._mapping), -1)
+                        await self.stats.apply(deltas, session)
+                        if self.changes:
+                            await self.changes.record("delete", [order_id], session)
+
+            if not deleted:
+                raise OrderNotFoundError(f"Order with id {order_id} not found")
+
+            return True
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def _insert_returning_ids(self, session: AsyncSession, orders_data: list[Dict[str, Any]]) -> list[int]:
+        """Insert many orders and return their generated ids; see `RepositoryOrder._insert_returning_ids`."""
+        dialect = session.get_bind().dialect
+        if dialect.insert_executemany_returning:
+            return list(await session.scalars(insert(self.model).returning(self.model.id), orders_data))
+
+        if dialect.name == "mysql":
+            if not hasattr(self, "_id_step"):
+                self._id_step = self._consecutive_id_step(*(await session.execute(self.AUTOINC_SETTINGS)).one())
+            if self._id_step is not None:
+                first_id = (await session.execute(insert(self.model).values(orders_data))).lastrowid
+                return [first_id + i * self._id_step for i in range(len(orders_data))]
+
+        orders = [self.model(**order_data) for order_data in orders_data]
+        session.add_all(orders)
+        await session.flush()
+        return [order.id for order in orders]
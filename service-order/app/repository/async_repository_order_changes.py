@@ -0,0 +1,162 @@
+from datetime import datetime
+from typing import Type, Any, Optional, Iterable, Collection
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import insert
+
+from app.models.model import Order, OrderChange
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderChangesRepository
+from app.repository.repository_order_changes import ChangeStatements, change_rows
+
+class AsyncRepositoryOrderChanges(ChangeStatements, IOrderChangesRepository):
+    """
+    Asynchronous counterpart of `RepositoryOrderChanges`, used by the async (ASGI) mode.
+
+    This class allows:
+    - Record the changes of an order write, within the caller's session and transaction (no commit).
+    - Read the entries after a sequence number, with the current state of their orders.
+    - Read the orders changed after a sequence number, for the in-process followers of the log.
+    - Purge the entries older than the retention period.
+    - Compact the log, dropping the entries superseded by a newer entry of the same order.
+
+    The statements are the ones of `RepositoryOrderChanges` (see `ChangeStatements`), so both
+    modes append to and read the same log.
+
+    Attributes:
+        session_factory: Factory of the async sessions; each read or maintenance uses its own session.
+        model: SQLAlchemy model class of the change log.
+        order_model: SQLAlchemy model class of the orders.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+    """
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], model: Type[OrderChange], order_model: Type[Order]):
+        self.session_factory = session_factory
+        self.model = model
+        self.order_model = order_model
+
+    async def record(self, operation: str, order_ids: Iterable[int], session: Optional[AsyncSession] = None) -> None:
+        """
+        Append one entry per order to the log.
+
+        Args:
+            operation (str): 'insert', 'update' or 'delete'.
+            order_ids (Iterable[int]): Identifiers of the orders written.
+            session (Optional[AsyncSession]): Session of the order write; the caller commits it.
+        """
+        rows = change_rows(operation, order_ids)
+        if not rows:
+            return
+
+        try:
+            await session.execute(insert(self.model), rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def get_changes(self, since: Optional[int], limit: int) -> tuple[list[dict[str, Any]], Optional[int], Optional[int]]:
+        """Read the entries after `since` and the bounds of the log; see `RepositoryOrderChanges.get_changes`."""
+        try:
+            async with self.session_factory() as session:
+                first_seq, last_seq = (await session.execute(self._bounds_statement())).one()
+
+                changes = []
+                if since is not None and last_seq is not None and since < last_seq:
+                    changes = self._change_dicts(await session.execute(self._changes_statement(since, limit)))
+
+            return changes, first_seq, last_seq
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def follow(self, after: int, missing: Collection[int], limit: int) -> list[tuple[int, int]]:
+        """Read the orders changed after `after` or in `missing`; see `RepositoryOrderChanges.follow`."""
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(self._follow_statement(after, missing, limit))
+                return [(seq, order_id) for seq, order_id in result]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def purge(self, before: datetime, batch_size: int = 1000) -> int:
+        """Delete the entries written before `before`, except the newest one; see `RepositoryOrderChanges.purge`."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    first_seq, last_seq = (await session.execute(self._bounds_statement())).one()
+                    cutoff = (await session.execute(self._purge_cutoff_statement(before))).scalar()
+                if cutoff is None:
+                    return 0
+
+                # The newest entry always stays: it marks the end of the log
+                cutoff = min(cutoff, last_seq - 1)
+                deleted = 0
+                lower = first_seq
+                while lower <= cutoff:
+                    upper = min(lower + batch_size - 1, cutoff)
+                    async with session.begin():
+                        deleted += (await session.execute(self._purge_statement(lower, upper))).rowcount
+                    lower = upper + 1
+
+            return deleted
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def compact(self, batch_size: int = 1000) -> int:
+        """Delete the entries superseded by a newer entry of the same order; see `RepositoryOrderChanges.compact`."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    first_seq, _ = (await session.execute(self._bounds_statement())).one()
+                if first_seq is None:
+                    return 0
+
+                deleted = 0
+                after = first_seq
+                while True:
+                    async with session.begin():
+                        seqs = list((await session.execute(self._superseded_statement(after, batch_size))).scalars())
+                        if not seqs:
+                            return deleted
+
+                        deleted += (await session.execute(self._compact_statement(seqs))).rowcount
+                    after = seqs[-1]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
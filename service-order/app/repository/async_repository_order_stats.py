@@ -0,0 +1,145 @@
+from typing import Type, Any, Optional, Mapping
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import select, insert, update, delete, func
+
+from app.models.model import Order, OrderStat
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderStatsRepository
+from app.repository.repository_order_stats import STATS_DIMENSIONS, stats_key, stats_rows, stats_upsert
+
+class AsyncRepositoryOrderStats(IOrderStatsRepository):
+    """
+    Asynchronous counterpart of `RepositoryOrderStats`, used by the async (ASGI) mode.
+
+    This class allows:
+    - Apply the changes of an order write, within the caller's session and transaction (no commit).
+    - Read the statistics of one dimension, optionally within a key range.
+    - Rebuild every statistic from the orders table.
+
+    The upserts are the ones of `RepositoryOrderStats`, so both modes keep the same rows.
+
+    Attributes:
+        session_factory: Factory of the async sessions; each read or rebuild uses its own session.
+        model: SQLAlchemy model class of the statistics table.
+        order_model: SQLAlchemy model class of the orders, used to rebuild the statistics.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+    """
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], model: Type[OrderStat], order_model: Type[Order]):
+        self.session_factory = session_factory
+        self.model = model
+        self.order_model = order_model
+
+    async def apply(self, deltas: Mapping[tuple[str, str], tuple[int, float]], session: Optional[AsyncSession] = None) -> None:
+        """
+        Add the accumulated changes to the statistics rows, creating the missing ones.
+
+        Args:
+            deltas (Mapping[tuple[str, str], tuple[int, float]]): Order count and revenue changes by `(dimension, key)`.
+            session (Optional[AsyncSession]): Session of the order write; the caller commits it.
+        """
+        rows = stats_rows(deltas)
+        if not rows:
+            return
+
+        try:
+            smt = stats_upsert(session.get_bind().dialect.name, self.model.__table__)
+            if smt is None:
+                await self._apply_portable(session, rows)
+                return
+
+            await session.execute(smt, rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def _apply_portable(self, session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """Fallback for dialects without an upsert: update each row, inserting it when missing."""
+        for row in rows:
+            smt = update(self.model).where(
+                self.model.dimension == row["dimension"], self.model.key == row["key"]
+            ).values(orders=self.model.orders + row["orders"], revenue=self.model.revenue + row["revenue"])
+
+            result = await session.execute(smt.execution_options(synchronize_session=False))
+            if not result.rowcount:
+                await session.execute(insert(self.model), [row])
+
+    async def get_stats(self, dimension: str, key_from: Optional[str] = None, key_to: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Read the statistics of one dimension through the primary key, skipping empty rows.
+
+        Args:
+            dimension (str): 'day', 'status' or 'product'.
+            key_from (Optional[str]): Smallest key to include.
+            key_to (Optional[str]): Largest key to include.
+
+        Returns:
+            list[dict[str, Any]]: `key`, `orders` and `revenue` of each row, ordered by key.
+        """
+        try:
+            smt = select(self.model.key, self.model.orders, self.model.revenue).where(
+                self.model.dimension == dimension, self.model.orders != 0
+            )
+            if key_from is not None:
+                smt = smt.where(self.model.key >= key_from)
+            if key_to is not None:
+                smt = smt.where(self.model.key <= key_to)
+
+            async with self.session_factory() as session:
+                rows = (await session.execute(smt.order_by(self.model.key))).all()
+            return [{"key": key, "orders": orders, "revenue": revenue} for key, orders, revenue in rows]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    async def rebuild(self) -> int:
+        """
+        Recompute every statistic from the orders table in a single transaction.
+
+        Returns:
+            int: Number of statistics rows written.
+        """
+        try:
+            async with self.session_factory() as session, session.begin():
+                await session.execute(delete(self.model))
+
+                rows = []
+                for dimension, column_name in STATS_DIMENSIONS.items():
+                    column = getattr(self.order_model, column_name)
+                    smt = select(column, func.count(), func.coalesce(func.sum(self.order_model.total_amount), 0)).group_by(column)
+                    result = await session.execute(smt)
+                    rows.extend(
+                        {"dimension": dimension, "key": stats_key(value), "orders": count, "revenue": round(float(revenue), 2)}
+                        for value, count, revenue in result
+                    )
+
+                if rows:
+                    await session.execute(insert(self.model), rows)
+
+            return len(rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
@@ -0,0 +1,120 @@
+import logging
+import time
+from typing import Dict, Any, Optional, Iterator, Sequence
+
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_cache import ICache
+from app.interfaces.interfaces_repository import IOrderRepository
+from app.utils.change_follower import ChangeFollower
+
+logger = logging.getLogger(__name__)
+
+class CachedRepositoryOrder(IOrderRepository):
+    """
+    Read-through cache in front of an "IOrderRepository".
+
+    Single-order lookups (`get_order`) are served from the cache when possible and loaded from
+    the wrapped repository on a miss. Every other operation is delegated unchanged. Writes that
+    change an existing order (`update_order`, `delete_order`) invalidate its entry, so the next
+    lookup reloads it from the database.
+
+    The cache is local to the process. The writes of the other processes are read from the
+    order change log by `follower`, at most every `sync_interval` seconds before a lookup, and
+    invalidate their entries too; if the log cannot be read, the whole cache is dropped. A row
+    loaded while changes were being applied is not cached, as it may predate them.
+
+    `get_order_version` answers from the same entries, after the same sync, so a conditional
+    request for a hot order never reaches the database; peeking at the entry leaves the hit and
+    miss counters to `get_order`.
+
+    Attributes:
+        repository: Repository that performs the actual data access.
+        cache: Cache storing the orders by id.
+        follower: Follower of the order change log; without it, only this process's writes invalidate entries.
+        sync_interval: Minimum number of seconds between two reads of the change log.
+    """
+    def __init__(
+        self, repository: IOrderRepository, cache: ICache, follower: Optional[ChangeFollower] = None, sync_interval: float = 1.0
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.follower = follower
+        self.sync_interval = sync_interval
+        self._last_sync = 0.0
+        # Bumped whenever entries are invalidated, to tell whether a row loaded meanwhile may be stale
+        self._generation = 0
+
+    def sync(self, force: bool = False) -> None:
+        """
+        Invalidate the entries of the orders written by other processes since the last sync.
+
+        Args:
+            force (bool): Sync even if the last one is more recent than `sync_interval`.
+        """
+        if self.follower is None or (not force and time.monotonic() - self._last_sync < self.sync_interval):
+            return
+
+        self._last_sync = time.monotonic()
+        try:
+            changed = self.follower.poll()
+        except (ConnectionError, QueryError) as e:
+            logger.warning("Failed to read the order changes, dropping the order cache: %s", e)
+            self._invalidate()
+            self.cache.clear()
+            return
+
+        if changed:
+            self._invalidate()
+            for order_id in changed:
+                self.cache.delete(order_id)
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+
+    def get_orders_page(
+        self, limit: int, after: Optional[tuple[Any, ...]] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        return self.repository.get_orders_page(limit, after, sort, filters)
+
+    def stream_orders(self, chunk_size: int = 1000) -> Iterator[dict[str, Any]]:
+        return self.repository.stream_orders(chunk_size)
+
+    def get_order(self, order_id: int) -> Dict[str, Any]:
+        self.sync()
+        order = self.cache.get(order_id)
+        if order is None:
+            generation = self._generation
+            order = self.repository.get_order(order_id)
+            if generation == self._generation:
+                self.cache.set(order_id, order)
+
+        # Hand out a copy so callers cannot alter the cached entry
+        return dict(order)
+
+    def get_order_version(self, order_id: int) -> int:
+        self.sync()
+        order = self.cache.peek(order_id)
+        if order is not None:
+            return order["version"]
+
+        return self.repository.get_order_version(order_id)
+
+    def add_Order(self, order_data: Dict[str, Any]) -> bool:
+        return self.repository.add_Order(order_data)
+
+    def add_orders(self, orders_data: list[Dict[str, Any]]) -> int:
+        return self.repository.add_orders(orders_data)
+
+    def update_order(self, order_id: int, order_data: Dict[str, Any], locked_statuses: Sequence[str] = ()) -> bool:
+        try:
+            return self.repository.update_order(order_id, order_data, locked_statuses)
+        finally:
+            self._invalidate()
+            self.cache.delete(order_id)
+
+    def delete_order(self, order_id: int) -> bool:
+        try:
+            return self.repository.delete_order(order_id)
+        finally:
+            self._invalidate()
+            self.cache.delete(order_id)
@@ -1,29 +1,189 @@
-from typing import Type, Dict, Any
+import logging
+from typing import Type, Dict, Any, Optional, Iterator, Sequence, Callable
 
+from sqlalchemy.engine import Result
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, and_, or_, text
+from sqlalchemy.sql import Select, Update
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.model import Order
-from app.exceptions.api_exceptions import OrderNotFoundError
+from app.exceptions.api_exceptions import BadRequestError, OrderNotFoundError
 from app.exceptions.database_exceptions import ConnectionError, QueryError
-from app.interfaces.interfaces_repository import IOrderRepository
-from app.utils.utils import converted_rowmapping_to_dict
+from app.interfaces.interfaces_repository import (
+    IOrderRepository, IOrderChangesRepository, IOrderSearchRepository, IOrderStatsRepository
+)
+from app.repository.repository_order_stats import STATS_COLUMNS, Deltas, add_order_deltas
+from app.utils.group_commit import GroupCommitter
+from app.utils.replica_router import ReplicaRouter
+from app.utils.utils import escape_like, result_to_dicts
 
-class RepositoryOrder(IOrderRepository):
+logger = logging.getLogger(__name__)
+
+class OrderStatements:
+    """
+    Statements shared by the synchronous and the asynchronous order repositories, so both
+    modes run exactly the same SQL.
+
+    Attributes:
+        model: SQLAlchemy model class representing the Order entity.
+    """
+    model: Type[Order]
+
+    # Whitelisted list filters; each one compiles to an index-backed condition
+    FILTERS: dict[str, Callable[[Type[Order], Any], ColumnElement[bool]]] = {
+        "status": lambda model, value: model.status == value,
+        "id_product": lambda model, value: model.id_product == value,
+        "customer": lambda model, value: model.customer_name.like(escape_like(value) + "%", escape="/"),
+        "delivery_from": lambda model, value: model.delivery_date >= value,
+        "delivery_to": lambda model, value: model.delivery_date <= value,
+    }
+
+    # Whether the rows of one multi-row INSERT get consecutive ids on MySQL, and their step
+    AUTOINC_SETTINGS = text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+
+    @staticmethod
+    def _consecutive_id_step(lock_mode: int, increment: int) -> Optional[int]:
+        """
+        Step between the ids InnoDB gives the rows of one multi-row INSERT, or None when they may
+        not be consecutive: only the 'traditional' (0) and 'consecutive' (1) lock modes reserve
+        them in one go for a statement whose number of rows is known.
+        """
+        if int(lock_mode) > 1:
+            logger.warning(
+                "innodb_autoinc_lock_mode is %s: order batches are inserted row by row to read their ids; "
+                "set it to 1 to insert them with a single statement", lock_mode
+            )
+            return None
+        return int(increment)
+
+    def _list_statement(self) -> Select[Any]:
+        """Select the columns of the order list, without loading the full rows."""
+        return select(
+            self.model.id,
+            self.model.customer_name,
+            self.model.id_product,
+            self.model.delivery_date,
+            self.model.status,
+        )
+
+    def _page_statement(
+        self, limit: int, after: Optional[tuple[Any, ...]], sort: str, filters: Optional[dict[str, Any]]
+    ) -> Select[Any]:
+        """
+        Build the keyset-paginated, filtered list query of `get_orders_page`.
+
+        Raises:
+            BadRequestError: If a filter is not supported.
+        """
+        smt = self._list_statement()
+        for name, value in (filters or {}).items():
+            if name not in self.FILTERS:
+                raise BadRequestError(f"Unsupported filter: {name}")
+            smt = smt.where(self.FILTERS[name](self.model, value))
+
+        descending = sort.startswith("-")
+        if sort.lstrip("-") == "delivery_date":
+            keys = (self.model.delivery_date, self.model.id)
+        else:
+            keys = (self.model.id,)
+
+        if after is not None:
+            smt = smt.where(self._after(keys, after, descending))
+        smt = smt.order_by(*(key.desc() if descending else key for key in keys))
+        return smt.limit(limit)
+
+    @staticmethod
+    def _after(keys: tuple[Any, ...], position: tuple[Any, ...], descending: bool) -> ColumnElement[bool]:
+        """
+        Build the keyset condition selecting the rows after `position` in the sort order.
+
+        Args:
+            keys (tuple[Any, ...]): Sort columns, the last one being the unique `id`.
+            position (tuple[Any, ...]): Values of the sort columns in the last row of the previous page.
+            descending (bool): Whether the rows are sorted in descending order.
+
+        Returns:
+            ColumnElement[bool]: `(k1 > v1) OR (k1 = v1 AND k2 > v2)`, with `<` when descending.
+        """
+        def beyond(column: Any, value: Any) -> ColumnElement[bool]:
+            return column < value if descending else column > value
+
+        if len(keys) == 1:
+            return beyond(keys[0], position[0])
+        return or_(
+            beyond(keys[0], position[0]),
+            and_(keys[0] == position[0], beyond(keys[1], position[1]))
+        )
+
+    def _update_statement(self, order_id: int, order_data: Dict[str, Any], locked_statuses: Sequence[str]) -> Update:
+        """Build the conditional `UPDATE ... WHERE id = :id AND status NOT IN (...)` bumping the row version."""
+        smt = update(self.model).where(self.model.id == order_id)
+        if locked_statuses:
+            smt = smt.where(self.model.status.not_in(locked_statuses))
+
+        smt = smt.values(**order_data, version=self.model.version + 1)
+        return smt.execution_options(synchronize_session=False)
+
+    def _before_image_statement(self, order_id: int, locked_statuses: Sequence[str] = ()) -> Select[Any]:
+        """Build the `SELECT ... FOR UPDATE` of the statistics columns of an order."""
+        smt = select(*(getattr(self.model, column) for column in STATS_COLUMNS)).where(self.model.id == order_id)
+        if locked_statuses:
+            smt = smt.where(self.model.status.not_in(locked_statuses))
+        return smt.with_for_update()
+
+    def _with_defaults(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Complete the statistics columns of a row to insert with the model's scalar and callable defaults."""
+        if STATS_COLUMNS <= order.keys():
+            return order
+
+        completed = dict(order)
+        for column in STATS_COLUMNS - order.keys():
+            default = self.model.__table__.c[column].default
+            if default is not None and default.is_scalar:
+                completed[column] = default.arg
+            elif default is not None and default.is_callable:
+                completed[column] = default.arg(None)
+            else:
+                completed[column] = None
+        return completed
+
+class RepositoryOrder(OrderStatements, IOrderRepository):
     """
     Repository class that implements "IOrderRepository" and manages data persistence and retrieval for the Order entity.
 
     This class allows:
     - List all existing orders from the database.
+    - List orders page by page using keyset (cursor) pagination, optionally filtered.
+    - Stream every order through a server-side cursor.
     - Retrieve a single order by ID.
+    - Retrieve the row version of an order without loading the row.
     - Create a new order record.
+    - Create many order records in a single statement.
     - Update an existing order.
     - Delete an order.
 
+    Reads are served by a read replica when a router is given; writes, and the reads of a
+    request that already wrote, use the primary.
+
+    When a statistics repository is given, every write also applies its change to the
+    pre-aggregated order statistics, in the same transaction as the order itself. When a change
+    log repository is given, every inserted, updated or deleted order is also appended to the
+    change log in that transaction. When a search repository is given, committed writes are
+    applied to the customer search index.
+
+    When a group committer is attached, `add_Order` hands the order to it instead of committing
+    on its own: concurrent creations are inserted together by `add_orders`, in one transaction.
+
     Attributes:
         session: SQLAlchemy scoped session used to interact with the database.
         model: SQLAlchemy model class representing the Order entity.
+        router: Optional router choosing the engine of each read.
+        stats: Optional repository of the order statistics kept in sync with the writes.
+        search: Optional repository of the customer search index kept in sync with the writes.
+        changes: Optional repository of the change log appended to by the writes.
+        group_commit: Optional committer gathering the creations of concurrent requests.
 
     Error Handling:
         Each method handles and raises appropriate exceptions:
@@ -31,22 +191,86 @@ class RepositoryOrder(IOrderRepository):
         - QueryError: For generic SQL execution issues.
         - OrderNotFoundError: When the requested order does not exist.
     """
-    def __init__(self, session: scoped_session, model: Type[Order]):
+    def __init__(
+        self, session: scoped_session, model: Type[Order], router: Optional[ReplicaRouter] = None,
+        stats: Optional[IOrderStatsRepository] = None, search: Optional[IOrderSearchRepository] = None,
+        changes: Optional[IOrderChangesRepository] = None
+    ):
         self.session = session
         self.model = model
+        self.router = router
+        self.stats = stats
+        self.search = search
+        self.changes = changes
+        self.group_commit: Optional[GroupCommitter[Dict[str, Any]]] = None
+
+    def _read_bind(self) -> Optional[dict[str, Any]]:
+        return self.router.read_bind() if self.router else None
+
+    def _mark_write(self) -> None:
+        if self.router:
+            self.router.mark_write()
+
+    def get_orders_page(
+        self, limit: int, after: Optional[tuple[Any, ...]] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one page of orders using keyset pagination.
+
+        Rows are ordered by `id`, or by `(delivery_date, id)` when `sort` is 'delivery_date', in
+        descending order when `sort` starts with '-'. The page starts right after the `after`
+        position. Unlike OFFSET, the database seeks directly to the position through the index,
+        so the cost of a page does not depend on how deep it is.
+
+        Only the filters in `FILTERS` are accepted, each backed by an index: `status` and
+        `id_product` by the composite `(column, delivery_date, id)` indexes, `customer` (name prefix)
+        by the `customer_name` index and `delivery_from`/`delivery_to` by the `delivery_date` index.
+
+        Args:
+            limit (int): Maximum number of rows to return.
+            after (Optional[tuple[Any, ...]]): Keyset position of the last row of the previous page.
+            sort (str): Sort key: 'id', 'delivery_date', '-id' or '-delivery_date'.
+            filters (Optional[dict[str, Any]]): Filter values by name.
 
-    def get_all_orders(self) -> list[dict[str, Any]]:
+        Returns:
+            list[dict[str, Any]]: Up to `limit` orders.
+
+        Raises:
+            BadRequestError: If a filter is not supported.
+        """
         try:
-            smt = select(
-                self.model.id,
-                self.model.customer_name,
-                self.model.id_product,
-                self.model.delivery_date,
-                self.model.status,
-            )
-            orders = self.session.execute(smt).mappings().all()
-            return  converted_rowmapping_to_dict(orders)
+            smt = self._page_statement(limit, after, sort, filters)
+            return result_to_dicts(self.session.execute(smt, bind_arguments=self._read_bind()))
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
         
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed") 
+        
+        except Exception as e:
+            raise
+
+    def stream_orders(self, chunk_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """
+        Stream every order, one row at a time, through a server-side cursor.
+
+        The statement is executed eagerly, so connection and query errors are raised here, before
+        any row is consumed. Rows are then fetched from the database in chunks of `chunk_size`,
+        which keeps memory usage flat regardless of the number of orders.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the cursor per round trip.
+
+        Returns:
+            Iterator[dict[str, Any]]: Lazy iterator over the orders ordered by id.
+        """
+        try:
+            smt = self._list_statement().order_by(self.model.id).execution_options(yield_per=chunk_size)
+
+            result = self.session.execute(smt, bind_arguments=self._read_bind())
+            return self._iter_rows(result)
+
         except OperationalError as e:
             raise ConnectionError("Failed to connect to the database")
         
@@ -56,10 +280,35 @@ class RepositoryOrder(IOrderRepository):
         except Exception as e:
             raise
 
+    @staticmethod
+    def _iter_rows(result: Result[Any]) -> Iterator[dict[str, Any]]:
+        """
+        Yield the rows of a streamed result as dictionaries, closing the cursor when done.
+
+        Args:
+            result (Result[Any]): Result of a statement executed with `yield_per`.
+
+        Yields:
+            dict[str, Any]: One order per row.
+        """
+        try:
+            keys = tuple(result.keys())
+            for row in result:
+                yield dict(zip(keys, row))
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+        
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed") 
+        
+        finally:
+            result.close()
+
     def get_order(self, order_id: int) -> Dict[str, Any]:
         try:
             smt = select(self.model).filter_by(id=order_id)
-            order = self.session.execute(smt).scalar_one_or_none()
+            order = self.session.execute(smt, bind_arguments=self._read_bind()).scalar_one_or_none()
             if not order:
                 raise OrderNotFoundError(f"Order with id {order_id} not found")
             
@@ -74,11 +323,55 @@ class RepositoryOrder(IOrderRepository):
         except Exception as e:
             raise 
 
+    def get_order_version(self, order_id: int) -> int:
+        """
+        Read only the row version of an order, through its primary key.
+
+        Args:
+            order_id (int): Identifier of the order.
+
+        Returns:
+            int: Current version of the order.
+        """
+        try:
+            smt = select(self.model.version).filter_by(id=order_id)
+            version = self.session.execute(smt, bind_arguments=self._read_bind()).scalar_one_or_none()
+            if version is None:
+                raise OrderNotFoundError(f"Order with id {order_id} not found")
+
+            return version
+        
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+        
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed") 
+        
+        except Exception as e:
+            raise 
+
     def add_Order(self, order_data: Dict[str, Any]) -> bool:
         try:
+            self._mark_write()
+            if self.group_commit is not None:
+                # Blocks until the batch holding this order is committed, raising its error otherwise
+                self.group_commit.wait(order_data)
+                return True
+
             new_order = self.model(**order_data)
             self.session.add(new_order)
+            if self.stats or self.changes:
+                # Flush first so the id and the column defaults (status, delivery date) are applied
+                self.session.flush()
+            if self.stats:
+                deltas: Deltas = {}
+                add_order_deltas(deltas, {column: getattr(new_order, column) for column in STATS_COLUMNS}, 1)
+                self.stats.apply(deltas)
+            if self.changes:
+                self.changes.record("insert", [new_order.id])
             self.session.commit()
+            if self.search:
+                self.search.after_insert()
 
             return True
         
@@ -87,23 +380,97 @@ class RepositoryOrder(IOrderRepository):
         
         except (ProgrammingError, SQLAlchemyError) as e:
             raise QueryError("Database query failed") 
+
+        except TimeoutError as e:
+            raise QueryError("Timed out waiting for the order to be committed")
         
         except Exception as e:
             raise 
 
-    def update_order(self, order_id: int, order_data: Dict[str, Any]) -> bool:
+    def add_orders(self, orders_data: list[Dict[str, Any]]) -> int:
+        """
+        Insert many orders in one transaction with a single executemany INSERT.
+
+        With the change log, the generated ids are needed: see `_insert_returning_ids`, which
+        keeps a single statement except on MySQL under `innodb_autoinc_lock_mode=2`, where the
+        rows are inserted one by one.
+
+        Args:
+            orders_data (list[Dict[str, Any]]): Column values of the orders to create.
+
+        Returns:
+            int: Number of orders inserted.
+        """
         try:
-            smt = select(self.model).filter_by(id=order_id)
-            order = self.session.execute(smt).scalars().first()
+            self._mark_write()
+            if self.changes:
+                self.changes.record("insert", self._insert_returning_ids(orders_data))
+            else:
+                self.session.execute(insert(self.model), orders_data)
+            if self.stats:
+                deltas: Deltas = {}
+                for order in orders_data:
+                    add_order_deltas(deltas, self._with_defaults(order), 1)
+                self.stats.apply(deltas)
+            self.session.commit()
+            if self.search:
+                self.search.after_insert()
 
-            if not order:
+            return len(orders_data)
+        
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+        
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed") 
+        
+        except Exception as e:
+            raise 
+
+    def update_order(self, order_id: int, order_data: Dict[str, Any], locked_statuses: Sequence[str] = ()) -> bool:
+        """
+        Update an order with a single conditional `UPDATE ... WHERE id = :id AND status NOT IN (...)`.
+
+        The status check and the write happen in the same statement, so there is no window between
+        reading the status and modifying the row. Only when no row is affected is the status read,
+        to tell a missing order apart from one that cannot be modified.
+
+        Args:
+            order_id (int): Identifier of the order to update.
+            order_data (Dict[str, Any]): Columns to update.
+            locked_statuses (Sequence[str]): Statuses in which the order cannot be modified.
+
+        Returns:
+            bool: True if the order was updated, False if its status does not allow modifications.
+        """
+        try:
+            self._mark_write()
+            if order_data:
+                # The statistics need the values before the change: lock the row while reading them
+                before = None
+                if self.stats and STATS_COLUMNS & order_data.keys():
+                    before = self._stats_before_image(order_id, locked_statuses)
+
+                result = self.session.execute(self._update_statement(order_id, order_data, locked_statuses))
+                if result.rowcount and before is not None:
+                    deltas: Deltas = {}
+                    add_order_deltas(deltas, before, -1)
+                    add_order_deltas(deltas, {**before, **order_data}, 1)
+                    self.stats.apply(deltas)
+                if result.rowcount and self.changes:
+                    self.changes.record("update", [order_id])
+                self.session.commit()
+                if result.rowcount:
+                    if self.search:
+                        self.search.after_update(order_id, order_data)
+                    return True
+
+            smt = select(self.model.status).filter_by(id=order_id)
+            status = self.session.execute(smt).scalar_one_or_none()
+            if status is None:
                 raise OrderNotFoundError(f"Order with id {order_id} not found")
-            
-            for key, value in order_data.items():
-                setattr(order, key, value)
 
-            self.session.commit()
-            return True
+            return status not in locked_statuses
 
         except OperationalError as e:
             raise ConnectionError("Failed to connect to the database")
@@ -115,15 +482,31 @@ class RepositoryOrder(IOrderRepository):
             raise
 
     def delete_order(self, order_id: int) -> bool:
+        """
+        Delete an order with a single `DELETE ... WHERE id = :id` statement.
+
+        Args:
+            order_id (int): Identifier of the order to delete.
+
+        Returns:
+            bool: True once the order has been deleted.
+        """
         try:
-            smt = select(self.model).filter_by(id=order_id)
-            order = self.session.execute(smt).scalar_one_or_none()
+            self._mark_write()
+            smt = delete(self.model).where(self.model.id == order_id).execution_options(synchronize_session=False)
+            if self.stats:
+                deleted = self._delete_with_stats(smt, order_id)
+            else:
+                deleted = self.session.execute(smt).rowcount
+            if deleted and self.changes:
+                self.changes.record("delete", [order_id])
+            self.session.commit()
 
-            if not order:
+            if not deleted:
                 raise OrderNotFoundError(f"Order with id {order_id} not found")
+            if self.search:
+                self.search.after_delete(order_id)
             
-            self.session.delete(order)
-            self.session.commit()
             return True
 
         except OperationalError as e:
@@ -133,4 +516,102 @@ class RepositoryOrder(IOrderRepository):
             raise QueryError("Database query failed") 
         
         except Exception as e:
-            raise 
\ No newline at end of file
+            raise 
+
+    def _insert_returning_ids(self, orders_data: list[Dict[str, Any]]) -> list[int]:
+        """
+        Insert many orders with a single statement and return their generated ids.
+
+        Uses an executemany `INSERT ... RETURNING` where the dialect supports it (SQLite,
+        PostgreSQL, MariaDB). On MySQL, one multi-row INSERT is sent and the ids are derived from
+        `LAST_INSERT_ID()` (the id of its first row) and `auto_increment_increment`, which is only
+        exact when `innodb_autoinc_lock_mode` is 0 or 1; under the interleaved mode (2, the
+        MySQL 8 default) the ORM inserts the rows one by one to read each id.
+        """
+        dialect = self.session.get_bind(mapper=self.model).dialect
+        if dialect.insert_executemany_returning:
+            return list(self.session.scalars(insert(self.model).returning(self.model.id), orders_data))
+
+        if dialect.name == "mysql":
+            if not hasattr(self, "_id_step"):
+                self._id_step = self._consecutive_id_step(*self.session.execute(self.AUTOINC_SETTINGS).one())
+            if self._id_step is not None:
+                first_id = self.session.execute(insert(self.model).values(orders_data)).lastrowid
+                return [first_id + i * self._id_step for i in range(len(orders_data))]
+
+        orders = [self.model(**order_data) for order_data in orders_data]
+        self.session.add_all(orders)
+        self.session.flush()
+        return [order.id for order in orders]
+
+    def _delete_with_stats(self, smt: Any, order_id: int) -> bool:
+        """
+        Run a single-order DELETE and remove the order from the statistics.
+
+        The deleted values come back with `DELETE ... RETURNING` where the dialect supports it
+        (SQLite, PostgreSQL); elsewhere they are read first with `SELECT ... FOR UPDATE`.
+
+        Returns:
+            bool: True if the order existed.
+        """
+        columns = [getattr(self.model, column) for column in STATS_COLUMNS]
+        if self.session.get_bind(mapper=self.model).dialect.delete_returning:
+            row = self.session.execute(smt.returning(*columns)).one_or_none()
+            before = dict(row._mapping) if row is not None else None
+        else:
+            before = self._stats_before_image(order_id)
+            if before is not None:
+                self.session.execute(smt)
+
+        if before is None:
+            return False
+
+        deltas: Deltas = {}
+        add_order_deltas(deltas, before, -1)
+        self.stats.apply(deltas)
+        return True
+
+    def warm_up(self) -> None:
+        """
+        Prepare the statements of the request paths before the application serves traffic.
+
+        The reads are run once (they match at most one row), which configures the ORM mappers
+        and fills the engine's compiled statement cache. The writes are only compiled against
+        the dialect, so the database is never modified.
+        """
+        try:
+            self.get_orders_page(1)
+            for read in (self.get_order, self.get_order_version):
+                try:
+                    read(0)
+                except OrderNotFoundError:
+                    pass
+
+            dialect = self.session.get_bind(mapper=self.model).dialect
+            for smt in (
+                insert(self.model),
+                self._update_statement(0, {"status": "pending"}, ("delivered",)),
+                self._before_image_statement(0, ("delivered",)),
+                delete(self.model).where(self.model.id == 0),
+            ):
+                smt.compile(dialect=dialect)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def _stats_before_image(self, order_id: int, locked_statuses: Sequence[str] = ()) -> Optional[dict[str, Any]]:
+        """
+        Read the statistics columns of an order with `SELECT ... FOR UPDATE`.
+
+        The row stays locked until the transaction ends, so the values cannot change between
+        this read and the write that follows. Returns None when the order does not exist or
+        its status is locked.
+        """
+        row = self.session.execute(self._before_image_statement(order_id, locked_statuses)).one_or_none()
+        return dict(row._mapping) if row is not None else None
@@ -0,0 +1,294 @@
+from datetime import datetime
+from typing import Type, Any, Optional, Iterable, Collection
+
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import scoped_session, aliased
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import select, insert, delete, exists, func, or_
+from sqlalchemy.sql import Select
+
+from app.models.model import Order, OrderChange
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderChangesRepository
+from app.utils.replica_router import ReplicaRouter
+from app.utils.utils import utc_now
+
+# Bounds of the retained log: the oldest and the newest sequence numbers (None when empty)
+Bounds = tuple[Optional[int], Optional[int]]
+
+def change_rows(operation: str, order_ids: Iterable[int]) -> list[dict[str, Any]]:
+    """Build the change log entries of one write, all stamped with the same time."""
+    changed_at = utc_now()
+    return [{"order_id": order_id, "operation": operation, "changed_at": changed_at} for order_id in order_ids]
+
+class ChangeStatements:
+    """
+    Statements shared by the synchronous and the asynchronous change log repositories.
+
+    Attributes:
+        model: SQLAlchemy model class of the change log.
+        order_model: SQLAlchemy model class of the orders, joined to return their current state.
+    """
+    model: Type[OrderChange]
+    order_model: Type[Order]
+
+    def _bounds_statement(self) -> Select[Any]:
+        """Select the oldest and newest sequence numbers, both read from the primary key."""
+        return select(func.min(self.model.seq), func.max(self.model.seq))
+
+    def _changes_statement(self, since: int, limit: int) -> Select[Any]:
+        """Select the entries after `since` in sequence order, with the current state of their order."""
+        return (
+            select(self.model.seq, self.model.order_id, self.model.operation, self.model.changed_at, self.order_model)
+            .outerjoin(self.order_model, self.order_model.id == self.model.order_id)
+            .where(self.model.seq > since)
+            .order_by(self.model.seq)
+            .limit(limit)
+        )
+
+    def _follow_statement(self, after: int, missing: Collection[int], limit: int) -> Select[Any]:
+        """Select the sequence number and order of the entries after `after` or among `missing`, in sequence order."""
+        condition = self.model.seq > after
+        if missing:
+            condition = or_(condition, self.model.seq.in_(missing))
+        return select(self.model.seq, self.model.order_id).where(condition).order_by(self.model.seq).limit(limit)
+
+    def _purge_cutoff_statement(self, before: datetime) -> Select[Any]:
+        """Select the newest sequence number written before `before`, through the `changed_at` index."""
+        return select(func.max(self.model.seq)).where(self.model.changed_at < before)
+
+    def _purge_statement(self, lower: int, upper: int) -> Any:
+        return delete(self.model).where(self.model.seq.between(lower, upper)).execution_options(synchronize_session=False)
+
+    def _superseded_statement(self, after: int, limit: int) -> Select[Any]:
+        """Select the entries after `after` whose order has a newer entry, through the `(order_id, seq)` index."""
+        newer = aliased(self.model)
+        return (
+            select(self.model.seq)
+            .where(
+                self.model.seq > after,
+                exists().where(newer.order_id == self.model.order_id, newer.seq > self.model.seq)
+            )
+            .order_by(self.model.seq)
+            .limit(limit)
+        )
+
+    def _compact_statement(self, seqs: list[int]) -> Any:
+        return delete(self.model).where(self.model.seq.in_(seqs)).execution_options(synchronize_session=False)
+
+    @staticmethod
+    def _change_dicts(result: Result[Any]) -> list[dict[str, Any]]:
+        """Turn the rows of `_changes_statement` into entries; `order` is None once the order is deleted."""
+        return [
+            {
+                "seq": seq,
+                "order_id": order_id,
+                "operation": operation,
+                "changed_at": changed_at,
+                "order": order.to_dict() if order is not None else None
+            }
+            for seq, order_id, operation, changed_at, order in result
+        ]
+
+class RepositoryOrderChanges(ChangeStatements, IOrderChangesRepository):
+    """
+    Repository class that implements "IOrderChangesRepository" and manages the append-only log
+    of the order writes (`order_changes`).
+
+    This class allows:
+    - Record the changes of an order write, within the caller's transaction (no commit).
+    - Read the entries after a sequence number, with the current state of their orders.
+    - Read the orders changed after a sequence number, for the in-process followers of the log.
+    - Purge the entries older than the retention period.
+    - Compact the log, dropping the entries superseded by a newer entry of the same order.
+
+    The newest entry and, after a purge, the oldest retained one are never removed by the
+    maintenance: the first tells where the log ends, the second how far back it reaches.
+
+    Attributes:
+        session: SQLAlchemy scoped session used to interact with the database.
+        model: SQLAlchemy model class of the change log.
+        order_model: SQLAlchemy model class of the orders.
+        router: Optional router choosing the engine of each read.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+    """
+    def __init__(self, session: scoped_session, model: Type[OrderChange], order_model: Type[Order], router: Optional[ReplicaRouter] = None):
+        self.session = session
+        self.model = model
+        self.order_model = order_model
+        self.router = router
+
+    def record(self, operation: str, order_ids: Iterable[int]) -> None:
+        """
+        Append one entry per order to the log.
+
+        The statement runs in the session's current transaction; the caller commits it together
+        with the order write.
+
+        Args:
+            operation (str): 'insert', 'update' or 'delete'.
+            order_ids (Iterable[int]): Identifiers of the orders written.
+        """
+        rows = change_rows(operation, order_ids)
+        if not rows:
+            return
+
+        try:
+            self.session.execute(insert(self.model), rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def get_changes(self, since: Optional[int], limit: int) -> tuple[list[dict[str, Any]], Optional[int], Optional[int]]:
+        """
+        Read the entries after `since` through the primary key, and the bounds of the log.
+
+        Both reads go to the same engine, so the bounds describe the log the entries come from.
+
+        Args:
+            since (Optional[int]): Last sequence number already seen; when None only the bounds are read.
+            limit (int): Maximum number of entries to return.
+
+        Returns:
+            tuple[list[dict[str, Any]], Optional[int], Optional[int]]: The entries in sequence order
+            (`seq`, `order_id`, `operation`, `changed_at` and the current `order`), then the oldest
+            and newest sequence numbers of the log, None when it is empty.
+        """
+        try:
+            bind_arguments = self.router.read_bind() if self.router else None
+            first_seq, last_seq = self.session.execute(self._bounds_statement(), bind_arguments=bind_arguments).one()
+
+            changes = []
+            if since is not None and last_seq is not None and since < last_seq:
+                result = self.session.execute(self._changes_statement(since, limit), bind_arguments=bind_arguments)
+                changes = self._change_dicts(result)
+
+            return changes, first_seq, last_seq
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def follow(self, after: int, missing: Collection[int], limit: int) -> list[tuple[int, int]]:
+        """
+        Read the sequence number and order of the entries after `after`, or among the `missing`
+        sequence numbers, from the primary.
+
+        Args:
+            after (int): Last sequence number already seen.
+            missing (Collection[int]): Sequence numbers below `after` not seen yet.
+            limit (int): Maximum number of entries to return.
+
+        Returns:
+            list[tuple[int, int]]: `(seq, order_id)` pairs in sequence order.
+        """
+        try:
+            result = self.session.execute(self._follow_statement(after, missing, limit))
+            return [(seq, order_id) for seq, order_id in result]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def purge(self, before: datetime, batch_size: int = 1000) -> int:
+        """
+        Delete the entries written before `before`, except the newest entry of the log.
+
+        Entries are deleted by primary key ranges of `batch_size`, each in its own transaction,
+        so writers are never blocked for long.
+
+        Args:
+            before (datetime): Entries older than this UTC time are deleted.
+            batch_size (int): Number of sequence numbers deleted per transaction.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        try:
+            first_seq, last_seq = self.session.execute(self._bounds_statement()).one()
+            cutoff = self.session.execute(self._purge_cutoff_statement(before)).scalar()
+            self.session.commit()
+            if cutoff is None:
+                return 0
+
+            # The newest entry always stays: it marks the end of the log
+            cutoff = min(cutoff, last_seq - 1)
+            deleted = 0
+            lower = first_seq
+            while lower <= cutoff:
+                upper = min(lower + batch_size - 1, cutoff)
+                deleted += self.session.execute(self._purge_statement(lower, upper)).rowcount
+                self.session.commit()
+                lower = upper + 1
+
+            return deleted
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def compact(self, batch_size: int = 1000) -> int:
+        """
+        Delete the entries superseded by a newer entry of the same order.
+
+        A consumer reading after any sequence number still sees the newest entry of every order
+        changed since, so its copy ends in the same state. The oldest entry of the log is kept,
+        so compacting never makes a consumer fall behind the retention period.
+
+        Args:
+            batch_size (int): Number of entries deleted per transaction.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        try:
+            first_seq, _ = self.session.execute(self._bounds_statement()).one()
+            if first_seq is None:
+                self.session.commit()
+                return 0
+
+            deleted = 0
+            after = first_seq
+            while True:
+                seqs = list(self.session.execute(self._superseded_statement(after, batch_size)).scalars())
+                if not seqs:
+                    self.session.commit()
+                    return deleted
+
+                deleted += self.session.execute(self._compact_statement(seqs)).rowcount
+                self.session.commit()
+                after = seqs[-1]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
@@ -0,0 +1,302 @@
+import logging
+import threading
+import time
+from logging import Logger
+from typing import Type, Any, Optional, Mapping
+
+from flask import Flask
+from sqlalchemy.orm import scoped_session
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import select, or_
+
+from app.models.model import Order
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.exceptions.internal_exceptions import AppInitializationError, IndexMemoryError
+from app.interfaces.interfaces_repository import IOrderSearchRepository
+from app.utils.change_follower import ChangeFollower
+from app.utils.ngram_index import NgramIndex
+from app.utils.replica_router import ReplicaRouter
+from app.utils.utils import escape_like, result_to_dicts
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ("customer_name", "customer_email")
+
+class RepositoryOrderSearch(IOrderSearchRepository):
+    """
+    Repository class that implements "IOrderSearchRepository": substring search over the customer
+    name and email of the orders, answered by an in-process trigram index.
+
+    This class allows:
+    - Build the index from the orders table, in chunks.
+    - Catch up with the orders inserted, updated or deleted since the last build or catch-up.
+    - Search orders whose customer name or email contains a text.
+
+    Each process holds its own index. The writes of every process, this one included, are
+    read from the order change log by `follower`: a catch-up runs after the inserts and renames
+    of this process and at most every `sync_interval` seconds before a search, and re-indexes the
+    orders changed since the previous one from the primary. The follower is positioned before
+    the table is scanned, so the writes committed during a build are applied by the first
+    catch-up. Matches are read back from the database and checked again, so an order changed
+    by another process since the last catch-up is never returned by mistake.
+
+    When the index is not built yet (e.g. the table did not exist at startup), searches fall
+    back to a `LIKE '%text%'` query. So do they once the index reached its memory limit, which
+    is logged as an error; `build_search_index` refuses to start the application instead.
+
+    Attributes:
+        session: SQLAlchemy scoped session used to interact with the database.
+        model: SQLAlchemy model class representing the Order entity.
+        index: The trigram index of the customer names and emails.
+        follower: Follower of the order change log, telling which orders to re-index.
+        router: Optional router choosing the engine of the searches.
+        sync_interval: Minimum number of seconds between two catch-ups before a search.
+        chunk_size: Number of rows fetched per round trip while building the index.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+    """
+    def __init__(
+        self, session: scoped_session, model: Type[Order], index: NgramIndex, follower: ChangeFollower,
+        router: Optional[ReplicaRouter] = None, sync_interval: float = 1.0, chunk_size: int = 10000
+    ):
+        self.session = session
+        self.model = model
+        self.index = index
+        self.follower = follower
+        self.router = router
+        self.sync_interval = sync_interval
+        self.chunk_size = chunk_size
+        self._ready = False
+        self._disabled = False
+        self._last_sync = 0.0
+        self._sync_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether searches are answered by the index."""
+        return self._ready
+
+    def _read_bind(self) -> Optional[dict[str, Any]]:
+        return self.router.read_bind() if self.router else None
+
+    @staticmethod
+    def _document(customer_name: str, customer_email: str) -> str:
+        return f"{customer_name}\n{customer_email}"
+
+    def build(self) -> int:
+        """
+        (Re)build the index from every order.
+
+        Returns:
+            int: Number of indexed orders.
+
+        Raises:
+            IndexMemoryError: If the index reached its memory limit; searches then keep using the database.
+        """
+        with self._sync_lock:
+            self._ready = False
+            self.index.clear()
+            try:
+                self.follower.start()
+                indexed = self._load_all()
+            except IndexMemoryError as e:
+                self._disable(e)
+                raise
+
+            self._ready = True
+            self._last_sync = time.monotonic()
+            return indexed
+
+    def sync(self, force: bool = False) -> None:
+        """
+        Re-index the orders written since the last build or catch-up.
+
+        Args:
+            force (bool): Catch up even if the last one is more recent than `sync_interval`.
+        """
+        if not self._ready or (not force and time.monotonic() - self._last_sync < self.sync_interval):
+            return
+        # A catch-up already running in another thread covers this one
+        if not self._sync_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._last_sync = time.monotonic()
+            self._reindex(self.follower.poll())
+        except IndexMemoryError as e:
+            self._disable(e)
+        finally:
+            self._sync_lock.release()
+
+    def _load_all(self) -> int:
+        """Index every order, in id order."""
+        try:
+            smt = select(self.model.id, self.model.customer_name, self.model.customer_email).order_by(
+                self.model.id
+            ).execution_options(yield_per=self.chunk_size)
+
+            indexed = 0
+            for order_id, customer_name, customer_email in self.session.execute(smt):
+                self.index.add(order_id, self._document(customer_name, customer_email))
+                indexed += 1
+            return indexed
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def _reindex(self, order_ids: set[int]) -> None:
+        """Index the current customer name and email of the given orders, and drop the deleted ones."""
+        if not order_ids:
+            return
+
+        try:
+            ids = sorted(order_ids)
+            for start in range(0, len(ids), self.chunk_size):
+                chunk = ids[start:start + self.chunk_size]
+                smt = select(self.model.id, self.model.customer_name, self.model.customer_email).where(
+                    self.model.id.in_(chunk)
+                )
+                found = set()
+                for order_id, customer_name, customer_email in self.session.execute(smt):
+                    self.index.add(order_id, self._document(customer_name, customer_email))
+                    found.add(order_id)
+                for order_id in set(chunk) - found:
+                    self.index.remove(order_id)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def _disable(self, error: Exception) -> None:
+        self._ready = False
+        self._disabled = True
+        self.index.clear()
+        logger.error("Order search index disabled, searches will scan the database: %s", error)
+
+    def after_insert(self) -> None:
+        """Index the orders just committed. A failure is logged; the next catch-up retries."""
+        self._sync_after_write()
+
+    def after_update(self, order_id: int, changes: Mapping[str, Any]) -> None:
+        """Re-index an updated order when its customer name or email changed."""
+        if changes.keys() & set(SEARCH_COLUMNS):
+            self._sync_after_write()
+
+    def after_delete(self, order_id: int) -> None:
+        """Remove a deleted order from the index."""
+        self.index.remove(order_id)
+
+    def _sync_after_write(self) -> None:
+        try:
+            self.sync(force=True)
+        except (ConnectionError, QueryError) as e:
+            logger.warning("Failed to index the order changes: %s", e)
+
+    def search(self, text: str, limit: int) -> list[dict[str, Any]]:
+        """
+        Return up to `limit` orders whose customer name or email contains `text`, newest first.
+
+        Args:
+            text (str): Text to look for, at least as long as the n-grams; case-insensitive.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[dict[str, Any]]: The matching orders.
+        """
+        try:
+            columns = (
+                self.model.id,
+                self.model.customer_name,
+                self.model.customer_email,
+                self.model.id_product,
+                self.model.delivery_date,
+                self.model.status,
+            )
+            if not self._ready and not self._disabled:
+                # The table may not have existed at startup
+                try:
+                    self.build()
+                except IndexMemoryError:
+                    pass
+            if not self._ready:
+                pattern = f"%{escape_like(text)}%"
+                smt = select(*columns).where(or_(
+                    self.model.customer_name.ilike(pattern, escape="/"),
+                    self.model.customer_email.ilike(pattern, escape="/"),
+                )).order_by(self.model.id.desc()).limit(limit)
+                return result_to_dicts(self.session.execute(smt, bind_arguments=self._read_bind()))
+
+            self.sync()
+            needle = text.lower()
+            orders: list[dict[str, Any]] = []
+            before = None
+            # Rows changed by other processes fail the second check: look further until the page is full
+            while len(orders) < limit:
+                ids = self.index.search(text, limit - len(orders), before=before)
+                if not ids:
+                    break
+
+                smt = select(*columns).where(self.model.id.in_(ids))
+                rows = {row["id"]: row for row in result_to_dicts(self.session.execute(smt, bind_arguments=self._read_bind()))}
+                for order_id in ids:
+                    row = rows.get(order_id)
+                    if row is not None and any(needle in row[column].lower() for column in SEARCH_COLUMNS):
+                        orders.append(row)
+                before = ids[-1]
+            return orders
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+def build_search_index(app: Flask, search_repository: RepositoryOrderSearch, logger: Logger) -> None:
+    """
+    Build the order search index before the application accepts traffic.
+
+    A database failure (e.g. the orders table does not exist yet) is only logged: the index is
+    built by the first search instead.
+
+    Args:
+        app (Flask): The application whose database is indexed.
+        search_repository (RepositoryOrderSearch): The search repository to build.
+        logger (Logger): Logger used to report the outcome.
+
+    Raises:
+        AppInitializationError: If the orders do not fit in the memory limit of the index.
+    """
+    started = time.perf_counter()
+    with app.app_context():
+        try:
+            indexed = search_repository.build()
+        except (ConnectionError, QueryError) as e:
+            logger.warning("Could not build the order search index at startup: %s", e)
+            return
+        except IndexMemoryError as e:
+            raise AppInitializationError(
+                f"The order search index does not fit in ORDER_SEARCH_MAX_MEMORY_MB ({e}); "
+                "raise the limit or disable ORDER_SEARCH_ENABLED."
+            )
+
+        logger.info(
+            "Order search index built with %d orders in %.2fs (%s)",
+            indexed, time.perf_counter() - started, search_repository.index.stats()
+        )
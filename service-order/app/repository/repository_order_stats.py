@@ -0,0 +1,220 @@
+from typing import Type, Any, Optional, Mapping, MutableMapping
+
+from sqlalchemy.orm import scoped_session
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import Table, select, insert, update, delete, func
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app.models.model import Order, OrderStat
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderStatsRepository
+from app.utils.replica_router import ReplicaRouter
+
+# Dimension of the statistics and the order column that gives its key
+STATS_DIMENSIONS = {
+    "day": "delivery_date",
+    "status": "status",
+    "product": "id_product",
+}
+STATS_COLUMNS = frozenset(STATS_DIMENSIONS.values()) | {"total_amount"}
+
+Deltas = MutableMapping[tuple[str, str], tuple[int, float]]
+
+def stats_key(value: Any) -> str:
+    """Key of a dimension value in the statistics table; dates use the ISO format so keys sort by day."""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+def add_order_deltas(deltas: Deltas, order: Mapping[str, Any], sign: int) -> None:
+    """
+    Accumulate the contribution of an order to every statistics row it belongs to.
+
+    Args:
+        deltas (Deltas): Changes accumulated so far, by `(dimension, key)`.
+        order (Mapping[str, Any]): Order values; must contain the columns in `STATS_COLUMNS`.
+        sign (int): 1 when the order is added, -1 when it is removed.
+    """
+    amount = sign * (order["total_amount"] or 0)
+    for dimension, column in STATS_DIMENSIONS.items():
+        key = (dimension, stats_key(order[column]))
+        count, revenue = deltas.get(key, (0, 0.0))
+        deltas[key] = (count + sign, revenue + amount)
+
+def stats_rows(deltas: Mapping[tuple[str, str], tuple[int, float]]) -> list[dict[str, Any]]:
+    """Turn accumulated changes into the rows of a statistics upsert, skipping the empty ones."""
+    return [
+        {"dimension": dimension, "key": key, "orders": count, "revenue": round(revenue, 2)}
+        for (dimension, key), (count, revenue) in deltas.items()
+        if count or revenue
+    ]
+
+def stats_upsert(dialect: str, table: Table) -> Optional[Insert]:
+    """
+    Build the atomic upsert adding a row's `orders` and `revenue` to the existing ones.
+
+    Args:
+        dialect (str): Name of the database dialect.
+        table (Table): The statistics table.
+
+    Returns:
+        Optional[Insert]: `INSERT ... ON DUPLICATE KEY UPDATE` on MySQL, `INSERT ... ON CONFLICT
+        DO UPDATE` on SQLite and PostgreSQL, None for dialects without an upsert.
+    """
+    if dialect == "mysql":
+        smt = mysql.insert(table)
+        return smt.on_duplicate_key_update(
+            orders=table.c.orders + smt.inserted.orders,
+            revenue=table.c.revenue + smt.inserted.revenue,
+        )
+
+    if dialect in ("sqlite", "postgresql"):
+        smt = (sqlite.insert if dialect == "sqlite" else postgresql.insert)(table)
+        return smt.on_conflict_do_update(
+            index_elements=[table.c.dimension, table.c.key],
+            set_={"orders": table.c.orders + smt.excluded.orders, "revenue": table.c.revenue + smt.excluded.revenue},
+        )
+
+    return None
+
+class RepositoryOrderStats(IOrderStatsRepository):
+    """
+    Repository class that implements "IOrderStatsRepository" and maintains the pre-aggregated
+    order statistics (`order_stats`).
+
+    This class allows:
+    - Apply the changes of an order write, within the caller's transaction (no commit).
+    - Read the statistics of one dimension, optionally within a key range.
+    - Rebuild every statistic from the orders table.
+
+    Changes are applied with one atomic upsert per statement (`INSERT ... ON DUPLICATE KEY UPDATE`
+    on MySQL, `INSERT ... ON CONFLICT DO UPDATE` on SQLite and PostgreSQL), so concurrent writers
+    never lose increments.
+
+    Attributes:
+        session: SQLAlchemy scoped session used to interact with the database.
+        model: SQLAlchemy model class of the statistics table.
+        order_model: SQLAlchemy model class of the orders, used to rebuild the statistics.
+        router: Optional router choosing the engine of each read.
+
+    Error Handling:
+        Each method handles and raises appropriate exceptions:
+        - ConnectionError: When database connection fails.
+        - QueryError: For generic SQL execution issues.
+    """
+    def __init__(self, session: scoped_session, model: Type[OrderStat], order_model: Type[Order], router: Optional[ReplicaRouter] = None):
+        self.session = session
+        self.model = model
+        self.order_model = order_model
+        self.router = router
+
+    def apply(self, deltas: Mapping[tuple[str, str], tuple[int, float]]) -> None:
+        """
+        Add the accumulated changes to the statistics rows, creating the missing ones.
+
+        The statement runs in the session's current transaction; the caller commits it together
+        with the order write.
+
+        Args:
+            deltas (Mapping[tuple[str, str], tuple[int, float]]): Order count and revenue changes by `(dimension, key)`.
+        """
+        rows = stats_rows(deltas)
+        if not rows:
+            return
+
+        try:
+            smt = stats_upsert(self.session.get_bind(mapper=self.model).dialect.name, self.model.__table__)
+            if smt is None:
+                self._apply_portable(rows)
+                return
+
+            self.session.execute(smt, rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def _apply_portable(self, rows: list[dict[str, Any]]) -> None:
+        """Fallback for dialects without an upsert: update each row, inserting it when missing."""
+        for row in rows:
+            smt = update(self.model).where(
+                self.model.dimension == row["dimension"], self.model.key == row["key"]
+            ).values(orders=self.model.orders + row["orders"], revenue=self.model.revenue + row["revenue"])
+
+            if not self.session.execute(smt.execution_options(synchronize_session=False)).rowcount:
+                self.session.execute(insert(self.model), [row])
+
+    def get_stats(self, dimension: str, key_from: Optional[str] = None, key_to: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Read the statistics of one dimension through the primary key, skipping empty rows.
+
+        Args:
+            dimension (str): 'day', 'status' or 'product'.
+            key_from (Optional[str]): Smallest key to include.
+            key_to (Optional[str]): Largest key to include.
+
+        Returns:
+            list[dict[str, Any]]: `key`, `orders` and `revenue` of each row, ordered by key.
+        """
+        try:
+            smt = select(self.model.key, self.model.orders, self.model.revenue).where(
+                self.model.dimension == dimension, self.model.orders != 0
+            )
+            if key_from is not None:
+                smt = smt.where(self.model.key >= key_from)
+            if key_to is not None:
+                smt = smt.where(self.model.key <= key_to)
+
+            bind_arguments = self.router.read_bind() if self.router else None
+            rows = self.session.execute(smt.order_by(self.model.key), bind_arguments=bind_arguments).all()
+            return [{"key": key, "orders": orders, "revenue": revenue} for key, orders, revenue in rows]
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
+
+    def rebuild(self) -> int:
+        """
+        Recompute every statistic from the orders table in a single transaction.
+
+        Meant for backfills and repairs. Writes that commit while the rebuild runs may be counted
+        twice or missed, so run it while the service is idle.
+
+        Returns:
+            int: Number of statistics rows written.
+        """
+        try:
+            self.session.execute(delete(self.model))
+
+            rows = []
+            for dimension, column_name in STATS_DIMENSIONS.items():
+                column = getattr(self.order_model, column_name)
+                smt = select(column, func.count(), func.coalesce(func.sum(self.order_model.total_amount), 0)).group_by(column)
+                rows.extend(
+                    {"dimension": dimension, "key": stats_key(value), "orders": count, "revenue": round(float(revenue), 2)}
+                    for value, count, revenue in self.session.execute(smt)
+                )
+
+            if rows:
+                self.session.execute(insert(self.model), rows)
+            self.session.commit()
+
+            return len(rows)
+
+        except OperationalError as e:
+            raise ConnectionError("Failed to connect to the database")
+
+        except (ProgrammingError, SQLAlchemyError) as e:
+            raise QueryError("Database query failed")
+
+        except Exception as e:
+            raise
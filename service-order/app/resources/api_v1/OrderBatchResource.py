@@ -0,0 +1,64 @@
+import logging
+from typing import Any
+
+from flask_restful import Resource
+from flask import request
+from pydantic import ValidationError
+
+from ..succes_response import wrap_success_response
+from app.exceptions.api_exceptions import BadRequestError
+from app.exceptions.pydantic_exceptions import PydanticValidationError
+from app.schema.schema_order import SchemaOrderPost
+from app.services.ServiceOrder import ServiceOrder
+
+logger = logging.getLogger(__name__)
+
+class OrderBatchResource(Resource):
+    """
+    RESTful API resource that creates many orders in a single request (POST).
+
+    The body must be a JSON list of orders with the same shape as `POST /orders`. Every item is
+    validated in one pass and the valid ones are inserted in a single transaction. The response
+    holds one result per item (`index`, `status` and, for failures, the error details), so
+    invalid items are reported without aborting the valid ones.
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+        schema_post: Validation schema applied to every order of the batch.
+
+    Decorators:
+        Each method uses `@wrap_success_response` to standardize the structure of successful responses.
+    """
+
+    def __init__(self, order_service: ServiceOrder, schema_post: type[SchemaOrderPost]):
+        self.order_service = order_service
+        self.schema_post = schema_post
+
+    @wrap_success_response("Orders batch processed successfully")
+    def post(self) -> list[dict[str, Any]]:
+        try:
+            payload = request.get_json()
+            if not isinstance(payload, list) or not payload:
+                raise BadRequestError("The request body must be a non-empty list of orders.")
+            # Refuse an oversized body before validating any of its items
+            self.order_service.check_batch_size(len(payload))
+
+            results: list[dict[str, Any]] = [{} for _ in payload]
+            valid_indexes = []
+            valid_orders = []
+
+            for index, item in enumerate(payload):
+                try:
+                    valid_orders.append(self.schema_post.model_validate(item).model_dump(exclude_unset=True))
+                    valid_indexes.append(index)
+                except ValidationError as e:
+                    results[index] = {"index": index, "status": "error", "errors": PydanticValidationError(e).details}
+
+            for index, outcome in zip(valid_indexes, self.order_service.add_orders(valid_orders)):
+                results[index] = {"index": index, **outcome}
+
+            return results
+        
+        except Exception as e:
+            logger.error("Error creating orders batch: %s", e)
+            raise
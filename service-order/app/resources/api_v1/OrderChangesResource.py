@@ -0,0 +1,48 @@
+import logging
+
+from flask_restful import Resource
+from flask import request
+from pydantic import ValidationError
+
+from ..succes_response import wrap_success_response
+from app.exceptions.pydantic_exceptions import PydanticValidationError
+from app.schema.schema_order import SchemaOrderChanges
+from app.services.ServiceOrder import ServiceOrder
+from app.utils.pagination import ChangePage
+
+logger = logging.getLogger(__name__)
+
+class OrderChangesResource(Resource):
+    """
+    RESTful API resource that serves the order change feed (GET).
+
+    `GET /orders/changes?since=<seq>&limit=` returns the inserts, updates and deletes recorded
+    after the sequence number `since`, oldest first, each with the current state of its order.
+    Consumers keep `pagination.next_since` and poll with it, so a sync reads only what changed.
+    A `since` older than the retained log is answered with `410 Gone`.
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+        schema_changes: Validation schema for the query parameters.
+
+    Decorators:
+        Each method uses `@wrap_success_response` to standardize the structure of successful responses.
+    """
+
+    def __init__(self, order_service: ServiceOrder, schema_changes: type[SchemaOrderChanges]):
+        self.order_service = order_service
+        self.schema_changes = schema_changes
+
+    @wrap_success_response("Order changes retrieved successfully")
+    def get(self) -> ChangePage:
+        try:
+            query = self.schema_changes(**request.args.to_dict())
+            return self.order_service.get_order_changes(query.since, query.limit)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error retrieving order changes: %s", e)
+            raise
@@ -28,13 +28,24 @@ class OrderDetailResource(Resource):
 
     Decorators:
         Each method uses `@wrap_success_response` to standardize the success response.
+        `GET` builds its ETag from the order's row version, so a matching `If-None-Match`
+        gets a `304 Not Modified` without loading the order.
     """
     def __init__(self, order_service: ServiceOrder, schema_put: type[SchemaOrderPut], schema_id: type[SchemaOrderId]):
         self.order_service = order_service
         self.schema_put = schema_put
         self.schema_id = schema_id
 
-    @wrap_success_response("Order retrieved successfully")
+    def order_etag(self, order_id: int) -> str:
+        # Runs before `get`, so an invalid id is refused here with the same 422 as the view
+        try:
+            id_validated = self.schema_id(order_id=order_id)
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+        return self.order_service.get_order_etag(id_validated.order_id)
+
+    @wrap_success_response("Order retrieved successfully", etag=order_etag)
     def get(self, order_id: int) -> dict[str, Any]:
         try:
             id_validated = self.schema_id(order_id=order_id)
@@ -1,14 +1,15 @@
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 from flask_restful import Resource
-from flask import request
+from flask import Response, current_app, request, stream_with_context
 from pydantic import ValidationError
 
 from ..succes_response import wrap_success_response
 from app.exceptions.pydantic_exceptions import PydanticValidationError
-from app.schema.schema_order import SchemaOrderPost
+from app.schema.schema_order import SchemaOrderPost, SchemaOrderPage
 from app.services.ServiceOrder import ServiceOrder
+from app.utils.pagination import Page
 
 logger = logging.getLogger(__name__)
 
@@ -17,29 +18,67 @@ class OrderListResource(Resource):
     RESTful API resource that manages operations on the request collection (GET, POST).
 
     This class allows:
-    - List all existing orders (`GET`).
+    - List orders page by page with `?limit=&after=&sort=` (`GET`, keyset pagination), filtered by
+      `status`, `id_product`, `customer` (name prefix) and `delivery_from`/`delivery_to`. Without
+      parameters the first page of the default size is returned.
+    - Export every order as newline-delimited JSON (`GET` with `Accept: application/x-ndjson`).
     - Create a new order (`POST`).
 
     Attributes:
         order_service: Service that encapsulates the business logic for order management.
         schema_post: Validation schema for the creation of a new order.
+        schema_page: Validation schema for the pagination and filter query parameters.
 
     Decorators:
         Each method uses `@wrap_success_response` to standardize the structure of successful responses.
     """
 
-    def __init__(self, order_service: ServiceOrder, schema_post: type[SchemaOrderPost]):
+    NDJSON_MIMETYPE = 'application/x-ndjson'
+
+    def __init__(self, order_service: ServiceOrder, schema_post: type[SchemaOrderPost], schema_page: type[SchemaOrderPage]):
         self.order_service = order_service
         self.schema_post = schema_post
+        self.schema_page = schema_page
 
     @wrap_success_response("Orders retrieved successfully")
-    def get(self) -> list[dict[str, Any]]:
+    def get(self) -> Page | Response:
         try:
-            return self.order_service.get_all_order()
+            if request.accept_mimetypes.best_match(['application/json', self.NDJSON_MIMETYPE]) == self.NDJSON_MIMETYPE:
+                return self._ndjson_response(self.order_service.stream_orders())
+
+            # Any query parameter goes through the whitelist; the JSON list is always paginated,
+            # so its size stays bounded. The whole table is only served by the NDJSON export
+            page = self.schema_page(**request.args.to_dict())
+            return self.order_service.get_orders_page(page.limit, page.after, page.sort, page.filters())
+        
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+        
         except Exception as e:
             logger.error("Error retrieving orders: %s", e, exc_info=True)
             raise
 
+    def _ndjson_response(self, orders: Iterator[dict[str, Any]]) -> Response:
+        """
+        Build a streamed response that writes each order as one JSON line as soon as it is read.
+
+        Args:
+            orders (Iterator[dict[str, Any]]): Lazy iterator over the orders to export.
+
+        Returns:
+            Response: Streaming `application/x-ndjson` response.
+        """
+        def generate() -> Iterator[str]:
+            try:
+                for order in orders:
+                    yield current_app.json.dumps(order) + "\n"
+            except Exception as e:
+                # Headers are already sent, so the error can only be logged and the stream cut short
+                logger.error("Error streaming orders: %s", e, exc_info=True)
+
+        return Response(stream_with_context(generate()), mimetype=self.NDJSON_MIMETYPE)
+
     @wrap_success_response("Order created successfully")
     def post(self) -> None:
         try:
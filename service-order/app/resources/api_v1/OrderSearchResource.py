@@ -0,0 +1,47 @@
+import logging
+from typing import Any
+
+from flask_restful import Resource
+from flask import request
+from pydantic import ValidationError
+
+from ..succes_response import wrap_success_response
+from app.exceptions.pydantic_exceptions import PydanticValidationError
+from app.schema.schema_order import SchemaOrderSearch
+from app.services.ServiceOrder import ServiceOrder
+
+logger = logging.getLogger(__name__)
+
+class OrderSearchResource(Resource):
+    """
+    RESTful API resource that searches orders by customer (GET).
+
+    `GET /orders/search?q=<text>&limit=` returns the newest orders whose customer name or email
+    contains `text`, case-insensitively. Searches are answered by an in-memory trigram index,
+    so their cost does not grow with the size of the orders table.
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+        schema_search: Validation schema for the query parameters.
+
+    Decorators:
+        Each method uses `@wrap_success_response` to standardize the structure of successful responses.
+    """
+
+    def __init__(self, order_service: ServiceOrder, schema_search: type[SchemaOrderSearch]):
+        self.order_service = order_service
+        self.schema_search = schema_search
+
+    @wrap_success_response("Orders retrieved successfully")
+    def get(self) -> list[dict[str, Any]]:
+        try:
+            query = self.schema_search(**request.args.to_dict())
+            return self.order_service.search_orders(query.q, query.limit)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error searching orders: %s", e)
+            raise
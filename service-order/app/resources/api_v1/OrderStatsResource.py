@@ -0,0 +1,47 @@
+import logging
+from typing import Any
+
+from flask_restful import Resource
+from flask import request
+from pydantic import ValidationError
+
+from ..succes_response import wrap_success_response
+from app.exceptions.pydantic_exceptions import PydanticValidationError
+from app.schema.schema_order import SchemaOrderStats
+from app.services.ServiceOrder import ServiceOrder
+
+logger = logging.getLogger(__name__)
+
+class OrderStatsResource(Resource):
+    """
+    RESTful API resource that serves the pre-aggregated order statistics (GET).
+
+    `GET /orders/stats?dimension=day|status|product` returns the number of orders and the revenue
+    per key of the dimension; the `day` dimension accepts `delivery_from`/`delivery_to`. The
+    statistics are kept up to date by every order write, so the orders table is not scanned.
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+        schema_stats: Validation schema for the query parameters.
+
+    Decorators:
+        Each method uses `@wrap_success_response` to standardize the structure of successful responses.
+    """
+
+    def __init__(self, order_service: ServiceOrder, schema_stats: type[SchemaOrderStats]):
+        self.order_service = order_service
+        self.schema_stats = schema_stats
+
+    @wrap_success_response("Order statistics retrieved successfully")
+    def get(self) -> list[dict[str, Any]]:
+        try:
+            query = self.schema_stats(**request.args.to_dict())
+            return self.order_service.get_order_stats(query.dimension, query.delivery_from, query.delivery_to)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error retrieving order statistics: %s", e)
+            raise
@@ -32,17 +32,61 @@ def register_resources(api: Api, service: ServiceOrder) -> None:
     """
     from .OrderListResource import OrderListResource
     from .OrderDetailResource import OrderDetailResource
-    from app.schema.schema_order import SchemaOrderPost, SchemaOrderPut, SchemaOrderId
+    from .OrderBatchResource import OrderBatchResource
+    from .OrderStatsResource import OrderStatsResource
+    from .OrderSearchResource import OrderSearchResource
+    from .OrderChangesResource import OrderChangesResource
+    from app.schema.schema_order import (
+        SchemaOrderPost, SchemaOrderPut, SchemaOrderId, SchemaOrderPage, SchemaOrderStats, SchemaOrderSearch,
+        SchemaOrderChanges
+    )
 
     api.add_resource(
         OrderListResource, 
         '/orders', 
+        resource_class_kwargs={
+            'order_service': service, 
+            'schema_post': SchemaOrderPost,
+            'schema_page': SchemaOrderPage
+        }
+    )
+
+    api.add_resource(
+        OrderBatchResource, 
+        '/orders/batch', 
         resource_class_kwargs={
             'order_service': service, 
             'schema_post': SchemaOrderPost
         }
     )
 
+    api.add_resource(
+        OrderStatsResource, 
+        '/orders/stats', 
+        resource_class_kwargs={
+            'order_service': service, 
+            'schema_stats': SchemaOrderStats
+        }
+    )
+
+    api.add_resource(
+        OrderSearchResource, 
+        '/orders/search', 
+        resource_class_kwargs={
+            'order_service': service, 
+            'schema_search': SchemaOrderSearch
+        }
+    )
+
+    api.add_resource(
+        OrderChangesResource, 
+        '/orders/changes', 
+        resource_class_kwargs={
+            'order_service': service, 
+            'schema_changes': SchemaOrderChanges
+        }
+    )
+
     api.add_resource(
         OrderDetailResource, 
         '/orders/<int:order_id>', 
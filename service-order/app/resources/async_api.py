@@ -0,0 +1,266 @@
+"""
+Async (ASGI) API blueprint.
+
+This module builds the Quart blueprint of the async application, which serves the same `/orders` routes,
+request validation and response envelopes as the Flask-RESTful API of `api_v1`, on top of
+`AsyncServiceOrder`. Search (`/orders/search`) is only served by the synchronous application.
+"""
+
+import logging
+from typing import Any, AsyncIterator
+
+from pydantic import ValidationError
+from quart import Blueprint, Response, current_app, jsonify, request
+from quart.views import MethodView
+
+from .async_response import wrap_success_response
+from .error_handler import error_body
+from app.exceptions.api_exceptions import BadRequestError
+from app.exceptions.pydantic_exceptions import PydanticValidationError
+from app.schema.schema_order import (
+    SchemaOrderPost, SchemaOrderPut, SchemaOrderId, SchemaOrderPage, SchemaOrderStats, SchemaOrderChanges
+)
+from app.services.async_service_order import AsyncServiceOrder
+from app.utils.pagination import ChangePage, Page
+
+logger = logging.getLogger(__name__)
+
+async def handle_async_exception(e: Exception) -> Response:
+    """Global error handler of the async application; same JSON error structure as `handle_http_exception`."""
+    body, status_code = error_body(e)
+    if status_code == 500:
+        logger.error("Unhandled error: %s", e, exc_info=e)
+
+    response = jsonify(body)
+    response.status_code = status_code
+    return response
+
+class AsyncOrderListResource(MethodView):
+    """
+    Async counterpart of `OrderListResource`: paginated list, NDJSON export (GET) and creation (POST).
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+    """
+
+    NDJSON_MIMETYPE = 'application/x-ndjson'
+
+    def __init__(self, order_service: AsyncServiceOrder):
+        self.order_service = order_service
+
+    @wrap_success_response("Orders retrieved successfully")
+    async def get(self) -> Page | Response:
+        try:
+            if request.accept_mimetypes.best_match(['application/json', self.NDJSON_MIMETYPE]) == self.NDJSON_MIMETYPE:
+                return self._ndjson_response(await self.order_service.stream_orders())
+
+            # Any query parameter goes through the whitelist; the JSON list is always paginated
+            page = SchemaOrderPage(**request.args.to_dict())
+            return await self.order_service.get_orders_page(page.limit, page.after, page.sort, page.filters())
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error retrieving orders: %s", e, exc_info=True)
+            raise
+
+    def _ndjson_response(self, orders: AsyncIterator[dict[str, Any]]) -> Response:
+        """Build a streamed response that writes each order as one JSON line as soon as it is read."""
+        dumps = current_app.json.dumps
+
+        async def generate() -> AsyncIterator[str]:
+            try:
+                async for order in orders:
+                    yield dumps(order) + "\n"
+            except Exception as e:
+                # Headers are already sent, so the error can only be logged and the stream cut short
+                logger.error("Error streaming orders: %s", e, exc_info=True)
+
+        return Response(generate(), mimetype=self.NDJSON_MIMETYPE)
+
+    @wrap_success_response("Order created successfully")
+    async def post(self) -> None:
+        try:
+            order_data = SchemaOrderPost(**(await request.get_json())).model_dump(exclude_unset=True)
+            if await self.order_service.add_Order(order_data):
+                return None
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error creating order: %s", e)
+            raise
+
+class AsyncOrderBatchResource(MethodView):
+    """
+    Async counterpart of `OrderBatchResource`: creates many orders in a single request (POST).
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+    """
+    def __init__(self, order_service: AsyncServiceOrder):
+        self.order_service = order_service
+
+    @wrap_success_response("Orders batch processed successfully")
+    async def post(self) -> list[dict[str, Any]]:
+        try:
+            payload = await request.get_json()
+            if not isinstance(payload, list) or not payload:
+                raise BadRequestError("The request body must be a non-empty list of orders.")
+            # Refuse an oversized body before validating any of its items
+            self.order_service.check_batch_size(len(payload))
+
+            results: list[dict[str, Any]] = [{} for _ in payload]
+            valid_indexes = []
+            valid_orders = []
+
+            for index, item in enumerate(payload):
+                try:
+                    valid_orders.append(SchemaOrderPost.model_validate(item).model_dump(exclude_unset=True))
+                    valid_indexes.append(index)
+                except ValidationError as e:
+                    results[index] = {"index": index, "status": "error", "errors": PydanticValidationError(e).details}
+
+            for index, outcome in zip(valid_indexes, await self.order_service.add_orders(valid_orders)):
+                results[index] = {"index": index, **outcome}
+
+            return results
+
+        except Exception as e:
+            logger.error("Error creating orders batch: %s", e)
+            raise
+
+class AsyncOrderStatsResource(MethodView):
+    """
+    Async counterpart of `OrderStatsResource`: serves the pre-aggregated order statistics (GET).
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+    """
+    def __init__(self, order_service: AsyncServiceOrder):
+        self.order_service = order_service
+
+    @wrap_success_response("Order statistics retrieved successfully")
+    async def get(self) -> list[dict[str, Any]]:
+        try:
+            query = SchemaOrderStats(**request.args.to_dict())
+            return await self.order_service.get_order_stats(query.dimension, query.delivery_from, query.delivery_to)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error retrieving order statistics: %s", e)
+            raise
+
+class AsyncOrderChangesResource(MethodView):
+    """
+    Async counterpart of `OrderChangesResource`: serves the order change feed (GET).
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for order management.
+    """
+    def __init__(self, order_service: AsyncServiceOrder):
+        self.order_service = order_service
+
+    @wrap_success_response("Order changes retrieved successfully")
+    async def get(self) -> ChangePage:
+        try:
+            query = SchemaOrderChanges(**request.args.to_dict())
+            return await self.order_service.get_order_changes(query.since, query.limit)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Error retrieving order changes: %s", e)
+            raise
+
+class AsyncOrderDetailResource(MethodView):
+    """
+    Async counterpart of `OrderDetailResource`: read (GET, with a row-version ETag), update (PUT)
+    and delete (DELETE) one order.
+
+    Attributes:
+        order_service: Service that encapsulates the business logic for orders.
+    """
+    def __init__(self, order_service: AsyncServiceOrder):
+        self.order_service = order_service
+
+    async def order_etag(self, order_id: int) -> str:
+        # Runs before `get`, so an invalid id is refused here with the same 422 as the view
+        try:
+            id_validated = SchemaOrderId(order_id=order_id)
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+        return await self.order_service.get_order_etag(id_validated.order_id)
+
+    @wrap_success_response("Order retrieved successfully", etag=order_etag)
+    async def get(self, order_id: int) -> dict[str, Any]:
+        try:
+            id_validated = SchemaOrderId(order_id=order_id)
+            return await self.order_service.get_order(id_validated.order_id)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Handled API error: %s", e)
+            raise
+
+    @wrap_success_response("Order update successfully")
+    async def put(self, order_id: int) -> None:
+        try:
+            id_validated = SchemaOrderId(order_id=order_id)
+            order_data = SchemaOrderPut(**(await request.get_json())).model_dump(exclude_unset=True)
+            if await self.order_service.update_order(id_validated.order_id, order_data):
+                return None
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Handled API error: %s", e, exc_info=True)
+            raise
+
+    @wrap_success_response("Order eliminated successfully")
+    async def delete(self, order_id: int) -> None:
+        try:
+            id_validated = SchemaOrderId(order_id=order_id)
+            if await self.order_service.delete_order(id_validated.order_id):
+                return None
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e.errors())
+            raise PydanticValidationError(e)
+
+        except Exception as e:
+            logger.error("Handled API error: %s", e, exc_info=True)
+            raise
+
+def create_async_api_blueprint(service: AsyncServiceOrder) -> Blueprint:
+    """
+    Build the async API blueprint, injecting the domain service into each view.
+
+    Args:
+        service (AsyncServiceOrder): Domain service with business logic for orders.
+
+    Returns:
+        Blueprint: The blueprint serving the `/orders` routes.
+    """
+    blueprint = Blueprint('async_api', __name__)
+    blueprint.add_url_rule('/orders', view_func=AsyncOrderListResource.as_view('orders', service))
+    blueprint.add_url_rule('/orders/batch', view_func=AsyncOrderBatchResource.as_view('orders_batch', service))
+    blueprint.add_url_rule('/orders/stats', view_func=AsyncOrderStatsResource.as_view('orders_stats', service))
+    blueprint.add_url_rule('/orders/changes', view_func=AsyncOrderChangesResource.as_view('orders_changes', service))
+    blueprint.add_url_rule('/orders/<int:order_id>', view_func=AsyncOrderDetailResource.as_view('order_detail', service))
+    return blueprint
@@ -0,0 +1,72 @@
+from functools import wraps
+import logging
+from typing import Awaitable, Callable, Optional, ParamSpec
+
+from quart import jsonify, request, Response
+
+from app.resources.succes_response import CONDITIONAL_METHODS
+from app.utils.pagination import Page
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+
+def wrap_success_response(
+    message: str,
+    status_code: int = 200,
+    etag: Optional[Callable[..., Awaitable[str]]] = None
+) -> Callable[[Callable[P, Awaitable[object]]], Callable[P, Awaitable[Response]]]:
+    """
+    Async (Quart) counterpart of `app.resources.succes_response.wrap_success_response`.
+
+    Builds the same success envelope, pagination metadata and conditional GET handling around
+    a coroutine view. The `etag` callable, if given, is a coroutine too.
+
+    Args:
+        message (str): Success message to be included in the response.
+        status_code (int, optional): HTTP status code to return. Default is 200.
+        etag (Callable[..., Awaitable[str]], optional): Coroutine computing the entity tag from the view arguments.
+
+    Returns:
+        Callable: Decorator function that wraps the original coroutine and returns
+        a standard JSON response with the data produced by that coroutine.
+    """
+    def decorator(func: Callable[P, Awaitable[object]]) -> Callable[P, Awaitable[Response]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Response:
+            conditional = request.method in CONDITIONAL_METHODS
+            tag = None
+            if conditional and etag is not None:
+                tag = await etag(*args, **kwargs)
+                if request.if_none_match.contains_weak(tag):
+                    not_modified = Response("", status=304)
+                    not_modified.set_etag(tag)
+                    return not_modified
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            logger.debug("Success: %s | Status: %d", message, status_code)
+            body = {
+                "status": "success",
+                "message": message,
+                "data": result if result is not None else {},
+                "status_code": status_code
+            }
+            if isinstance(result, Page):
+                body["data"] = result.items
+                body["pagination"] = result.meta()
+
+            response = jsonify(body)
+            response.status_code = status_code
+            if conditional:
+                if tag is not None:
+                    response.set_etag(tag)
+                else:
+                    await response.add_etag()
+                await response.make_conditional(request)
+
+            return response
+        return wrapper
+    return decorator
@@ -1,3 +1,5 @@
+from typing import Any
+
 from flask import jsonify, make_response
 from flask.wrappers import Response
 from werkzeug.exceptions import HTTPException
@@ -25,13 +27,28 @@ def handle_http_exception(e: Exception) -> Response:
         Response: A Flask Response object containing a standardized JSON error structure.
     """
 
+    body, status_code = error_body(e)
+    return make_response(jsonify(body), status_code)
+
+def error_body(e: Exception) -> tuple[dict[str, Any], int]:
+    """
+    Build the standardized JSON error structure of an exception and its status code.
+
+    Shared by the Flask error handler and the async (ASGI) application.
+
+    Args:
+        e (Exception): The exception instance raised during request processing.
+
+    Returns:
+        tuple[dict[str, Any], int]: The error body and the HTTP status code.
+    """
     if isinstance(e, PydanticValidationError):
-        return make_response(jsonify({
+        return {
             "status": "error",
             "message": e.message,
             "errors": e.details,
             "status_code": e.status_code
-        }), e.status_code)
+        }, e.status_code
 
     exception_handlers = {
         HTTPException: lambda err: (err.code, err.description),
@@ -42,16 +59,15 @@ def handle_http_exception(e: Exception) -> Response:
     for exc_type, handler in exception_handlers.items():
         if isinstance(e, exc_type):
             status_code, message = handler(e)
-            response = {
+            return {
                 "status": "error",
                 "message": message,
                 "status_code": status_code
-            }
-            return make_response(jsonify(response), status_code)
+            }, status_code
 
     # Fallback for unexpected exceptions
-    return make_response(jsonify({
+    return {
         "status": "error",
         "message": "Internal server error",
         "status_code": 500
-    }), 500)
+    }, 500
@@ -1,23 +1,40 @@
 from functools import wraps
 import logging
-from typing import Callable, ParamSpec
+from typing import Callable, Optional, ParamSpec
 
-from flask import jsonify, make_response, Response
+from flask import jsonify, make_response, request, Response
+
+from app.utils.pagination import Page
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 
-def wrap_success_response(message: str, status_code: int = 200) -> Callable[[Callable[P, object]], Callable[P, Response]]:
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+def wrap_success_response(
+    message: str,
+    status_code: int = 200,
+    etag: Optional[Callable[..., str]] = None
+) -> Callable[[Callable[P, object]], Callable[P, Response]]:
     """
     Decorator that wraps a Flask view function to standardize 
     the JSON response on success.
 
-    It also logs a success message in the application log.
+    It also logs a success message in the application log at DEBUG level. When the view returns a `Page`,
+    its items are used as `data` and the pagination metadata (including the opaque
+    `next_cursor`) is added to the envelope under `pagination`. A `Response` returned by the
+    view (e.g. a streamed export) is passed through untouched.
+
+    GET responses carry a strong `ETag` and are answered with `304 Not Modified` when it matches
+    the request's `If-None-Match`. If an `etag` callable is given, it receives the view arguments
+    and must return the tag cheaply (e.g. from a row version), so a matching request is answered
+    before the view runs and nothing is serialized. Otherwise the tag is a hash of the body.
 
     Args:
         message (str): Success message to be included in the response.
         status_code (int, optional): HTTP status code to return. Default is 200.
+        etag (Callable[..., str], optional): Function computing the entity tag from the view arguments.
 
     Returns:
         Callable: Decorator function that wraps the original function and returns 
@@ -26,14 +43,38 @@ def wrap_success_response(message: str, status_code: int = 200) -> Callable[[Cal
     def decorator(func: Callable[P, object]) -> Callable[P, Response]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Response:
+            conditional = request.method in CONDITIONAL_METHODS
+            tag = None
+            if conditional and etag is not None:
+                tag = etag(*args, **kwargs)
+                if request.if_none_match.contains_weak(tag):
+                    not_modified = Response(status=304)
+                    not_modified.set_etag(tag)
+                    return not_modified
+
             result = func(*args, **kwargs)
-            logger.info("Success: %s | Status: %d", message, status_code)
-            response = jsonify({
+            if isinstance(result, Response):
+                return result
+
+            logger.debug("Success: %s | Status: %d", message, status_code)
+            body = {
                 "status": "success",
                 "message": message,
                 "data": result if result is not None else {},
                 "status_code": status_code
-            })
-            return make_response(response, status_code)
+            }
+            if isinstance(result, Page):
+                body["data"] = result.items
+                body["pagination"] = result.meta()
+
+            response = make_response(jsonify(body), status_code)
+            if conditional:
+                if tag is not None:
+                    response.set_etag(tag)
+                else:
+                    response.add_etag()
+                response.make_conditional(request)
+
+            return response
         return wrapper
     return decorator
\ No newline at end of file
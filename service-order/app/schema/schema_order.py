@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import Any, ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, model_validator
 
 class BaseOrderSchema(BaseModel):
     """
@@ -55,4 +55,94 @@ class SchemaOrderId(BaseModel):
     Fields:
         order_id (int): Unique identifier of the order (must be > 0).
     """
-    order_id: int = Field(..., gt=0)
\ No newline at end of file
+    order_id: int = Field(..., gt=0)
+
+class SchemaOrderPage(BaseModel):
+    """
+    Schema for validating the query parameters of the order list: keyset pagination and filters.
+
+    Only the fields below are accepted; any other parameter is rejected, so a list query can only
+    filter on indexed columns.
+
+    Fields:
+        limit (Optional[int]): Requested page size (must be > 0). The server caps it to its maximum page size.
+        after (Optional[str]): Opaque cursor returned as `next_cursor` by the previous page.
+        sort (str): Keyset used to order the rows, 'id' or 'delivery_date' (ties broken by id),
+            prefixed with '-' for descending order.
+        status (Optional[str]): Only orders in this status.
+        id_product (Optional[int]): Only orders of this product (must be > 0).
+        customer (Optional[str]): Only orders whose customer name starts with this prefix.
+        delivery_from (Optional[date]): Only orders delivered on or after this date.
+        delivery_to (Optional[date]): Only orders delivered on or before this date.
+    """
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
+    FILTERS: ClassVar[tuple[str, ...]] = ('status', 'id_product', 'customer', 'delivery_from', 'delivery_to')
+
+    limit: Optional[int] = Field(None, gt=0)
+    after: Optional[str] = Field(None, min_length=1, max_length=200)
+    sort: Literal['id', 'delivery_date', '-id', '-delivery_date'] = 'id'
+    status: Optional[Literal['pending', 'recived', 'ready']] = None
+    id_product: Optional[int] = Field(None, gt=0)
+    customer: Optional[str] = Field(None, min_length=1, max_length=100)
+    delivery_from: Optional[date] = None
+    delivery_to: Optional[date] = None
+
+    @model_validator(mode='after')
+    def check_delivery_range(self) -> "SchemaOrderPage":
+        if self.delivery_from and self.delivery_to and self.delivery_from > self.delivery_to:
+            raise ValueError("delivery_from must not be later than delivery_to")
+        return self
+
+    def filters(self) -> dict[str, Any]:
+        """Return the filters that were given, by name."""
+        return {name: getattr(self, name) for name in self.FILTERS if getattr(self, name) is not None}
+
+class SchemaOrderStats(BaseModel):
+    """
+    Schema for validating the query parameters of the order statistics.
+
+    Fields:
+        dimension (str): Grouping of the statistics: 'day' (delivery date), 'status' or 'product'.
+        delivery_from (Optional[date]): First delivery day to include ('day' dimension only).
+        delivery_to (Optional[date]): Last delivery day to include ('day' dimension only).
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    dimension: Literal['day', 'status', 'product'] = 'day'
+    delivery_from: Optional[date] = None
+    delivery_to: Optional[date] = None
+
+    @model_validator(mode='after')
+    def check_delivery_range(self) -> "SchemaOrderStats":
+        if self.delivery_from and self.delivery_to and self.delivery_from > self.delivery_to:
+            raise ValueError("delivery_from must not be later than delivery_to")
+        return self
+
+class SchemaOrderSearch(BaseModel):
+    """
+    Schema for validating the query parameters of the order search.
+
+    Fields:
+        q (str): Fragment of the customer name or email to look for (3 to 100 characters).
+        limit (Optional[int]): Maximum number of orders (must be > 0). The server caps it to its maximum page size.
+    """
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
+    q: str = Field(..., min_length=3, max_length=100)
+    limit: Optional[int] = Field(None, gt=0)
+
+
+class SchemaOrderChanges(BaseModel):
+    """
+    Schema for validating the query parameters of the order change feed.
+
+    Fields:
+        since (Optional[int]): Last sequence number already processed (>= 0). Without it, the feed
+            answers with its newest sequence number only, to start following from now.
+        limit (Optional[int]): Maximum number of changes (must be > 0). The server caps it to its maximum.
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    since: Optional[int] = Field(None, ge=0)
+    limit: Optional[int] = Field(None, gt=0)
@@ -1,10 +1,14 @@
-from datetime import date
-from typing import Any
+from datetime import date, timedelta
+from typing import Any, Optional, Iterator
 
 from app.interfaces.interfaces_services import IOrderService
-from app.repository.repository_order import RepositoryOrder
-from app.exceptions.api_exceptions import BadRequestError
-from app.utils.utils import str_to_object_date
+from app.interfaces.interfaces_repository import (
+    IOrderRepository, IOrderChangesRepository, IOrderSearchRepository, IOrderStatsRepository
+)
+from app.interfaces.interfaces_clients import IProductClient
+from app.exceptions.api_exceptions import BadRequestError, ChangesExpiredError
+from app.utils.utils import str_to_object_date, utc_now
+from app.utils.pagination import ChangePage, Page, encode_cursor, decode_cursor
 
 class ServiceOrder(IOrderService):
     """
@@ -14,40 +18,350 @@ class ServiceOrder(IOrderService):
     applying business rules before delegating data access to the repository.
 
     Responsibilities:
-    - Retrieve all orders or a specific order.
-    - Validate and create new orders.
+    - Retrieve a specific order.
+    - Retrieve orders page by page with keyset pagination.
+    - Stream every order for bulk exports.
+    - Read the pre-aggregated order statistics per day, status or product.
+    - Search orders by a fragment of the customer name or email.
+    - Read the order changes after a sequence number, for incremental synchronization.
+    - Validate and create new orders, one at a time or in batches.
     - Validate and update existing orders.
     - Delete orders.
 
     Attributes:
         order_repository: Repository instance responsible for data access operations related to orders.
+        product_client: Client of service-product used to validate products and read their prices.
+        default_page_size: Page size used when the client does not request one.
+        max_page_size: Hard server-side cap applied to every requested page size.
+        stream_chunk_size: Number of rows fetched per round trip when streaming orders.
+        max_batch_size: Maximum number of orders accepted in a single batch creation.
+        stats_repository: Repository of the pre-aggregated order statistics, if enabled.
+        search_repository: Repository of the customer search index, if enabled.
+        changes_repository: Repository of the order change log, if enabled.
+        changes_default_limit: Number of changes returned when the client does not request a limit.
+        changes_max_limit: Hard server-side cap applied to every requested number of changes.
+        changes_gap_timeout: Seconds a missing sequence number may still be committed by an open write.
 
     Business Rules:
     - Delivery date must not be earlier than today's date when creating an order.
+    - The ordered product must exist in service-product; the order total is its price.
     - Orders with status "delivered" or "cancelled" cannot be updated.
     """
-    def __init__(self, order_repository: RepositoryOrder):
+    LOCKED_STATUSES = ("delivered", "cancelled")
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        product_client: IProductClient,
+        default_page_size: int = 20,
+        max_page_size: int = 100,
+        stream_chunk_size: int = 1000,
+        max_batch_size: int = 500,
+        stats_repository: Optional[IOrderStatsRepository] = None,
+        search_repository: Optional[IOrderSearchRepository] = None,
+        changes_repository: Optional[IOrderChangesRepository] = None,
+        changes_default_limit: int = 100,
+        changes_max_limit: int = 1000,
+        changes_gap_timeout: float = 0.0
+    ):
         self.order_repository = order_repository
+        self.product_client = product_client
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.stream_chunk_size = stream_chunk_size
+        self.max_batch_size = max_batch_size
+        self.stats_repository = stats_repository
+        self.search_repository = search_repository
+        self.changes_repository = changes_repository
+        self.changes_default_limit = changes_default_limit
+        self.changes_max_limit = changes_max_limit
+        self.changes_gap_timeout = changes_gap_timeout
+
+    def get_orders_page(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> Page:
+        page_size = min(limit or self.default_page_size, self.max_page_size)
+        after = decode_cursor(cursor, sort) if cursor else None
+
+        # Fetch one extra row to know whether a next page exists without a COUNT query
+        rows = self.order_repository.get_orders_page(page_size + 1, after, sort, filters)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_cursor = encode_cursor(sort, rows[-1]) if has_more else None
+        return Page(items=rows, limit=page_size, next_cursor=next_cursor)
 
-    def get_all_order(self) ->  list[dict[str, Any]]:
-        return self.order_repository.get_all_orders()
+    def stream_orders(self) -> Iterator[dict[str, Any]]:
+        return self.order_repository.stream_orders(self.stream_chunk_size)
 
     def get_order(self, order_id: int) -> dict[str, Any]:
         return self.order_repository.get_order(order_id)
+
+    def search_orders(self, text: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Return the newest orders whose customer name or email contains `text` (case-insensitive).
+
+        Args:
+            text (str): Fragment to look for.
+            limit (Optional[int]): Maximum number of orders, capped to the maximum page size.
+
+        Returns:
+            list[dict[str, Any]]: The matching orders, newest first.
+        """
+        if self.search_repository is None:
+            raise BadRequestError("Order search is not enabled.")
+        return self.search_repository.search(text, min(limit or self.default_page_size, self.max_page_size))
+
+    def get_order_stats(
+        self, dimension: str, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the order count and revenue per key of a dimension.
+
+        The statistics are maintained with every order write, so the cost of this call depends
+        on the number of keys returned, not on the number of orders.
+
+        Args:
+            dimension (str): 'day', 'status' or 'product'.
+            date_from (Optional[date]): First delivery day to include ('day' dimension only).
+            date_to (Optional[date]): Last delivery day to include ('day' dimension only).
+
+        Returns:
+            list[dict[str, Any]]: `key`, `orders` and `revenue` of each key, ordered by key.
+        """
+        return self.stats_repository.get_stats(dimension, *self._stats_key_range(dimension, date_from, date_to))
+
+    def _stats_key_range(
+        self, dimension: str, date_from: Optional[date], date_to: Optional[date]
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Check that statistics are enabled and turn a delivery date range into a key range."""
+        if self.stats_repository is None:
+            raise BadRequestError("Order statistics are not enabled.")
+
+        if dimension != "day":
+            if date_from or date_to:
+                raise BadRequestError("Delivery date ranges only apply to the 'day' dimension.")
+            return None, None
+
+        # Day keys are ISO dates, so the date range is a key range
+        return (date_from.isoformat() if date_from else None, date_to.isoformat() if date_to else None)
     
+    def get_order_changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> ChangePage:
+        """
+        Return the order changes after the sequence number `since`, oldest first.
+
+        Each change carries the current state of its order (None once deleted), so a consumer
+        applies the page to its copy and asks for the next one with `next_since`: the cost of a
+        sync depends on the number of changes, not on the number of orders. Without `since`, no
+        change is returned and `next_since` is the newest sequence number, to start following
+        the feed from now (e.g. right before a full export).
+
+        Sequence numbers are taken when a write inserts its entries, not when it commits, so a
+        missing one may belong to a write still in progress. `next_since` never moves past such
+        a gap until it is filled, or until the entry after it is `changes_gap_timeout` seconds
+        old: the write was then rolled back, or its entry was compacted or purged.
+
+        Args:
+            since (Optional[int]): Last sequence number already processed.
+            limit (Optional[int]): Maximum number of changes, capped to the maximum.
+
+        Returns:
+            ChangePage: The changes, with the sequence number to continue from.
+
+        Raises:
+            ChangesExpiredError: If changes after `since` were already purged; the consumer must
+            resynchronize from the full order list.
+        """
+        page_size = self._changes_page_size(limit)
+        if since is None:
+            _, first_seq, last_seq = self.changes_repository.get_changes(None, 0)
+            tail = self._changes_tail(first_seq, last_seq)
+            if tail is not None:
+                return self._start_page(page_size, tail, *self.changes_repository.get_changes(tail, self.changes_max_limit))
+        return self._change_page(since, page_size, *self.changes_repository.get_changes(since, page_size + 1))
+
+    def _changes_page_size(self, limit: Optional[int]) -> int:
+        """Check that the change feed is enabled and cap the requested number of changes."""
+        if self.changes_repository is None:
+            raise BadRequestError("The order change feed is not enabled.")
+        return min(limit or self.changes_default_limit, self.changes_max_limit)
+
+    def _change_page(
+        self, since: Optional[int], page_size: int, changes: list[dict[str, Any]], first_seq: Optional[int], last_seq: Optional[int]
+    ) -> ChangePage:
+        """Build a change feed page from up to `page_size + 1` entries read after `since`."""
+        if since is not None and first_seq is not None and since < first_seq - 1:
+            raise ChangesExpiredError(
+                f"Changes after sequence {since} are no longer retained (oldest is {first_seq}); "
+                "resynchronize from the order list."
+            )
+
+        # The extra entry tells whether a next page exists without a COUNT query
+        has_more = len(changes) > page_size
+        changes = changes[:page_size]
+
+        served = self._served_changes(since, changes)
+        if served < len(changes):
+            # Stop before the gap; the rest is served once it is filled or timed out
+            changes, has_more = changes[:served], False
+
+        if changes:
+            next_since = changes[-1]["seq"]
+        else:
+            next_since = since if since is not None else (last_seq or 0)
+
+        return ChangePage(
+            items=changes, limit=page_size, since=since, next_since=next_since, latest_seq=last_seq or 0, has_more=has_more
+        )
+
+    def _changes_tail(self, first_seq: Optional[int], last_seq: Optional[int]) -> Optional[int]:
+        """
+        Sequence number after which the newest entries are checked for gaps before a consumer
+        starts from now; None when there is nothing to check.
+        """
+        if not self.changes_gap_timeout or last_seq is None:
+            return None
+        return max(first_seq - 1, last_seq - self.changes_max_limit)
+
+    def _start_page(
+        self, page_size: int, tail: int, changes: list[dict[str, Any]], first_seq: Optional[int], last_seq: Optional[int]
+    ) -> ChangePage:
+        """Build the page of a consumer starting from now, from the newest entries read after `tail`."""
+        served = self._served_changes(tail, changes)
+        next_since = changes[served - 1]["seq"] if served else tail
+        return ChangePage(items=[], limit=page_size, since=None, next_since=next_since, latest_seq=last_seq or 0, has_more=False)
+
+    def _served_changes(self, since: Optional[int], changes: list[dict[str, Any]]) -> int:
+        """
+        Count the entries read after `since` that come before the first gap a write in progress
+        may still fill, i.e. a missing sequence number followed by an entry younger than
+        `changes_gap_timeout`.
+        """
+        if since is None or not self.changes_gap_timeout:
+            return len(changes)
+
+        # `changed_at` comes from the writers' clocks, whose skew is small next to the timeout
+        open_after = utc_now() - timedelta(seconds=self.changes_gap_timeout)
+        expected = since + 1
+        for position, change in enumerate(changes):
+            if change["seq"] != expected and change["changed_at"] > open_after:
+                return position
+            expected = change["seq"] + 1
+        return len(changes)
+
+    def get_order_etag(self, order_id: int) -> str:
+        return f"order-{order_id}-v{self.order_repository.get_order_version(order_id)}"
+
     def add_Order(self, order_data: dict[str, Any]) -> bool:
-        
-        order_data["delivery_date"] = str_to_object_date(order_data["delivery_date"])
+        products = self.product_client.get_products([order_data["id_product"]])
+        return self.order_repository.add_Order(self._prepare_new_order(order_data, products))
+
+    def add_orders(self, orders_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Apply the creation business rules to every order and insert the valid ones in a single statement.
+
+        Orders that break a business rule are reported and skipped, so they do not abort the rest
+        of the batch.
+
+        Args:
+            orders_data (list[dict[str, Any]]): Already schema-validated orders.
+
+        Returns:
+            list[dict[str, Any]]: One result per input order, in the same order, with a `status`
+            of 'created' or 'error' (plus a `message` for errors).
+        """
+        self.check_batch_size(len(orders_data))
+
+        # Resolve every product of the batch with a single lookup
+        products = self.product_client.get_products(order_data["id_product"] for order_data in orders_data)
+
+        results, valid_orders = self._prepare_batch(orders_data, products)
+        if valid_orders:
+            self.order_repository.add_orders(valid_orders)
+        return results
+
+    def check_batch_size(self, size: int) -> None:
+        """
+        Reject a batch holding more than `max_batch_size` orders.
+
+        The resources call it with the length of the raw payload, before validating any item,
+        so an oversized body is refused whatever its items contain.
+
+        Args:
+            size (int): Number of orders in the batch.
+
+        Raises:
+            BadRequestError: If the batch is too large.
+        """
+        if size > self.max_batch_size:
+            raise BadRequestError(f"A batch cannot contain more than {self.max_batch_size} orders.")
+
+    def _prepare_batch(
+        self, orders_data: list[dict[str, Any]], products: dict[int, dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Apply the creation business rules to every order of a batch.
+
+        Returns:
+            tuple[list[dict[str, Any]], list[dict[str, Any]]]: One result per input order, and the
+            orders ready to insert.
+        """
+        results: list[dict[str, Any]] = []
+        valid_orders = []
+        for order_data in orders_data:
+            try:
+                valid_orders.append(self._prepare_new_order(order_data, products))
+                results.append({"status": "created"})
+            except BadRequestError as e:
+                results.append({"status": "error", "message": e.message})
+        return results, valid_orders
+
+    def _prepare_new_order(self, order_data: dict[str, Any], products: dict[int, dict[str, Any]]) -> dict[str, Any]:
+        """
+        Normalize and validate a new order against the creation business rules.
+
+        Args:
+            order_data (dict[str, Any]): Order data as produced by `SchemaOrderPost`.
+            products (dict[int, dict[str, Any]]): Products resolved from service-product, by id.
+
+        Returns:
+            dict[str, Any]: The order data, with `delivery_date` as a `date` object and
+            `total_amount` set from the product price.
+
+        Raises:
+            BadRequestError: If the delivery date is earlier than today or the product does not exist.
+        """
+        if isinstance(order_data.get("delivery_date"), str):
+            order_data["delivery_date"] = str_to_object_date(order_data["delivery_date"])
 
         if "delivery_date" in order_data and order_data["delivery_date"] < date.today():
             raise BadRequestError("Delivery date cannot be earlier than order date.")
-        return self.order_repository.add_Order(order_data)
+
+        order_data["total_amount"] = self._product_price(order_data["id_product"], products)
+        return order_data
+
+    @staticmethod
+    def _product_price(product_id: int, products: dict[int, dict[str, Any]]) -> float:
+        """
+        Return the price of a resolved product.
+
+        Raises:
+            BadRequestError: If the product does not exist.
+        """
+        product = products.get(product_id)
+        if product is None:
+            raise BadRequestError(f"Product with id {product_id} does not exist.")
+        return product["price"]
 
     def update_order(self, order_id: int, order_data: dict[str, Any]) -> bool:
-        order = self.order_repository.get_order(order_id)
-        if order["status"] in ["delivered", "cancelled"]:
+        if "id_product" in order_data:
+            products = self.product_client.get_products([order_data["id_product"]])
+            order_data["total_amount"] = self._product_price(order_data["id_product"], products)
+
+        # The status rule is enforced by the UPDATE itself, so the order is not read beforehand
+        if not self.order_repository.update_order(order_id, order_data, self.LOCKED_STATUSES):
             raise BadRequestError("A delivered or cancelled order cannot be modified.")
-        return self.order_repository.update_order(order_id, order_data)
+        return True
 
     def delete_order(self, order_id: int) -> bool:
         return self.order_repository.delete_order(order_id)
\ No newline at end of file
@@ -0,0 +1,82 @@
+from datetime import date
+from typing import Any, Optional, AsyncIterator
+
+from app.exceptions.api_exceptions import BadRequestError
+from app.services.ServiceOrder import ServiceOrder
+from app.utils.pagination import ChangePage, Page, encode_cursor, decode_cursor
+
+class AsyncServiceOrder(ServiceOrder):
+    """
+    Asynchronous counterpart of `ServiceOrder`, used by the async (ASGI) mode.
+
+    Applies the same business rules, through the same helpers, on top of the async order
+    repository and product client: every method is a coroutine. Search is not available in
+    this mode.
+    """
+    async def get_orders_page(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None, sort: str = "id", filters: Optional[dict[str, Any]] = None
+    ) -> Page:
+        page_size = min(limit or self.default_page_size, self.max_page_size)
+        after = decode_cursor(cursor, sort) if cursor else None
+
+        # Fetch one extra row to know whether a next page exists without a COUNT query
+        rows = await self.order_repository.get_orders_page(page_size + 1, after, sort, filters)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_cursor = encode_cursor(sort, rows[-1]) if has_more else None
+        return Page(items=rows, limit=page_size, next_cursor=next_cursor)
+
+    async def stream_orders(self) -> AsyncIterator[dict[str, Any]]:
+        return await self.order_repository.stream_orders(self.stream_chunk_size)
+
+    async def get_order(self, order_id: int) -> dict[str, Any]:
+        return await self.order_repository.get_order(order_id)
+
+    async def search_orders(self, text: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        raise BadRequestError("Order search is not enabled.")
+
+    async def get_order_stats(
+        self, dimension: str, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> list[dict[str, Any]]:
+        return await self.stats_repository.get_stats(dimension, *self._stats_key_range(dimension, date_from, date_to))
+
+    async def get_order_changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> ChangePage:
+        page_size = self._changes_page_size(limit)
+        if since is None:
+            _, first_seq, last_seq = await self.changes_repository.get_changes(None, 0)
+            tail = self._changes_tail(first_seq, last_seq)
+            if tail is not None:
+                return self._start_page(page_size, tail, *await self.changes_repository.get_changes(tail, self.changes_max_limit))
+        return self._change_page(since, page_size, *await self.changes_repository.get_changes(since, page_size + 1))
+
+    async def get_order_etag(self, order_id: int) -> str:
+        return f"order-{order_id}-v{await self.order_repository.get_order_version(order_id)}"
+
+    async def add_Order(self, order_data: dict[str, Any]) -> bool:
+        products = await self.product_client.get_products([order_data["id_product"]])
+        return await self.order_repository.add_Order(self._prepare_new_order(order_data, products))
+
+    async def add_orders(self, orders_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.check_batch_size(len(orders_data))
+
+        # Resolve every product of the batch with a single lookup
+        products = await self.product_client.get_products(order_data["id_product"] for order_data in orders_data)
+
+        results, valid_orders = self._prepare_batch(orders_data, products)
+        if valid_orders:
+            await self.order_repository.add_orders(valid_orders)
+        return results
+
+    async def update_order(self, order_id: int, order_data: dict[str, Any]) -> bool:
+        if "id_product" in order_data:
+            products = await self.product_client.get_products([order_data["id_product"]])
+            order_data["total_amount"] = self._product_price(order_data["id_product"], products)
+
+        # The status rule is enforced by the UPDATE itself, so the order is not read beforehand
+        if not await self.order_repository.update_order(order_id, order_data, self.LOCKED_STATUSES):
+            raise BadRequestError("A delivered or cancelled order cannot be modified.")
+        return True
+
+    async def delete_order(self, order_id: int) -> bool:
+        return await self.order_repository.delete_order(order_id)
@@ -0,0 +1,54 @@
+from logging import Logger
+
+from quart import Quart
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Async DBAPI driver used for each database backend
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+def async_database_uri(database_uri: str) -> str:
+    """
+    Return the URI of the same database with its async driver, e.g. `mysql+pymysql://...`
+    becomes `mysql+aiomysql://...`.
+
+    Raises:
+        ValueError: If the backend has no supported async driver.
+    """
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for the '{backend}' backend")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def init_async_db(app: Quart, logger: Logger) -> async_sessionmaker[AsyncSession]:
+    """
+    Create the async engine of the application and return its session factory.
+
+    The engine uses `ASYNC_DATABASE_URI`, or `SQLALCHEMY_DATABASE_URI` with its async driver, and
+    the same pool settings as the synchronous engine (`SQLALCHEMY_ENGINE_OPTIONS`): however many
+    requests are in flight, at most `pool_size + max_overflow` connections are open and the other
+    requests wait up to `pool_timeout` for one. The engine is disposed when the server stops.
+
+    Args:
+        app (Quart): The application owning the engine.
+        logger (Logger): Logger used to report the engine.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: Factory of sessions bound to the engine.
+    """
+    database_uri = app.config.get('ASYNC_DATABASE_URI') or async_database_uri(app.config['SQLALCHEMY_DATABASE_URI'])
+    engine = create_async_engine(database_uri, **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.extensions['async_engine'] = engine
+
+    @app.after_serving
+    async def dispose_engine() -> None:
+        await engine.dispose()
+
+    logger.info("Async database engine created (%s)", engine.url.render_as_string(hide_password=True))
+    # Rows are read back after commit (e.g. the defaults of a new order), so keep them loaded
+    return async_sessionmaker(engine, expire_on_commit=False)
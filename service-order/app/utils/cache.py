@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.interfaces.interfaces_cache import ICache
+
+class TTLCache(ICache):
+    """
+    Thread-safe, bounded LRU cache whose entries expire after a fixed time to live.
+
+    When the cache is full, the least recently used entry is evicted. Expired entries are
+    dropped lazily when they are read. Hits, misses, evictions and expirations are counted
+    and exposed through `stats()`.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in memory.
+        ttl (float): Time to live of every entry, in seconds.
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None if it is missing or expired.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[Any]: The cached value, if any.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for `key` like `get`, without counting a hit or a miss nor
+        refreshing its recency.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[Any]: The cached value, if any and not expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove `key` from the cache if present.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict[str, int]: Current size and hit, miss, eviction and expiration counts.
+        """
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations
+            }
@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from app.interfaces.interfaces_repository import IOrderChangesRepository
+
+logger = logging.getLogger(__name__)
+
+class ChangeFollower:
+    """
+    Follows the order change log from inside a process, to see the writes of the other processes.
+
+    `poll` returns the orders changed since the previous poll. Sequence numbers are taken when
+    a write inserts its entries, not when it commits, so the log may skip one that a write in
+    progress commits later: the follower remembers the skipped sequence numbers and reads them
+    again on every poll, until they show up or `gap_timeout` seconds after they were first
+    skipped (the write was rolled back, or its entry compacted). At most `max_gaps` of them
+    are remembered, the oldest being given up first.
+
+    The follower starts `batch_size` entries before the end of the log, so the writes in
+    progress at that time are not missed either; the orders of those entries are reported once
+    more by the first poll.
+
+    A poll that fails leaves the follower where it was, so the next one reports the same
+    orders again. Polls are serialized: one that finds another poll running returns nothing,
+    as the running one covers it.
+
+    Attributes:
+        changes_repository (IOrderChangesRepository): Repository of the change log.
+        gap_timeout (float): Seconds a skipped sequence number is waited for.
+        batch_size (int): Number of entries read per round trip.
+        max_gaps (int): Largest number of skipped sequence numbers waited for at once.
+    """
+    def __init__(
+        self, changes_repository: IOrderChangesRepository, gap_timeout: float = 60.0, batch_size: int = 1000, max_gaps: int = 1000
+    ):
+        self.changes_repository = changes_repository
+        self.gap_timeout = gap_timeout
+        self.batch_size = batch_size
+        self.max_gaps = max_gaps
+        self._after: Optional[int] = None
+        # Skipped sequence numbers and the monotonic time they were first skipped, oldest first
+        self._missing: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """(Re)start following from the end of the log; changes before it are not reported."""
+        with self._lock:
+            self._after = self._start_position()
+            self._missing = {}
+
+    def _start_position(self) -> int:
+        _, first_seq, last_seq = self.changes_repository.get_changes(None, 0)
+        if last_seq is None:
+            return 0
+        return max(first_seq - 1, last_seq - self.batch_size)
+
+    def poll(self) -> set[int]:
+        """
+        Read the changes since the previous poll.
+
+        Returns:
+            set[int]: Identifiers of the orders inserted, updated or deleted since.
+
+        Raises:
+            ConnectionError: When the database is unreachable.
+            QueryError: When the change log cannot be read.
+        """
+        if not self._lock.acquire(blocking=False):
+            return set()
+
+        try:
+            after = self._after if self._after is not None else self._start_position()
+            missing = dict(self._missing)
+            changed: set[int] = set()
+            while True:
+                entries = self.changes_repository.follow(after, list(missing), self.batch_size)
+                now = time.monotonic()
+                for seq, order_id in entries:
+                    if seq > after:
+                        for skipped in range(max(after + 1, seq - self.max_gaps), seq):
+                            missing[skipped] = now
+                        after = seq
+                    else:
+                        missing.pop(seq, None)
+                    changed.add(order_id)
+
+                if len(entries) < self.batch_size:
+                    break
+
+            self._after, self._missing = after, self._expire(missing)
+            return changed
+        finally:
+            self._lock.release()
+
+    def _expire(self, missing: dict[int, float]) -> dict[int, float]:
+        """Give up on the sequence numbers skipped too long ago, or beyond `max_gaps`."""
+        # Entries are added in sequence order, which is also the order they were skipped in
+        expired_before = time.monotonic() - self.gap_timeout
+        expired = [seq for seq, skipped_at in missing.items() if skipped_at <= expired_before]
+        expired.extend(list(missing)[len(expired):len(missing) - self.max_gaps])
+        for seq in expired:
+            del missing[seq]
+        if expired:
+            logger.debug("Gave up waiting for %d skipped change log entries", len(expired))
+        return missing
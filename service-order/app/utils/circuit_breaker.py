@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from app.exceptions.client_exceptions import CircuitOpenError
+
+T = TypeVar("T")
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker protecting calls to a remote dependency.
+
+    - Closed: calls go through; consecutive failures are counted.
+    - Open: after `failure_threshold` consecutive failures, calls are rejected immediately
+      with `CircuitOpenError` for `reset_timeout` seconds.
+    - Half-open: once the timeout elapses, a single trial call is let through; its success
+      closes the circuit and its failure opens it again.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open before a trial call is allowed.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Run `fn` through the breaker.
+
+        Args:
+            fn (Callable[[], T]): The remote call to protect.
+
+        Returns:
+            T: Whatever `fn` returns.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the call was not attempted.
+        """
+        self._before_call()
+        try:
+            result = fn()
+        except Exception:
+            self._on_failure()
+            raise
+
+        self._on_success()
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `fn()` through the breaker; the async counterpart of `call`.
+
+        The state is shared with `call`, and the lock is only held to update it, never while
+        the call is awaited.
+
+        Args:
+            fn (Callable[[], Awaitable[T]]): The remote call to protect.
+
+        Returns:
+            T: Whatever `fn` returns.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the call was not attempted.
+        """
+        self._before_call()
+        try:
+            result = await fn()
+        except Exception:
+            self._on_failure()
+            raise
+
+        self._on_success()
+        return result
+
+    def _before_call(self) -> None:
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Circuit is open")
+                self._state = self.HALF_OPEN
+
+            if self._state == self.HALF_OPEN:
+                if self._trial_in_progress:
+                    raise CircuitOpenError("Circuit is half-open and a trial call is in progress")
+                self._trial_in_progress = True
+
+    def _on_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_progress = False
+
+    def _on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_progress = False
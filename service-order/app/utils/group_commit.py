@@ -0,0 +1,226 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, Optional, TypeVar
+
+from flask import Flask
+
+from app.metrics import (
+    GROUP_COMMIT_BATCH_ROWS, GROUP_COMMIT_FAILED_BATCHES, GROUP_COMMIT_FAILED_ROWS, GROUP_COMMIT_FLUSH_DURATION,
+    GROUP_COMMIT_TIMEOUTS, GROUP_COMMIT_WAIT
+)
+
+T = TypeVar("T")
+
+# Queued item, the future of its caller and the time it was submitted
+Entry = tuple[T, Future, float]
+
+class GroupCommitter(Generic[T]):
+    """
+    Gathers the writes of concurrent requests into shared transactions.
+
+    `submit` queues an item and returns a future. A background flusher thread takes up to
+    `max_rows` queued items, waiting at most `max_delay` seconds after the first one was submitted,
+    and writes them with a single call to `flush`: one transaction and one commit (one fsync)
+    for the whole batch. The future of every item resolves once its batch is committed, or
+    carries the exception that made it fail. Even without a delay, the items submitted while a
+    batch is being committed are written together by the next flush, so batches grow with the
+    load and the commit latency.
+
+    When a batch fails, `on_failure` decides what its callers get:
+    - `isolate`: the items are retried one by one, each in its own transaction, so a bad row
+      only fails its own request.
+    - `fail`: the batch error is raised to every caller of the batch.
+
+    The thread is started by the first `submit` of each process, so a committer created before
+    a pre-fork server forks its workers runs one flusher per worker and none in the master.
+    A flusher that died is started again by the next `submit`. Items still queued are flushed
+    when the process exits.
+
+    `wait` gives up after `timeout` seconds: the item's own delay, plus one flush in progress
+    and its own flush, each bounded by `flush_timeout`. An item given up on before its batch
+    started is never written; one given up on during its flush may still be committed.
+
+    Attributes:
+        app (Flask): Application whose context is pushed around each flush.
+        flush (Callable[[list[T]], object]): Writes and commits a batch of items in one transaction.
+        max_rows (int): Largest number of items written by one flush.
+        max_delay (float): Seconds a submitted item waits at most for others to join its batch.
+        flush_timeout (float): Seconds a flush is expected to take at most (the statement timeout).
+        on_failure (str): 'isolate' or 'fail'.
+    """
+    FAILURE_MODES = ("isolate", "fail")
+
+    def __init__(
+        self,
+        app: Flask,
+        flush: Callable[[list[T]], object],
+        max_rows: int = 100,
+        max_delay: float = 0.0,
+        flush_timeout: float = 5.0,
+        on_failure: str = "isolate",
+        logger: Optional[logging.Logger] = None
+    ):
+        if on_failure not in self.FAILURE_MODES:
+            raise ValueError(f"on_failure must be one of {self.FAILURE_MODES}, not {on_failure!r}")
+
+        self.app = app
+        self.flush = flush
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.flush_timeout = flush_timeout
+        self.on_failure = on_failure
+        self.logger = logger or logging.getLogger(__name__)
+        self._queue: queue.SimpleQueue[Optional[Entry[T]]] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: T) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item (T): Item passed to `flush` with the rest of its batch.
+
+        Returns:
+            Future: Resolves to None once the batch is committed, or raises its error.
+        """
+        if not self._running():
+            self._start()
+
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    @property
+    def timeout(self) -> float:
+        """Seconds `wait` waits for an item: its delay, the flush in progress and its own flush."""
+        return self.max_delay + 2 * self.flush_timeout
+
+    def wait(self, item: T) -> None:
+        """
+        Queue an item and wait until its batch is committed.
+
+        Args:
+            item (T): Item passed to `flush` with the rest of its batch.
+
+        Raises:
+            TimeoutError: If the batch is not committed within `timeout` seconds. The item is
+                dropped from the queue if its batch did not start yet.
+            Exception: The error that made the batch fail.
+        """
+        future = self.submit(item)
+        try:
+            future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            GROUP_COMMIT_TIMEOUTS.inc()
+            self.logger.error("Group commit not done after %.1f s, giving up on the item", self.timeout)
+            raise
+
+    def _running(self) -> bool:
+        return self._pid == os.getpid() and self._thread is not None and self._thread.is_alive()
+
+    def _start(self) -> None:
+        """Start the flusher of the current process, or start it again if it died."""
+        with self._lock:
+            if self._running():
+                return
+
+            if self._pid != os.getpid():
+                # The queue and the thread of a parent process do not exist here
+                self._queue = queue.SimpleQueue()
+                atexit.register(self.stop)
+            else:
+                self.logger.error("Group commit flusher is not running, starting it again")
+
+            self._thread = threading.Thread(target=self._run, name="group-commit-flusher", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush the queued items and stop the flusher of the current process."""
+        with self._lock:
+            if self._pid != os.getpid() or self._thread is None:
+                return
+
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+            self._pid = None
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+
+            batch, stopping = self._collect(entry)
+            # Items whose caller gave up are dropped; the others can no longer be cancelled
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            if batch:
+                self._flush_batch(batch)
+            if stopping:
+                return
+
+    def _collect(self, first: Entry[T]) -> tuple[list[Entry[T]], bool]:
+        """
+        Gather the items submitted with `first`, until the batch is full or the delay of `first`
+        is over. Items that queued up during the previous flush are taken without waiting.
+
+        Returns:
+            tuple[list[Entry[T]], bool]: The batch, and whether the committer is stopping.
+        """
+        batch = [first]
+        deadline = first[2] + self.max_delay
+        while len(batch) < self.max_rows:
+            remaining = deadline - time.perf_counter()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+
+        return batch, False
+
+    def _flush_batch(self, batch: list[Entry[T]]) -> None:
+        started = time.perf_counter()
+        try:
+            self._write([item for item, _, _ in batch])
+        except Exception as e:
+            GROUP_COMMIT_FAILED_BATCHES.labels(self.on_failure).inc()
+            if self.on_failure == "fail" or len(batch) == 1:
+                self.logger.error("Group commit of %d rows failed: %s", len(batch), e)
+                self._fail(batch, e)
+                return
+
+            self.logger.warning("Group commit of %d rows failed, retrying them one by one: %s", len(batch), e)
+            for entry in batch:
+                self._flush_batch([entry])
+            return
+
+        committed = time.perf_counter()
+        GROUP_COMMIT_BATCH_ROWS.observe(len(batch))
+        GROUP_COMMIT_FLUSH_DURATION.observe(committed - started)
+        for _, future, submitted in batch:
+            GROUP_COMMIT_WAIT.observe(committed - submitted)
+            future.set_result(None)
+
+    def _write(self, items: list[T]) -> None:
+        # The app context scopes the session to this flush; it is removed (rolled back if needed) on exit
+        with self.app.app_context():
+            self.flush(items)
+
+    @staticmethod
+    def _fail(batch: list[Entry[T]], error: Exception) -> None:
+        GROUP_COMMIT_FAILED_ROWS.inc(len(batch))
+        for _, future, _ in batch:
+            future.set_exception(error)
@@ -1,6 +1,8 @@
-from typing import Callable, Any
+import time
+from typing import Callable, Any, Optional
 
 from app.exceptions.internal_exceptions import ComponentInitializationError
+from app.utils.startup import StartupTimings
 
 class InitializationComponent:
     """
@@ -17,15 +19,22 @@ class InitializationComponent:
         *args (Any): positional arguments to be passed to `init_fn`.
         init_fn (Callable[..., Any]): Function responsible for initializing the component.
         name (str): Component name (used in error messages for clarity).
+        timings (Optional[StartupTimings]): Startup timings receiving the initialization time under `name`.
+
+    Attributes:
+        duration (float): Seconds spent in `init_fn`.
 
     Raises:
         ComponentInitializationError: If `init_fn` throws an exception when executed.
     """
-    def __init__(self, *args: Any, init_fn: Callable[..., None], name: str) -> None:
+    def __init__(self, *args: Any, init_fn: Callable[..., None], name: str, timings: Optional[StartupTimings] = None) -> None:
         self._args = args
         self._init_fn = init_fn
         self._name = name
+        self.duration = 0.0
         self._run()
+        if timings is not None:
+            timings.record(name, self.duration)
 
     def _run(self) -> None:
         """
@@ -34,7 +43,10 @@ class InitializationComponent:
         If an error occurs during execution of `init_fn`, it throws `ComponentInitializationError`
         with a contextualized message.
         """
+        started = time.perf_counter()
         try:
             self._init_fn(*self._args)
         except Exception as e:
-            raise ComponentInitializationError(f"Failed to initialize {self._name}: {e}")
\ No newline at end of file
+            raise ComponentInitializationError(f"Failed to initialize {self._name}: {e}")
+        finally:
+            self.duration = time.perf_counter() - started
\ No newline at end of file
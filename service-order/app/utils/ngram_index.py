@@ -0,0 +1,358 @@
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from typing import Optional, Union
+
+from app.exceptions.internal_exceptions import IndexMemoryError
+
+# Ids are split into a block (high 16 bits) and a position within it (low 16 bits)
+_BLOCK_BITS = 16
+_BLOCK_SIZE = 1 << _BLOCK_BITS
+_POSITION_MASK = _BLOCK_SIZE - 1
+# Posting blocks with more positions than this are bitmaps; bitmaps under half of it become arrays again
+_ARRAY_MAX = 4096
+_BITMAP_BYTES = _BLOCK_SIZE // 8
+
+# Per-object overheads of the Python containers, measured with tracemalloc, used by the memory estimate
+_ARRAY_OVERHEAD = 150
+_BITMAP_OVERHEAD = 130
+_GRAM_OVERHEAD = 330
+_DOCUMENT_BLOCK_BYTES = 6 * _BLOCK_SIZE + 400
+
+# Positions of one n-gram in one block: a sorted array of 16-bit positions, or a bitmap once dense
+Container = Union[array, bytearray]
+
+class _DocumentBlock:
+    """The UTF-8 texts of the documents of one block, stored one after the other in a single buffer."""
+    __slots__ = ("offsets", "lengths", "heap", "garbage", "documents")
+
+    def __init__(self):
+        self.offsets = array("I", [0]) * _BLOCK_SIZE
+        # A length of 0 marks an absent document
+        self.lengths = array("H", [0]) * _BLOCK_SIZE
+        self.heap = bytearray()
+        self.garbage = 0
+        self.documents = 0
+
+    def get(self, position: int) -> Optional[bytes]:
+        length = self.lengths[position]
+        if not length:
+            return None
+        offset = self.offsets[position]
+        return bytes(self.heap[offset:offset + length])
+
+    def contains(self, position: int, needle: bytes) -> bool:
+        """Whether the document at `position` contains `needle`, searched in place."""
+        length = self.lengths[position]
+        offset = self.offsets[position]
+        return bool(length) and self.heap.find(needle, offset, offset + length) >= 0
+
+    def put(self, position: int, data: bytes) -> int:
+        """Store a document and return the number of bytes the block grew by."""
+        if self.lengths[position]:
+            self.garbage += self.lengths[position]
+        else:
+            self.documents += 1
+        self.offsets[position] = len(self.heap)
+        self.lengths[position] = len(data)
+        self.heap += data
+        return len(data) - self._maybe_compact()
+
+    def delete(self, position: int) -> int:
+        """Drop a document and return the number of bytes the block shrank by."""
+        self.garbage += self.lengths[position]
+        self.lengths[position] = 0
+        self.documents -= 1
+        return self._maybe_compact()
+
+    def _maybe_compact(self) -> int:
+        """Rewrite the buffer without the replaced and dropped texts once they make up a quarter of it."""
+        if self.garbage < 4096 or 4 * self.garbage < len(self.heap):
+            return 0
+
+        heap = bytearray()
+        offsets, lengths, old = self.offsets, self.lengths, self.heap
+        for position, length in enumerate(lengths):
+            if length:
+                offset = offsets[position]
+                offsets[position] = len(heap)
+                heap += old[offset:offset + length]
+        freed = len(old) - len(heap)
+        self.heap, self.garbage = heap, 0
+        return freed
+
+class NgramIndex:
+    """
+    Thread-safe in-memory inverted index answering substring queries through n-grams.
+
+    Every document is lowercased and split into its overlapping n-grams (trigrams by default).
+    Each n-gram maps to the ids of its documents, stored the way roaring bitmaps are: ids are
+    split into blocks of 65536, and the positions of an n-gram in a block are either a sorted
+    `array` of 16-bit positions (2 bytes per entry) or, once it holds more than 4096 of them,
+    a bitmap of 8 KiB (at most 2 bytes per entry, down to 1 bit). The texts are kept as UTF-8
+    in one buffer per block, indexed by position, rather than as Python strings.
+
+    A query intersects the positions of all its n-grams block by block, from the highest ids
+    down, and checks every candidate against the document text, so the answer is exact. The
+    lock is only held for one block at a time. Adding, replacing and removing a document update
+    its n-grams in place; the texts it leaves behind are reclaimed when they make up a quarter
+    of their block's buffer.
+
+    `max_bytes` bounds an estimate of the memory used, within a few percent of what the
+    process actually allocates for the index.
+
+    Attributes:
+        n (int): Length of the n-grams; shorter queries cannot be answered.
+        max_bytes (Optional[int]): Estimated memory limit; None for no limit.
+    """
+    def __init__(self, n: int = 3, max_bytes: Optional[int] = None):
+        self.n = n
+        self.max_bytes = max_bytes
+        self._postings: dict[str, dict[int, Container]] = {}
+        self._blocks: dict[int, _DocumentBlock] = {}
+        self._documents = 0
+        self._entries = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def grams(self, text: str) -> set[str]:
+        """Return the distinct n-grams of an already lowercased text."""
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def get(self, doc_id: int) -> Optional[str]:
+        """Return the indexed (lowercased) text of a document, if any."""
+        with self._lock:
+            return self._text(doc_id)
+
+    def _text(self, doc_id: int) -> Optional[str]:
+        block = self._blocks.get(doc_id >> _BLOCK_BITS)
+        data = block.get(doc_id & _POSITION_MASK) if block is not None else None
+        return data.decode() if data is not None else None
+
+    def add(self, doc_id: int, text: str) -> None:
+        """
+        Index a document, replacing its previous text if it is already indexed.
+
+        Args:
+            doc_id (int): Document identifier (0 to 2**32 - 1).
+            text (str): Document text; an empty one removes the document.
+
+        Raises:
+            IndexMemoryError: If the index would exceed `max_bytes`; it is left unchanged.
+        """
+        text = text.lower()
+        if not text:
+            self.remove(doc_id)
+            return
+
+        data = text.encode()
+        block_id, position = doc_id >> _BLOCK_BITS, doc_id & _POSITION_MASK
+        with self._lock:
+            previous = self._text(doc_id)
+            if previous == text:
+                return
+
+            new_grams = self.grams(text)
+            old_grams = self.grams(previous) if previous is not None else set()
+            added, removed = new_grams - old_grams, old_grams - new_grams
+
+            # The containers the document may create are left out: the limit is exceeded by one document at most
+            growth = len(data) + 2 * len(added) + (0 if block_id in self._blocks else _DOCUMENT_BLOCK_BYTES)
+            if self.max_bytes is not None and self._bytes + growth > self.max_bytes:
+                raise IndexMemoryError(f"The n-gram index would exceed {self.max_bytes} bytes")
+
+            for gram in removed:
+                self._discard(gram, block_id, position)
+
+            # Fast paths, inlined: ids mostly grow, so the position usually goes at the end of an array
+            appended = set_bits = 0
+            postings = self._postings
+            byte, bit = position >> 3, 1 << (position & 7)
+            for gram in added:
+                blocks = postings.get(gram)
+                container = blocks.get(block_id) if blocks is not None else None
+                if type(container) is bytearray:
+                    container[byte] |= bit
+                    set_bits += 1
+                elif type(container) is array and container[-1] < position and len(container) < _ARRAY_MAX:
+                    container.append(position)
+                    appended += 1
+                else:
+                    self._insert(gram, block_id, position)
+            self._entries += appended + set_bits
+            self._bytes += 2 * appended
+
+            block = self._blocks.get(block_id)
+            if block is None:
+                block = self._blocks[block_id] = _DocumentBlock()
+                self._bytes += _DOCUMENT_BLOCK_BYTES
+            if previous is None:
+                self._documents += 1
+            self._bytes += block.put(position, data)
+
+    def remove(self, doc_id: int) -> None:
+        """Remove a document, if it is indexed."""
+        block_id, position = doc_id >> _BLOCK_BITS, doc_id & _POSITION_MASK
+        with self._lock:
+            previous = self._text(doc_id)
+            if previous is None:
+                return
+
+            for gram in self.grams(previous):
+                self._discard(gram, block_id, position)
+
+            block = self._blocks[block_id]
+            self._bytes -= block.delete(position)
+            self._documents -= 1
+            if not block.documents:
+                del self._blocks[block_id]
+                self._bytes -= _DOCUMENT_BLOCK_BYTES + len(block.heap)
+
+    def search(self, query: str, limit: int, before: Optional[int] = None) -> list[int]:
+        """
+        Return the ids of up to `limit` documents containing `query`, highest (newest) first.
+
+        Args:
+            query (str): Text to look for, at least `n` characters long; case-insensitive.
+            limit (int): Maximum number of ids to return.
+            before (Optional[int]): Only return ids lower than this one, to continue a search.
+
+        Returns:
+            list[int]: Matching document ids, in decreasing order.
+        """
+        query = query.lower()
+        grams = self.grams(query)
+        if not grams:
+            raise ValueError(f"Queries must be at least {self.n} characters long")
+
+        needle = query.encode()
+        top = before - 1 if before is not None else (1 << 32) - 1
+        if top < 0:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(gram) for gram in grams]
+            if any(blocks is None for blocks in postings):
+                return []
+            # Every match is in a block where all the n-grams appear; the rarest gram has the fewest
+            block_ids = sorted(
+                (block_id for block_id in min(postings, key=len) if block_id <= top >> _BLOCK_BITS), reverse=True
+            )
+
+        matches: list[int] = []
+        for block_id in block_ids:
+            end = (top & _POSITION_MASK) + 1 if block_id == top >> _BLOCK_BITS else _BLOCK_SIZE
+            with self._lock:
+                containers = [blocks.get(block_id) for blocks in postings]
+                document_block = self._blocks.get(block_id)
+                if any(container is None for container in containers) or document_block is None:
+                    continue
+
+                containers.sort(key=_cardinality)
+                candidates, others = containers[0], containers[1:]
+                base = block_id << _BLOCK_BITS
+                for position in _positions_before(candidates, end):
+                    if all(_contains(other, position) for other in others) and document_block.contains(position, needle):
+                        matches.append(base | position)
+                        if len(matches) >= limit:
+                            return matches
+        return matches
+
+    def clear(self) -> None:
+        """Drop every document and posting list."""
+        with self._lock:
+            self._postings.clear()
+            self._blocks.clear()
+            self._documents = self._entries = self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the size of the index: documents, n-grams, posting entries, bitmaps and estimated bytes."""
+        with self._lock:
+            return {
+                "documents": self._documents,
+                "grams": len(self._postings),
+                "entries": self._entries,
+                "bitmaps": sum(
+                    isinstance(container, bytearray) for blocks in self._postings.values() for container in blocks.values()
+                ),
+                "memory_bytes": self._bytes
+            }
+
+    def _insert(self, gram: str, block_id: int, position: int) -> None:
+        blocks = self._postings.get(gram)
+        if blocks is None:
+            blocks = self._postings[gram] = {}
+            self._bytes += _GRAM_OVERHEAD
+        self._entries += 1
+
+        container = blocks.get(block_id)
+        if container is None:
+            blocks[block_id] = array("H", [position])
+            self._bytes += _ARRAY_OVERHEAD + 2
+        elif isinstance(container, bytearray):
+            container[position >> 3] |= 1 << (position & 7)
+        else:
+            insort(container, position)
+            self._bytes += 2
+            if len(container) > _ARRAY_MAX:
+                blocks[block_id] = _to_bitmap(container)
+                self._bytes += _BITMAP_OVERHEAD + _BITMAP_BYTES - _ARRAY_OVERHEAD - 2 * len(container)
+
+    def _discard(self, gram: str, block_id: int, position: int) -> None:
+        blocks = self._postings[gram]
+        container = blocks[block_id]
+        self._entries -= 1
+
+        if isinstance(container, bytearray):
+            container[position >> 3] &= ~(1 << (position & 7))
+            if _cardinality(container) < _ARRAY_MAX // 2:
+                blocks[block_id] = _to_array(container)
+                self._bytes += _ARRAY_OVERHEAD + 2 * len(blocks[block_id]) - _BITMAP_OVERHEAD - _BITMAP_BYTES
+            return
+
+        del container[bisect_left(container, position)]
+        self._bytes -= 2
+        if not container:
+            del blocks[block_id]
+            self._bytes -= _ARRAY_OVERHEAD
+            if not blocks:
+                del self._postings[gram]
+                self._bytes -= _GRAM_OVERHEAD
+
+def _cardinality(container: Container) -> int:
+    if isinstance(container, bytearray):
+        return int.from_bytes(container, "little").bit_count()
+    return len(container)
+
+def _contains(container: Container, position: int) -> bool:
+    if isinstance(container, bytearray):
+        return bool(container[position >> 3] >> (position & 7) & 1)
+    i = bisect_left(container, position)
+    return i < len(container) and container[i] == position
+
+def _positions_before(container: Container, end: int) -> Iterator[int]:
+    """Yield the positions of a container lower than `end`, highest first."""
+    if isinstance(container, bytearray):
+        for byte_index in range((end - 1) >> 3, -1, -1):
+            byte = container[byte_index]
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(7, -1, -1):
+                position = base | bit
+                if byte >> bit & 1 and position < end:
+                    yield position
+    else:
+        for i in range(bisect_left(container, end) - 1, -1, -1):
+            yield container[i]
+
+def _to_bitmap(positions: array) -> bytearray:
+    bitmap = bytearray(_BITMAP_BYTES)
+    for position in positions:
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return bitmap
+
+def _to_array(bitmap: bytearray) -> array:
+    return array("H", sorted(_positions_before(bitmap, _BLOCK_SIZE)))
@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional
+
+from app.exceptions.api_exceptions import BadRequestError
+
+@dataclass
+class Page:
+    """
+    A single page of results produced by keyset (cursor) pagination.
+
+    Attributes:
+        items (list[dict[str, Any]]): The rows of the current page.
+        limit (int): The effective page size that was applied by the server.
+        next_cursor (Optional[str]): Opaque cursor pointing to the next page, or None on the last page.
+    """
+    items: list[dict[str, Any]] = field(default_factory=list)
+    limit: int = 0
+    next_cursor: Optional[str] = None
+
+    def meta(self) -> dict[str, Any]:
+        """
+        Build the pagination metadata included in the response envelope.
+
+        Returns:
+            dict[str, Any]: Page size, next cursor and whether more rows are available.
+        """
+        return {
+            "limit": self.limit,
+            "next_cursor": self.next_cursor,
+            "has_more": self.next_cursor is not None
+        }
+
+@dataclass
+class ChangePage(Page):
+    """
+    A page of the order change feed, positioned by sequence number.
+
+    Attributes:
+        since (Optional[int]): Sequence number the page starts after, as requested.
+        next_since (int): Sequence number to request the next page with.
+        latest_seq (int): Newest sequence number of the log, so consumers can tell how far behind they are.
+        has_more (bool): Whether more changes can be read right away.
+    """
+    since: Optional[int] = None
+    next_since: int = 0
+    latest_seq: int = 0
+    has_more: bool = False
+
+    def meta(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "since": self.since,
+            "next_since": self.next_since,
+            "latest_seq": self.latest_seq,
+            "has_more": self.has_more
+        }
+
+def encode_cursor(sort: str, last_row: dict[str, Any]) -> str:
+    """
+    Encode the position of the last row of a page into an opaque cursor.
+
+    Args:
+        sort (str): Sort key of the page ('id' or 'delivery_date', prefixed with '-' when descending).
+        last_row (dict[str, Any]): Last row returned in the page.
+
+    Returns:
+        str: URL-safe base64 cursor.
+    """
+    payload: dict[str, Any] = {"s": sort, "id": last_row["id"]}
+    if sort.lstrip("-") == "delivery_date":
+        payload["d"] = last_row["delivery_date"].isoformat()
+
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, ...]:
+    """
+    Decode an opaque cursor into the keyset position it represents.
+
+    Args:
+        cursor (str): Cursor previously returned by `encode_cursor`.
+        sort (str): Sort key requested by the client; must match the cursor's one.
+
+    Returns:
+        tuple[Any, ...]: `(id,)` for the id sorts or `(delivery_date, id)` for the delivery date sorts.
+
+    Raises:
+        BadRequestError: If the cursor is malformed or was issued for another sort key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+        if payload.get("s") != sort:
+            raise BadRequestError("Pagination cursor does not match the requested sort")
+
+        last_id = int(payload["id"])
+        if sort.lstrip("-") == "delivery_date":
+            return (date.fromisoformat(payload["d"]), last_id)
+        return (last_id,)
+
+    except BadRequestError:
+        raise
+
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+        raise BadRequestError("Invalid pagination cursor")
@@ -0,0 +1,75 @@
+import atexit
+from logging import Logger
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+def warm_up_pool(app: Flask, db: SQLAlchemy, logger: Logger) -> None:
+    """
+    Open the pool's base connections of every engine before the application accepts traffic.
+
+    The connections are checked out together, so each one is a real new connection, and then
+    returned to the pool. A failure is only logged: the application still starts and the
+    connections are opened on demand, with `pool_pre_ping` discarding the broken ones.
+
+    Args:
+        app (Flask): The application whose engines are warmed up.
+        db (SQLAlchemy): The database extension owning the engines.
+        logger (Logger): Logger used to report the outcome.
+    """
+    with app.app_context():
+        engines = dict(db.engines)
+
+    for bind_key, engine in engines.items():
+        name = bind_key or 'default'
+        size = _pool_size(engine)
+        connections = []
+        try:
+            for _ in range(size):
+                connections.append(engine.connect())
+            logger.info("Connection pool '%s' warmed up with %d connections", name, size)
+        except SQLAlchemyError as e:
+            logger.warning("Could not warm up connection pool '%s': %s", name, e)
+        finally:
+            for connection in connections:
+                connection.close()
+
+def log_pool_stats_at_exit(app: Flask, db: SQLAlchemy, logger: Logger) -> None:
+    """
+    Log the state of every connection pool when the process exits.
+
+    Args:
+        app (Flask): The application whose engines are reported.
+        db (SQLAlchemy): The database extension owning the engines.
+        logger (Logger): Logger used to write the statistics.
+    """
+    with app.app_context():
+        engines = dict(db.engines)
+
+    def log_pool_stats() -> None:
+        for bind_key, engine in engines.items():
+            logger.info("Connection pool '%s' at shutdown: %s", bind_key or 'default', engine.pool.status())
+
+    atexit.register(log_pool_stats)
+
+def dispose_pools_after_fork(app: Flask, db: SQLAlchemy) -> None:
+    """
+    Drop the pooled connections inherited from the parent process, in a freshly forked worker.
+
+    With a preloaded application the pools are created (and warmed up) in the parent, so every
+    worker inherits the same open sockets. `dispose(close=False)` gives the worker new, empty
+    pools without closing those sockets, which the parent and the other workers still own.
+
+    Args:
+        app (Flask): The preloaded application.
+        db (SQLAlchemy): The database extension owning the engines.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+def _pool_size(engine: Engine) -> int:
+    size = getattr(engine.pool, 'size', None)
+    return size() if callable(size) else 1
@@ -0,0 +1,125 @@
+import itertools
+import math
+import threading
+import time
+from typing import Any, Optional
+
+from flask import Flask, Response, g, has_request_context, request
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import Engine
+
+REPLICA_BIND_PREFIX = 'replica_'
+LAST_WRITE_COOKIE = 'db_last_write'
+
+class ReplicaRouter:
+    """
+    Chooses the engine that serves each read: a read replica, or the primary.
+
+    Replicas are the `SQLALCHEMY_BINDS` whose key starts with `replica_`. Reads are spread
+    over them with one of two policies:
+    - `round_robin`: each read goes to the next replica in turn.
+    - `least_connections`: each read goes to the replica with the fewest checked out connections.
+
+    A request keeps the replica chosen for its first read, so all its reads see the same
+    snapshot. Writes always go to the primary. Once a request has written (`mark_write`), its
+    later reads stay on the primary too, so it reads its own writes despite the replication lag.
+    The response of that request also sets the `db_last_write` cookie to the time of the write,
+    and the reads of the following requests carrying it go to the primary for `max_lag` seconds:
+    a client reads its own writes on its next requests as well. Without replicas every read
+    goes to the primary and no cookie is set.
+
+    Attributes:
+        replicas (list[Engine]): Engines of the read replicas.
+        policy (str): Either 'round_robin' or 'least_connections'.
+        max_lag (float): Seconds after a write during which the reads of the same client stay on the primary.
+    """
+    POLICIES = ('round_robin', 'least_connections')
+
+    def __init__(self, replicas: list[Engine], policy: str = 'round_robin', max_lag: float = 5.0):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown replica policy '{policy}', expected one of {self.POLICIES}")
+
+        self.replicas = replicas
+        self.policy = policy
+        self.max_lag = max_lag
+        self._next = itertools.cycle(range(len(replicas))) if replicas else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_app(cls, app: Flask, db: SQLAlchemy) -> "ReplicaRouter":
+        """
+        Build the router from the replica binds, the `DB_REPLICA_POLICY` and the `DB_REPLICA_MAX_LAG`
+        of the application.
+
+        Args:
+            app (Flask): The application whose configuration is read.
+            db (SQLAlchemy): The database extension owning the engines.
+
+        Returns:
+            ReplicaRouter: The router.
+        """
+        with app.app_context():
+            replicas = [
+                engine for bind_key, engine in sorted(db.engines.items(), key=lambda item: item[0] or '')
+                if bind_key and bind_key.startswith(REPLICA_BIND_PREFIX)
+            ]
+        return cls(replicas, app.config['DB_REPLICA_POLICY'], app.config['DB_REPLICA_MAX_LAG'])
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the hook setting the `db_last_write` cookie on the responses of the requests that wrote.
+
+        Args:
+            app (Flask): The application whose responses are marked.
+        """
+        app.after_request(self._set_last_write)
+
+    def read_bind(self) -> Optional[dict[str, Any]]:
+        """
+        Bind arguments routing a read statement, for `session.execute(..., bind_arguments=...)`.
+
+        Returns:
+            Optional[dict[str, Any]]: `{'bind': engine}` for a replica, or None to use the primary.
+        """
+        if not self.replicas:
+            return None
+        if not has_request_context():
+            return {'bind': self._choose()}
+        if g.get('db_wrote') or self._wrote_recently():
+            return None
+
+        if 'db_replica' not in g:
+            g.db_replica = self._choose()
+        return {'bind': g.db_replica}
+
+    def _choose(self) -> Engine:
+        if self.policy == 'least_connections':
+            return min(self.replicas, key=_checked_out)
+
+        with self._lock:
+            return self.replicas[next(self._next)]
+
+    def mark_write(self) -> None:
+        """Pin the reads of the current request, and of the client's next requests, to the primary."""
+        if has_request_context():
+            g.db_wrote = True
+
+    def _wrote_recently(self) -> bool:
+        """Whether the client wrote less than `max_lag` seconds ago, according to its `db_last_write` cookie."""
+        try:
+            last_write = float(request.cookies[LAST_WRITE_COOKIE])
+        except (KeyError, ValueError):
+            return False
+        # A time in the future is not trusted, so a client cannot pin itself to the primary for good
+        return 0 <= time.time() - last_write < self.max_lag
+
+    def _set_last_write(self, response: Response) -> Response:
+        if self.replicas and g.get('db_wrote'):
+            response.set_cookie(
+                LAST_WRITE_COOKIE, f"{time.time():.3f}", max_age=math.ceil(self.max_lag), httponly=True, samesite='Lax'
+            )
+        return response
+
+def _checked_out(engine: Engine) -> int:
+    checked_out = getattr(engine.pool, 'checkedout', None)
+    return checked_out() if callable(checked_out) else 0
@@ -1,5 +1,7 @@
-from datetime import datetime, date
-from typing import Sequence, Mapping, Any
+from datetime import datetime, date, timezone
+from typing import Any
+
+from sqlalchemy.engine import Result
 
 def str_to_object_date(date_str: str) -> date:
     """
@@ -13,37 +15,40 @@ def str_to_object_date(date_str: str) -> date:
     """
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
-def object_date_to_str(date_obj: datetime) -> str:
+def utc_now() -> datetime:
     """
-    Convert a `datetime` object to a string in 'DD-MM-YYYY' format.
-
-    Args:
-        date_obj (datetime): The datetime object to convert.
+    Return the current UTC time as a naive datetime, the way every dialect stores it.
 
     Returns:
-        str: The formatted date string.
+        datetime: Current UTC time without `tzinfo`.
     """
-    return date_obj.strftime("%d-%m-%Y")
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
-def converted_rowmapping_to_dict(result: Sequence[Mapping[Any, Any]]) -> list[dict[str, Any]]:
+def result_to_dicts(result: Result[Any]) -> list[dict[str, Any]]:
     """
-    Convert a sequence of row mappings (e.g., from SQLAlchemy) to a list of dictionaries,
-    converting any 'delivery_date' field from datetime to string.
+    Convert the rows of a query result to a list of dictionaries keyed by column name.
+
+    Zipping the column names with each row tuple is several times cheaper than building the
+    dictionaries from `RowMapping` objects, which matters on large lists.
 
     Args:
-        result (Sequence[Mapping[Any, Any]]): Sequence of row mappings with column-value pairs.
+        result (Result[Any]): Result of an executed statement.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries representing each row,
-        with 'delivery_date' formatted as a string if present.
+        list[dict[str, Any]]: A list of dictionaries representing each row.
     """
-    orders = []
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
 
-    for row in result:
-        d = dict(row)
+def escape_like(value: str, escape: str = "/") -> str:
+    """
+    Escape the LIKE wildcards of a user supplied value, so it only matches literally.
 
-        if "delivery_date" in d and isinstance(d["delivery_date"], datetime):
-            d["delivery_date"] =  object_date_to_str(d["delivery_date"])
-        orders.append(d)
+    Args:
+        value (str): Raw value.
+        escape (str): Escape character declared in the LIKE clause.
 
-    return orders
+    Returns:
+        str: The value with `%`, `_` and the escape character escaped.
+    """
+    return value.replace(escape, escape * 2).replace("%", escape + "%").replace("_", escape + "_")
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from logging import Logger
+from typing import Optional
+
+from flask import Flask
+from pydantic import ValidationError
+
+from app.exceptions.database_exceptions import ConnectionError, QueryError
+from app.interfaces.interfaces_repository import IOrderStatsRepository
+from app.repository.repository_order import RepositoryOrder
+from app.schema.schema_order import SchemaOrderPost, SchemaOrderPut, SchemaOrderPage, SchemaOrderStats
+
+def warm_up_requests(
+    app: Flask, repository: RepositoryOrder, stats_repository: Optional[IOrderStatsRepository], logger: Logger
+) -> None:
+    """
+    Pay, before the application serves traffic, the one-off costs of the first requests.
+
+    - Runs the repository reads and compiles its writes (`RepositoryOrder.warm_up`).
+    - Reads the statistics once.
+    - Validates a sample payload with every request schema, which loads the lazily imported
+      validators (e.g. the email validator and its IDNA tables).
+    - Serializes a sample order with the JSON provider.
+
+    A database failure (e.g. the tables do not exist yet) is only logged.
+
+    Args:
+        app (Flask): The application being started.
+        repository (RepositoryOrder): The order repository, before any caching layer.
+        stats_repository (Optional[IOrderStatsRepository]): The statistics repository, if enabled.
+        logger (Logger): Logger used to report the outcome.
+    """
+    delivery_date = date.today() + timedelta(days=1)
+    order = {
+        "customer_name": "Warm Up",
+        "customer_phone": "600000000",
+        "customer_email": "warm.up@example.com",
+        "id_product": 1,
+        "delivery_date": delivery_date.isoformat(),
+    }
+    try:
+        SchemaOrderPost(**order)
+        SchemaOrderPut(customer_email=order["customer_email"])
+        SchemaOrderPage(limit="20", sort="-delivery_date", status="pending", delivery_from=order["delivery_date"])
+        SchemaOrderStats(dimension="day", delivery_from=order["delivery_date"])
+    except ValidationError as e:
+        logger.warning("Request schema warm-up failed: %s", e)
+
+    app.json.dumps({**order, "id": 1, "delivery_date": delivery_date})
+
+    with app.app_context():
+        try:
+            repository.warm_up()
+            if stats_repository is not None:
+                stats_repository.get_stats("status")
+        except (ConnectionError, QueryError) as e:
+            logger.warning("Could not warm up the order queries: %s", e)
@@ -0,0 +1,4 @@
+from app.asgi import create_asgi_app
+
+# Served by an ASGI server, e.g. `hypercorn asgi:app`
+app = create_asgi_app()
@@ -0,0 +1,118 @@
+"""
+Production entry point: a pre-fork Gunicorn server running the application on every core.
+
+    python serve.py
+
+The application is created once in the master process (`preload_app`) and the workers are
+forked from it, so the code, the configuration and the customer search index are shared
+copy-on-write instead of being rebuilt by every worker:
+- `gc.freeze()` runs right after `create_app()`, so the garbage collector never writes to the
+  pages of those objects in the workers (which would copy them).
+- Every worker drops the pooled database connections it inherited and opens its own before
+  accepting requests.
+- Each worker is recycled after `WEB_MAX_REQUESTS` requests (plus a random jitter, so they do
+  not all restart at once), which bounds the effect of any slow memory growth.
+- SIGTERM drains: the server stops accepting connections and waits up to
+  `WEB_GRACEFUL_TIMEOUT` seconds for the in-flight requests. To deploy new code without
+  downtime, send SIGUSR2 (start a new master with the new code), then SIGWINCH and SIGTERM to
+  the old one; SIGHUP only restarts the workers from the already loaded application.
+
+Settings, read from the environment:
+- `WEB_BIND` (0.0.0.0:5000), `WEB_WORKERS` (number of cores) and `WEB_THREADS` (4 threads per
+  worker). `DB_POOL_SIZE` + `DB_MAX_OVERFLOW` should be at least `WEB_THREADS`.
+- `WEB_MAX_REQUESTS` (10000), `WEB_MAX_REQUESTS_JITTER` (1000), `WEB_TIMEOUT` (30),
+  `WEB_GRACEFUL_TIMEOUT` (30) and `WEB_KEEPALIVE` (5).
+
+Rotating log files cannot be shared by several processes, so with more than one worker the
+logs go to standard output (`LOG_SINK=stream`) unless `LOG_SINK` is set. Use `LOG_SINK=socket`
+with `python -m app.log_server` so a single process writes the log files, and set
+`PROMETHEUS_MULTIPROC_DIR` so `/metrics` aggregates every worker.
+"""
+import gc
+import os
+import shutil
+from typing import Any, Optional
+
+from flask import Flask
+from gunicorn.app.base import BaseApplication
+from prometheus_client import multiprocess
+
+WEB_BIND = os.environ.get('WEB_BIND', '0.0.0.0:5000')
+WEB_WORKERS = int(os.environ.get('WEB_WORKERS', os.cpu_count() or 1))
+WEB_THREADS = int(os.environ.get('WEB_THREADS', 4))
+WEB_MAX_REQUESTS = int(os.environ.get('WEB_MAX_REQUESTS', 10000))
+WEB_MAX_REQUESTS_JITTER = int(os.environ.get('WEB_MAX_REQUESTS_JITTER', 1000))
+WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 30))
+WEB_GRACEFUL_TIMEOUT = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+WEB_KEEPALIVE = int(os.environ.get('WEB_KEEPALIVE', 5))
+
+if WEB_WORKERS > 1:
+    # Must be set before the application (and its logger) is imported
+    os.environ.setdefault('LOG_SINK', 'stream')
+
+class ProductionServer(BaseApplication):
+    """Gunicorn application preloading the Flask application in the master process."""
+
+    def __init__(self, options: dict[str, Any]):
+        self.options = options
+        self.application: Optional[Flask] = None
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+        self.cfg.set('post_fork', self.post_fork)
+        self.cfg.set('child_exit', self.child_exit)
+
+    def load(self) -> Flask:
+        if self.application is None:
+            from app import create_app
+
+            self.application = create_app()
+            if WEB_WORKERS > 1 and os.environ['LOG_SINK'] == 'file':
+                self.application.logger.warning(
+                    "LOG_SINK=file with %d workers: the workers rotate the same log files", WEB_WORKERS
+                )
+            # Everything allocated so far is shared with the workers: keep the collector off it
+            gc.collect()
+            gc.freeze()
+        return self.application
+
+    def post_fork(self, server: Any, worker: Any) -> None:
+        from app.extensions import db
+        from app.utils.pool import dispose_pools_after_fork, warm_up_pool
+
+        dispose_pools_after_fork(self.application, db)
+        # Open the worker's own connections before it accepts requests
+        if self.application.config['DB_POOL_WARMUP']:
+            warm_up_pool(self.application, db, self.application.logger)
+
+    def child_exit(self, server: Any, worker: Any) -> None:
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            multiprocess.mark_process_dead(worker.pid)
+
+def reset_metrics_dir() -> None:
+    """Remove the metric files left by a previous run, so dead workers are not counted."""
+    metrics_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+
+def main() -> None:
+    reset_metrics_dir()
+    ProductionServer({
+        'bind': WEB_BIND,
+        'workers': WEB_WORKERS,
+        'threads': WEB_THREADS,
+        'worker_class': 'gthread' if WEB_THREADS > 1 else 'sync',
+        'preload_app': True,
+        'max_requests': WEB_MAX_REQUESTS,
+        'max_requests_jitter': WEB_MAX_REQUESTS_JITTER,
+        'timeout': WEB_TIMEOUT,
+        'graceful_timeout': WEB_GRACEFUL_TIMEOUT,
+        'keepalive': WEB_KEEPALIVE,
+    }).run()
+
+if __name__ == "__main__":
+    main()
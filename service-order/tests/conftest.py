@@ -0,0 +1,9 @@
+import os
+import sys
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The tests import the service as `app` and the benchmark helpers (e.g. the product stub) as `benchmarks`
+for path in (SERVICE_DIR, os.path.dirname(SERVICE_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+from app.clients.product_client import ProductClient
+from app.exceptions.client_exceptions import ProductServiceError
+from app.utils.cache import TTLCache
+from app.utils.circuit_breaker import CircuitBreaker
+from benchmarks.load.product_stub import ProductStub
+
+@pytest.fixture
+def stub():
+    stub = ProductStub(product_count=10).start()
+    yield stub
+    stub.stop()
+
+def make_client(stub, ttl=60.0, batch_size=200, failure_threshold=5, reset_timeout=30.0, timeout=(0.5, 2.0)):
+    return ProductClient(
+        stub.url,
+        TTLCache(max_size=100, ttl=ttl),
+        CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout),
+        timeout=timeout,
+        batch_size=batch_size
+    )
+
+def test_resolves_existing_products_and_leaves_out_unknown_ids(stub):
+    client = make_client(stub)
+
+    products = client.get_products([1, 2, 42])
+
+    assert products == {1: {"id": 1, "price": stub.price(1)}, 2: {"id": 2, "price": stub.price(2)}}
+
+def test_lookups_are_split_by_batch_size(stub):
+    client = make_client(stub, batch_size=3)
+
+    products = client.get_products([1, 2, 3, 4, 5, 6, 7, 2, 1])
+
+    assert stub.lookups == [[1, 2, 3], [4, 5, 6], [7]]
+    assert sorted(products) == [1, 2, 3, 4, 5, 6, 7]
+
+def test_only_uncached_ids_are_fetched(stub):
+    client = make_client(stub)
+    client.get_products([1, 2])
+
+    client.get_products([1, 2, 3])
+
+    assert stub.lookups == [[1, 2], [3]]
+
+def test_cached_products_and_unknown_ids_skip_the_network(stub):
+    client = make_client(stub)
+    first = client.get_products([1, 42])
+
+    second = client.get_products([1, 42])
+
+    assert second == first == {1: {"id": 1, "price": stub.price(1)}}
+    assert stub.lookups == [[1, 42]]
+    assert client.cache.stats()["hits"] == 2
+
+def test_expired_entries_are_fetched_again(stub):
+    client = make_client(stub, ttl=0.05)
+    client.get_products([1])
+    time.sleep(0.1)
+
+    client.get_products([1])
+
+    assert stub.lookups == [[1], [1]]
+
+def test_read_timeout_is_reported_as_product_service_error(stub):
+    stub.delay = 0.5
+    client = make_client(stub, timeout=(0.5, 0.1))
+
+    with pytest.raises(ProductServiceError) as error:
+        client.get_products([1])
+
+    assert error.value.status_code == 503
+
+def test_error_status_is_reported_as_product_service_error(stub):
+    stub.status = 500
+    client = make_client(stub)
+
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+
+    # Failed lookups are not cached
+    assert client.cache.get(1) is None
+
+def test_unreachable_service_is_reported_as_product_service_error(stub):
+    stub.stop()
+    client = make_client(stub)
+
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+
+def test_open_circuit_fails_fast_without_calling_the_service(stub):
+    stub.status = 500
+    client = make_client(stub, failure_threshold=2)
+    for product_id in (1, 2):
+        with pytest.raises(ProductServiceError):
+            client.get_products([product_id])
+
+    with pytest.raises(ProductServiceError):
+        client.get_products([3])
+
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert stub.lookups == [[1], [2]]
+
+def test_half_open_trial_success_closes_the_circuit(stub):
+    stub.status = 500
+    client = make_client(stub, failure_threshold=1, reset_timeout=0.05)
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+    stub.status = 200
+    time.sleep(0.1)
+
+    products = client.get_products([1])
+
+    assert products == {1: {"id": 1, "price": stub.price(1)}}
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_trial_failure_opens_the_circuit_again(stub):
+    stub.status = 500
+    client = make_client(stub, failure_threshold=1, reset_timeout=0.05)
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+    time.sleep(0.1)
+
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+    with pytest.raises(ProductServiceError):
+        client.get_products([1])
+
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert stub.lookups == [[1], [1]]
@@ -0,0 +1,135 @@
+import time
+from datetime import date
+
+import pytest
+from flask import Flask, request
+from sqlalchemy import insert, select
+
+from app.extensions import db
+from app.models.model import Order
+from app.repository.repository_order import RepositoryOrder
+from app.utils.replica_router import LAST_WRITE_COOKIE, ReplicaRouter
+
+MAX_LAG = 0.3
+
+def make_app(tmp_path, policy, replica_count=2):
+    """
+    Application reading and updating order 1 through the repository, on a primary and
+    `replica_count` replicas in SQLite files. Each database holds its own copy of the order,
+    named after it, so the name read tells which database served the read.
+    """
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.db'}",
+        SQLALCHEMY_BINDS={f"replica_{i}": f"sqlite:///{tmp_path / f'replica_{i}.db'}" for i in range(replica_count)},
+        DB_REPLICA_POLICY=policy,
+        DB_REPLICA_MAX_LAG=MAX_LAG
+    )
+    db.init_app(app)
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(insert(Order).values(
+                    id=1, customer_name=bind_key or "primary", customer_phone="600000000",
+                    customer_email="ana@example.com", id_product=1, delivery_date=date(2031, 10, 20), total_amount=10
+                ))
+
+    router = ReplicaRouter.from_app(app, db)
+    router.init_app(app)
+    repository = RepositoryOrder(db.session, Order, router)
+
+    @app.get("/orders/<int:order_id>")
+    def read(order_id):
+        return {"customer_name": repository.get_order(order_id)["customer_name"]}
+
+    @app.put("/orders/<int:order_id>")
+    def write(order_id):
+        repository.update_order(order_id, request.get_json())
+        return {"customer_name": repository.get_order(order_id)["customer_name"]}
+
+    return app, router
+
+def read_name(client):
+    return client.get("/orders/1").get_json()["customer_name"]
+
+def names_in(app):
+    names = {}
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            with engine.connect() as connection:
+                names[bind_key or "primary"] = connection.scalar(select(Order.customer_name).where(Order.id == 1))
+    return names
+
+def test_round_robin_spreads_reads_over_the_replicas(tmp_path):
+    app, _ = make_app(tmp_path, "round_robin")
+    client = app.test_client()
+
+    assert [read_name(client) for _ in range(4)] == ["replica_0", "replica_1", "replica_0", "replica_1"]
+
+def test_least_connections_reads_from_the_least_busy_replica(tmp_path):
+    app, router = make_app(tmp_path, "least_connections")
+    client = app.test_client()
+
+    for busy, idle in ((0, 1), (1, 0)):
+        with router.replicas[busy].connect():
+            assert read_name(client) == f"replica_{idle}"
+
+@pytest.mark.parametrize("policy", ReplicaRouter.POLICIES)
+def test_reads_of_a_request_stay_on_one_replica(tmp_path, policy):
+    app, router = make_app(tmp_path, policy)
+
+    with app.test_request_context():
+        assert router.read_bind() == router.read_bind()
+
+@pytest.mark.parametrize("policy", ReplicaRouter.POLICIES)
+def test_writes_go_to_the_primary(tmp_path, policy):
+    app, _ = make_app(tmp_path, policy)
+
+    response = app.test_client().put("/orders/1", json={"customer_name": "Renamed"})
+
+    # The request reads its own write back from the primary
+    assert response.get_json() == {"customer_name": "Renamed"}
+    assert names_in(app) == {"primary": "Renamed", "replica_0": "replica_0", "replica_1": "replica_1"}
+
+@pytest.mark.parametrize("policy", ReplicaRouter.POLICIES)
+def test_last_write_cookie_pins_the_client_to_the_primary_for_max_lag(tmp_path, policy):
+    app, _ = make_app(tmp_path, policy)
+    writer, other = app.test_client(), app.test_client()
+
+    response = writer.put("/orders/1", json={"customer_name": "Renamed"})
+
+    assert LAST_WRITE_COOKIE in response.headers["Set-Cookie"]
+    assert read_name(writer) == "Renamed"
+    assert read_name(other).startswith("replica_")
+
+    time.sleep(MAX_LAG + 0.1)
+    assert read_name(writer).startswith("replica_")
+
+def test_reads_do_not_set_the_last_write_cookie(tmp_path):
+    app, _ = make_app(tmp_path, "round_robin")
+
+    response = app.test_client().get("/orders/1")
+
+    assert "Set-Cookie" not in response.headers
+
+def test_last_write_cookie_in_the_future_is_ignored(tmp_path):
+    app, _ = make_app(tmp_path, "round_robin")
+    client = app.test_client()
+    client.set_cookie(LAST_WRITE_COOKIE, str(time.time() + 3600))
+
+    assert read_name(client).startswith("replica_")
+
+def test_without_replicas_reads_go_to_the_primary(tmp_path):
+    app, router = make_app(tmp_path, "round_robin", replica_count=0)
+    client = app.test_client()
+
+    response = client.put("/orders/1", json={"customer_name": "Renamed"})
+
+    assert "Set-Cookie" not in response.headers
+    assert router.replicas == []
+    assert read_name(app.test_client()) == "Renamed"
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        ReplicaRouter([], policy="random")
@@ -1,17 +1,34 @@
 import os
 
+import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 
 from config import config
+from .compression import ResponseCompressor
+from .json_provider import init_json_provider
 from .logger import configure_logging
+from .metrics import init_metrics
+from .profiler import QueryProfiler
+from .utils.pool import log_pool_stats_at_exit, warm_up_pool
+from .utils.replica_router import ReplicaRouter
 from .utils.safe_init import SafeInit
+from .utils.startup import StartupTimings
 from .utils.exceptions import AppInitializationError
 
-# instance global of SQLAlchemy and Migrate
+# instance global of SQLAlchemy
 db = SQLAlchemy()
-migrate = Migrate()
+
+def init_migrate(app: Flask, db: SQLAlchemy) -> None:
+    """
+    Register Flask-Migrate on the application.
+
+    Flask-Migrate is imported here rather than at module level: it pulls in Alembic (and its
+    template engine), which only the `flask db` commands need.
+    """
+    from flask_migrate import Migrate
+
+    Migrate(app, db)
 
 def create_app() -> Flask:
     """
@@ -20,9 +37,14 @@ def create_app() -> Flask:
     This function sets up the Flask application by:
     - Loading environment-specific configuration.
     - Configuring the logging system.
-    - Initializing core components such as the database and migrations.
+    - Initializing core components such as the database and, under the `flask` command, migrations.
+    - Warming up the database connection pool and logging its statistics at shutdown.
     - Registering API blueprints.
     - Importing required models for SQLAlchemy registration.
+    - Running the product statements once before serving.
+
+    The duration of every phase is logged once startup is over and kept in
+    `app.extensions['startup_timings']`.
 
     Returns:
         Flask: A fully configured Flask application instance ready to run.
@@ -30,11 +52,13 @@ def create_app() -> Flask:
     Raises:
         AppInitializationError: If any critical step in the setup process fails.
     """
+    timings = StartupTimings()
     # create the Flask application
     app = Flask(__name__)
 
     # configure the logging system
-    app_logger = configure_logging(app)
+    with timings.phase('Logging'):
+        app_logger = configure_logging(app)
 
     # Load the environment-specific configuration
     env = os.environ.get('APP_SETTINGS', 'development')
@@ -45,29 +69,73 @@ def create_app() -> Flask:
     # configure the application
     cfg_class = config[env]
     app.config.from_object(cfg_class)
+    init_json_provider(app)
     app_logger.info("Flask application configured with %s", cfg_class.__name__)
 
+    migrations_enabled = app.config['MIGRATIONS_ENABLED']
+    if migrations_enabled is None:
+        # Migrations only run through the `flask db` commands, which load the app inside a click context
+        migrations_enabled = click.get_current_context(silent=True) is not None
+
     try:
-        SafeInit(app, init_fn = db.init_app, name="Database", app_logger=app_logger, )
-        SafeInit(app, db, init_fn = migrate.init_app, name="Migrations", app_logger=app_logger) 
+        SafeInit(app, init_fn = db.init_app, name="Database", app_logger=app_logger, timings=timings)
+        if migrations_enabled:
+            SafeInit(app, db, init_fn = init_migrate, name="Migrations", app_logger=app_logger, timings=timings)
         app_logger.info("components initialized successfully.")
     except Exception as e:
         app_logger.critical("Failed to initialize components: %s", e, exc_info=True)
         raise AppInitializationError(f"Failed to initialize components: {e}")   
 
+    if app.config['METRICS_ENABLED']:
+        with timings.phase('Metrics'):
+            init_metrics(app, db)
+        app_logger.info("Metrics endpoint registered at /metrics")
+
+    if app.config['SQL_PROFILER_ENABLED']:
+        QueryProfiler(
+            slow_query_ms=app.config['SQL_SLOW_QUERY_MS'],
+            n_plus_one_threshold=app.config['SQL_N_PLUS_ONE_THRESHOLD'],
+            add_headers=app.config['SQL_PROFILER_HEADERS']
+        ).init_app(app, db)
+        app_logger.info("SQL query profiler enabled")
+
+    if app.config['COMPRESSION_ENABLED']:
+        compressor = ResponseCompressor.from_app(app)
+        compressor.init_app(app)
+        app_logger.info("Response compression enabled: %s", ", ".join(compressor.codecs))
+
+    if app.config['DB_POOL_WARMUP']:
+        with timings.phase('Pool warm-up'):
+            warm_up_pool(app, db, app_logger)
+    log_pool_stats_at_exit(app, db, app_logger)
+
     # Import the model to be registered in SQLAlchemy
     from .models.model import Products
 
     try:
-        # register the api blueprint
-        from .resources import create_api_blueprint
-        app.register_blueprint(create_api_blueprint(db, app_logger), url_prefix='/api/v1')
+        with timings.phase('Resources'):
+            # register the api blueprint
+            from .resources import create_api_blueprint
+            # Reads are spread over the read replicas, if any are configured
+            router = ReplicaRouter.from_app(app, db)
+            router.init_app(app)
+            app.register_blueprint(create_api_blueprint(db, app_logger, app.config, router), url_prefix='/api/v1')
 
         app_logger.info("API blueprint registered with prefix /api/v1")
     except Exception as e:
         app_logger.critical(f"Could not register the API blueprint, aborting startup: {e}", exc_info=True)
         raise AppInitializationError(f"Failed to register blueprint: {e}")
 
+    if app.config['STARTUP_WARMUP']:
+        from .repository.repository import Repository
+        from .utils.warmup import warm_up_queries
+
+        with timings.phase('Warm-up'):
+            # The compiled statements are cached by the engine, so a throwaway repository warms them for every request
+            warm_up_queries(app, Repository(db.session, Products, app_logger, router), app_logger)
+
+    app.extensions['startup_timings'] = timings
+    timings.report(app_logger)
     app_logger.info("Flask application factory setup completed.")
 
-    return app
\ No newline at end of file
+    return app
@@ -0,0 +1,62 @@
+import os
+
+from quart import Quart
+from werkzeug.exceptions import HTTPException
+
+from config import config
+from .json_provider import init_json_provider
+from .logger import configure_logging
+from .utils.async_db import init_async_db
+from .utils.exceptions import AppInitializationError
+
+def create_asgi_app() -> Quart:
+    """
+    Application factory of the async (ASGI) mode, served by an ASGI server such as Hypercorn.
+
+    It serves the same read API as `create_app` (`GET /api/v1/products` and
+    `POST /api/v1/products/lookup`) from the same configuration and database, through an async
+    SQLAlchemy engine whose pool bounds the number of database connections. Metrics and the
+    SQL profiler are only available in the synchronous application.
+
+    Returns:
+        Quart: A fully configured Quart application instance.
+
+    Raises:
+        AppInitializationError: If any critical step in the setup process fails.
+    """
+    # Same application name as the Flask application, so the same logger is configured
+    app = Quart(__package__)
+
+    app_logger = configure_logging(app)
+
+    env = os.environ.get('APP_SETTINGS', 'development')
+    if env not in config:
+        app_logger.critical("Invalid APP_SETTINGS: %s. Valid options are: %s", env, list(config.keys()))
+        raise AppInitializationError(f"Invalid APP_SETTINGS: {env}. Valid options are: {list(config.keys())}")
+
+    cfg_class = config[env]
+    app.config.from_object(cfg_class)
+    init_json_provider(app)
+    app_logger.info("Quart application configured with %s", cfg_class.__name__)
+
+    try:
+        from .models.model import Products
+        from .repository.async_repository import AsyncRepository
+        from .services.async_service import AsyncProductService
+        from .resources.async_resource import create_async_api_blueprint, handle_http_exception
+
+        session_factory = init_async_db(app, app_logger)
+        product_service = AsyncProductService(
+            AsyncRepository(session_factory, Products, app_logger),
+            app_logger,
+            max_batch_ids=app.config['PRODUCTS_BATCH_MAX_IDS']
+        )
+        app.register_blueprint(create_async_api_blueprint(product_service, app_logger), url_prefix='/api/v1')
+        app.register_error_handler(HTTPException, handle_http_exception)
+
+        app_logger.info("Async API blueprint registered with prefix /api/v1")
+    except Exception as e:
+        app_logger.critical("Could not register the async API blueprint, aborting startup: %s", e, exc_info=True)
+        raise AppInitializationError(f"Failed to register blueprint: {e}")
+
+    return app
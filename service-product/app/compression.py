@@ -0,0 +1,215 @@
+"""
+Negotiated compression of the response bodies.
+
+`ResponseCompressor` compresses the JSON and NDJSON responses with the best encoding the client
+accepts (`Accept-Encoding`), in the server's order of preference among `COMPRESSION_ALGORITHMS`:
+- `zstd`: Zstandard, if the `zstandard` package is installed.
+- `br`: Brotli, if the `brotli` package is installed.
+- `gzip`: always available (standard library).
+
+It runs after the view has built its response (after `wrap_success_response`), so the envelope,
+status code and ETag are already set. Bodies smaller than `COMPRESSION_MIN_SIZE` are sent as they
+are: detail responses are too small to gain anything and are never compressed or inspected
+beyond their length. Streamed responses (e.g. the NDJSON export) have no length; they are
+compressed incrementally while they are sent, so memory stays constant.
+"""
+import logging
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional, Protocol
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = frozenset({'application/json', 'application/x-ndjson', 'text/plain', 'text/html'})
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+
+class _BrotliStream:
+    """Gives `brotli.Compressor` the `compress`/`flush` interface of the zlib and zstd compressors."""
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+class Codec:
+    """
+    A content coding.
+
+    Attributes:
+        compress (Callable[[bytes], bytes]): Compresses a whole body.
+        stream (Callable[[], StreamCompressor]): Creates an incremental compressor for a streamed body.
+    """
+    def __init__(self, compress: Callable[[bytes], bytes], stream: Callable[[], StreamCompressor]):
+        self.compress = compress
+        self.stream = stream
+
+def gzip_codec(level: int) -> Codec:
+    # wbits=31: deflate with a gzip header and trailer
+    return Codec(
+        lambda data: zlib.compress(data, level, wbits=31),
+        lambda: zlib.compressobj(level, zlib.DEFLATED, 31)
+    )
+
+def brotli_codec(quality: int) -> Codec:
+    return Codec(lambda data: brotli.compress(data, quality=quality), lambda: _BrotliStream(quality))
+
+def zstd_codec(level: int) -> Codec:
+    # A `ZstdCompressor` must not be used by two threads at once, so each body gets its own
+    return Codec(
+        lambda data: zstandard.ZstdCompressor(level=level).compress(data),
+        lambda: zstandard.ZstdCompressor(level=level).compressobj()
+    )
+
+class ResponseCompressor:
+    """
+    Compresses the responses with the encoding negotiated from `Accept-Encoding`.
+
+    A response is compressed when it is a success (2xx, other than 204 and 206), has a
+    compressible mimetype, is not already encoded, does not forbid it (`Cache-Control: no-transform`),
+    and is either streamed or at least `min_size` bytes long. Those responses also get
+    `Vary: Accept-Encoding`, whatever the client accepts, so caches keep one copy per encoding.
+
+    A compressed body is a different representation of the resource, so its strong ETag is made
+    weak (as nginx does): conditional requests still match it, as the views compare tags weakly,
+    but it is never used for byte ranges.
+
+    Attributes:
+        min_size (int): Bodies shorter than this many bytes are sent uncompressed.
+        codecs (dict[str, Codec]): Available encodings, in the server's order of preference.
+    """
+    ALGORITHMS = ('zstd', 'br', 'gzip')
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        algorithms: Iterable[str] = ALGORITHMS,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3
+    ):
+        self.min_size = min_size
+        self.codecs: dict[str, Codec] = {}
+        for name in algorithms:
+            if name not in self.ALGORITHMS:
+                raise ValueError(f"Unknown compression algorithm {name!r}, expected one of {self.ALGORITHMS}")
+
+            if name == 'gzip':
+                self.codecs[name] = gzip_codec(gzip_level)
+            elif name == 'br' and brotli is not None:
+                self.codecs[name] = brotli_codec(brotli_quality)
+            elif name == 'zstd' and zstandard is not None:
+                self.codecs[name] = zstd_codec(zstd_level)
+            else:
+                logger.warning("%s compression is not available, its package is not installed", name)
+
+    @classmethod
+    def from_app(cls, app: Flask) -> "ResponseCompressor":
+        """Build the compressor from the `COMPRESSION_*` settings."""
+        return cls(
+            min_size=app.config['COMPRESSION_MIN_SIZE'],
+            algorithms=[name.strip() for name in app.config['COMPRESSION_ALGORITHMS'].split(',') if name.strip()],
+            gzip_level=app.config['COMPRESSION_GZIP_LEVEL'],
+            brotli_quality=app.config['COMPRESSION_BROTLI_QUALITY'],
+            zstd_level=app.config['COMPRESSION_ZSTD_LEVEL']
+        )
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the response hook.
+
+        Args:
+            app (Flask): The application whose responses are compressed.
+        """
+        app.after_request(self._compress_response)
+
+    def negotiate(self, accept_encodings: Any) -> Optional[str]:
+        """
+        Choose the encoding of a response.
+
+        Args:
+            accept_encodings (Accept): The parsed `Accept-Encoding` header of the request.
+
+        Returns:
+            Optional[str]: The available encoding with the highest quality, ties going to the
+            server's preference; None when the client accepts none of them.
+        """
+        best, best_quality = None, 0
+        for name in self.codecs:
+            quality = accept_encodings[name]
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def _compress_response(self, response: Response) -> Response:
+        if not self._compressible(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = self.negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        codec = self.codecs[encoding]
+        if response.is_streamed:
+            response.response = _compress_stream(response.response, codec.stream())
+            response.headers.pop('Content-Length', None)
+        else:
+            response.set_data(codec.compress(response.get_data()))
+
+        response.content_encoding = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _compressible(self, response: Response) -> bool:
+        if not 200 <= response.status_code < 300 or response.status_code in (204, 206):
+            return False
+        if response.direct_passthrough or 'Content-Encoding' in response.headers:
+            return False
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES or response.cache_control.no_transform:
+            return False
+        if response.is_streamed:
+            return True
+
+        length = response.calculate_content_length()
+        return length is not None and length >= self.min_size
+
+def _compress_stream(chunks: Iterable[Any], compressor: StreamCompressor) -> Iterator[bytes]:
+    """
+    Compress a streamed body chunk by chunk.
+
+    Chunks are not flushed one by one: the compressor emits a block whenever it has filled one,
+    which keeps the compression ratio of a whole body while the client starts receiving data
+    before the end of the stream.
+    """
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
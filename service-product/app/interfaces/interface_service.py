@@ -6,6 +6,14 @@ class IReadProduct(ABC):
     def get_product(self, offset: int, limit: int) -> List:
         pass
 
+    @abstractmethod
+    def get_products_by_ids(self, ids: List[int]) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def get_products_etag(self, offset: int, limit: int) -> str:
+        pass
+
 class IWriteProduct(ABC):
     @abstractmethod
     def add_product(self, cake_data: Dict) -> bool:
@@ -7,6 +7,16 @@ class IRepository(ABC):
         """Get all items with pagination."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get the items whose id is in `ids`."""
+        pass
+
+    @abstractmethod
+    def get_versions(self, offset: int, limit: int) -> List[tuple[int, int]]:
+        """Get the id and row version of a page of items."""
+        pass
+
     @abstractmethod
     def add(self, item_data: Dict) -> bool:
         """Add a new item."""
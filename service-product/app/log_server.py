@@ -0,0 +1,69 @@
+"""
+Log server for multi-process deployments.
+
+When several worker processes share the same log files, letting each of them rotate the
+files corrupts them. With `LOG_SINK=socket`, the workers send their records to this server
+over TCP instead, and it is the only process writing and rotating the files.
+
+Run it next to the application:
+
+    python -m app.log_server
+
+It listens on `LOG_SOCKET_HOST`/`LOG_SOCKET_PORT` (localhost:9020 by default).
+"""
+import os
+import logging
+import pickle
+import socketserver
+import struct
+from logging.config import dictConfig
+
+from .logger import LOG_DIR, LOG_SOCKET_HOST, LOG_SOCKET_PORT, FORMATTERS, FILTERS, file_handlers_config
+
+class LogRecordStreamHandler(socketserver.StreamRequestHandler):
+    """Reads the length-prefixed pickled records sent by `logging.handlers.SocketHandler`."""
+
+    def handle(self) -> None:
+        while True:
+            header = self.connection.recv(4)
+            if len(header) < 4:
+                break
+
+            length = struct.unpack('>L', header)[0]
+            chunk = self.connection.recv(length)
+            while len(chunk) < length:
+                data = self.connection.recv(length - len(chunk))
+                if not data:
+                    return
+                chunk += data
+
+            record = logging.makeLogRecord(pickle.loads(chunk))
+            logging.getLogger(record.name).handle(record)
+
+class LogRecordSocketServer(socketserver.ThreadingTCPServer):
+    """TCP server dispatching the received records to the local file handlers."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+def serve() -> None:
+    """Configure the file handlers and serve until interrupted."""
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    handlers = file_handlers_config(LOG_DIR)
+    dictConfig({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': FORMATTERS,
+        'filters': FILTERS,
+        'handlers': handlers,
+        'root': {
+            'handlers': list(handlers),
+            'level': 'DEBUG',
+        },
+    })
+
+    with LogRecordSocketServer((LOG_SOCKET_HOST, LOG_SOCKET_PORT), LogRecordStreamHandler) as server:
+        server.serve_forever()
+
+if __name__ == '__main__':
+    serve()
@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import Integer, Float, String, Date
+from sqlalchemy import DDL, Integer, Float, String, Date, event
 from sqlalchemy.orm import Mapped, mapped_column
 from app import db
 
@@ -11,4 +11,51 @@ class Products(db.Model):
     description: Mapped[str] = mapped_column(String(200), nullable=False)
     price:  Mapped[float] = mapped_column(Float, nullable=False)
     created_at: Mapped[date] = mapped_column(Date, nullable=False)
-    updated_at: Mapped[date] = mapped_column(Date, nullable=True)
\ No newline at end of file
+    updated_at: Mapped[date] = mapped_column(Date, nullable=True)
+    # Row version, bumped on every update; used to build cheap ETags
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+    # The ORM increments the version in every UPDATE it emits (and checks it, so concurrent
+    # updates of the same product fail instead of overwriting each other)
+    __mapper_args__ = {"version_id_col": version}
+
+# Updates made outside the ORM (SQL consoles, imports, other services) that leave the version
+# unchanged get it bumped by a trigger, so the product ETags never go stale. The same triggers
+# are created by the `products_version_trigger` migration.
+VERSION_TRIGGERS = {
+    'mysql': [
+        """
+        CREATE TRIGGER products_bump_version BEFORE UPDATE ON products FOR EACH ROW
+        SET NEW.version = IF(NEW.version = OLD.version, OLD.version + 1, NEW.version)
+        """,
+    ],
+    'sqlite': [
+        """
+        CREATE TRIGGER products_bump_version AFTER UPDATE OF name, description, price, created_at, updated_at
+        ON products FOR EACH ROW WHEN NEW.version = OLD.version
+        BEGIN
+            UPDATE products SET version = OLD.version + 1 WHERE id = NEW.id;
+        END
+        """,
+    ],
+    'postgresql': [
+        """
+        CREATE FUNCTION products_bump_version() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.version = OLD.version THEN
+                NEW.version := OLD.version + 1;
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER products_bump_version BEFORE UPDATE ON products
+        FOR EACH ROW EXECUTE FUNCTION products_bump_version()
+        """,
+    ],
+}
+
+for dialect, statements in VERSION_TRIGGERS.items():
+    for statement in statements:
+        event.listen(Products.__table__, 'after_create', DDL(statement).execute_if(dialect=dialect))
@@ -0,0 +1,91 @@
+from datetime import date
+from logging import Logger
+from typing import Dict, List, Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..models.model import Products
+from ..interfaces.interfaces_repository import IRepository
+from .repository import ProductStatements
+
+class AsyncRepository(ProductStatements, IRepository):
+    """Asynchronous counterpart of `Repository`, used by the async (ASGI) mode.
+
+    Runs the same statements on an async engine; every call opens its own session, so a
+    connection is only held for the duration of one query (or one write transaction).
+    """
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], model: Products, logger: Logger):
+        self.session_factory = session_factory
+        self.model = model
+        self.logger = logger.getChild('repository')
+
+    async def get(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Fetches a list of items from the database with pagination."""
+        try:
+            async with self.session_factory() as session:
+                return (await session.execute(self._page_statement(offset, limit))).mappings().all()
+        except Exception as e:
+            self.logger.error("Error fetching products: %s", str(e), exc_info=True)
+            raise
+
+    async def get_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetches the items whose id is in `ids` with a single `WHERE id IN (...)` query."""
+        try:
+            async with self.session_factory() as session:
+                return (await session.execute(self._ids_statement(ids))).mappings().all()
+        except Exception as e:
+            self.logger.error("Error fetching products by id: %s", str(e), exc_info=True)
+            raise
+
+    async def get_versions(self, offset: int, limit: int) -> List[tuple[int, int]]:
+        """Fetches only the id and row version of a page of items."""
+        try:
+            async with self.session_factory() as session:
+                return [tuple(row) for row in (await session.execute(self._versions_statement(offset, limit))).all()]
+        except Exception as e:
+            self.logger.error("Error fetching product versions: %s", str(e), exc_info=True)
+            raise
+
+    async def add(self, data: Dict[str, Any]) -> bool:
+        """Adds an item in its own transaction; see `Repository.add`."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    session.add(self.model(**data))
+            return True
+        except Exception as e:
+            self.logger.error("Error adding item: %s", e, exc_info=True)
+            return False
+
+    async def update(self, id: int, data: Dict[str, Any]) -> bool:
+        """Updates the columns of an item, bumping its row version; see `Repository.update`."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    item = (await session.execute(select(self.model).where(self.model.id == id))).scalar_one_or_none()
+                    if item is None:
+                        return False
+
+                    for column, value in data.items():
+                        setattr(item, column, value)
+                    item.updated_at = date.today()
+            return True
+        except Exception as e:
+            self.logger.error("Error updating item: %s", e, exc_info=True)
+            return False
+
+    async def delete(self, id: int) -> bool:
+        """Deletes an item; returns False if it does not exist."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    item = (await session.execute(select(self.model).where(self.model.id == id))).scalar_one_or_none()
+                    if item is None:
+                        return False
+
+                    await session.delete(item)
+            return True
+        except Exception as e:
+            self.logger.error("Error deleting item: %s", e, exc_info=True)
+            return False
@@ -1,18 +1,49 @@
+from datetime import date
 from logging import Logger
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+from sqlalchemy.sql import Select
 
 from ..models.model import Products
 from ..interfaces.interfaces_repository import IRepository
+from ..utils.replica_router import ReplicaRouter
 
-class Repository(IRepository):
-    """"Generic repository class for CRUD operations."""
-    def __init__(self, session: Session, model: Products, logger: Logger):
+class ProductStatements:
+    """Statements shared by the synchronous and the asynchronous repositories, so both modes run the same SQL."""
+    model: Products
+
+    def _columns_statement(self) -> Select:
+        return select(self.model.id, self.model.name, self.model.description, self.model.price)
+
+    def _page_statement(self, offset: int, limit: int) -> Select:
+        return self._columns_statement().order_by(self.model.id).offset(offset).limit(limit)
+
+    def _ids_statement(self, ids: List[int]) -> Select:
+        return self._columns_statement().where(self.model.id.in_(ids))
+
+    def _versions_statement(self, offset: int, limit: int) -> Select:
+        return select(self.model.id, self.model.version).order_by(self.model.id).offset(offset).limit(limit)
+
+class Repository(ProductStatements, IRepository):
+    """"Generic repository class for CRUD operations.
+
+    Reads are served by a read replica when a router is given; writes, and the reads of a
+    request that already wrote, use the primary.
+    """
+    def __init__(self, session: Session, model: Products, logger: Logger, router: Optional[ReplicaRouter] = None):
         self.session = session
         self.model = model
         self.logger = logger.getChild('repository')
+        self.router = router
+
+    def _read_bind(self) -> Optional[Dict[str, Any]]:
+        return self.router.read_bind() if self.router else None
+
+    def _mark_write(self) -> None:
+        if self.router:
+            self.router.mark_write()
 
     def get(self, offset: int, limit: int ) -> List[Dict[str, Any]]:
         """Fetches a list of items from the database with pagination.
@@ -25,13 +56,8 @@ class Repository(IRepository):
             list[Dict[str,T]]: A list of items fetched from the database.
         """
         try:
-            stmt = select(
-                self.model.id, 
-                self.model.name, 
-                self.model.description,
-                self.model.price,
-                self.model.quantity_unit).offset(offset).limit(limit)
-            result = self.session.execute(stmt).mappings().all()
+            stmt = self._page_statement(offset, limit)
+            result = self.session.execute(stmt, bind_arguments=self._read_bind()).mappings().all()
 
             return result
         except Exception as e:
@@ -39,8 +65,52 @@ class Repository(IRepository):
             self.logger.error("Error fetching products: %s", str(e), exc_info=True)
             raise
 
+    def get_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetches the items whose id is in `ids` with a single `WHERE id IN (...)` query.
+
+        Args:
+            ids (List[int]): Identifiers of the items to fetch.
+
+        Returns:
+            List[Dict[str, Any]]: The items found; unknown ids are simply absent.
+        """
+        try:
+            stmt = self._ids_statement(ids)
+            result = self.session.execute(stmt, bind_arguments=self._read_bind()).mappings().all()
+
+            return result
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error("Error fetching products by id: %s", str(e), exc_info=True)
+            raise
+
+    def get_versions(self, offset: int, limit: int) -> List[tuple[int, int]]:
+        """Fetches only the id and row version of a page of items.
+
+        Args:
+            offset (int): The starting point for fetching items.
+            limit (int): The maximum number of items to fetch.
+
+        Returns:
+            List[tuple[int, int]]: `(id, version)` pairs of the page, in the same order as `get`.
+        """
+        try:
+            stmt = self._versions_statement(offset, limit)
+            return [tuple(row) for row in self.session.execute(stmt, bind_arguments=self._read_bind()).all()]
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error("Error fetching product versions: %s", str(e), exc_info=True)
+            raise
+
+    def warm_up(self) -> None:
+        """Run each read statement once, so the ORM mappers are configured and the SQL compiled before the first request."""
+        self.get(0, 1)
+        self.get_by_ids([0])
+        self.get_versions(0, 1)
+
     def add(self, data: dict[str,any]) -> bool:
         try:
+            self._mark_write()
             item = self.model(**data)
             self.session.add(item)
             self.session.commit()
@@ -51,11 +121,37 @@ class Repository(IRepository):
             self.logger.error(f"Error adding item: {e}", exc_info=True)
             return False
 
-    def update(self, id, item):
-        return self.db.update(id, item)
+    def update(self, id: int, data: dict[str, Any]) -> bool:
+        """Updates the columns of an item; the ORM bumps its row version, so its ETags change.
+
+        Args:
+            id (int): Identifier of the item.
+            data (dict[str, Any]): Column values to change.
+
+        Returns:
+            bool: True if the item was updated, False if it does not exist or the update failed.
+        """
+        try:
+            self._mark_write()
+            stmt = select(self.model).where(self.model.id == id)
+            item = self.session.execute(stmt).scalar_one_or_none()
+            if item is None:
+                return False
+
+            for column, value in data.items():
+                setattr(item, column, value)
+            item.updated_at = date.today()
+            self.session.commit()
+            self.logger.debug(f"Item updated: {item}")
+            return True
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error(f"Error updating item: {e}", exc_info=True)
+            return False
 
     def delete(self, id: int) -> bool:
         try:
+            self._mark_write()
             stmt = select(self.model).where(self.model.id == id)
             item = self.session.execute(stmt).scalar_one_or_none()
             
@@ -1,10 +1,13 @@
 from logging import Logger
+from typing import Any, Mapping, Optional
 
 from flask import Blueprint
 from flask_restful import Api
 from flask_sqlalchemy import SQLAlchemy
 
-def create_api_blueprint(db: SQLAlchemy, app_logger:Logger) -> Blueprint:
+from ..utils.replica_router import ReplicaRouter
+
+def create_api_blueprint(db: SQLAlchemy, app_logger:Logger, app_config: Mapping[str, Any], router: Optional[ReplicaRouter] = None) -> Blueprint:
     """Create the API blueprint for the application.
 
     This function is used to create and configure the API blueprint, 
@@ -19,6 +22,8 @@ def create_api_blueprint(db: SQLAlchemy, app_logger:Logger) -> Blueprint:
     Args:
         db: The database instance.
         app_logger: The main application logger.
+        app_config: The application configuration.
+        router: Optional router sending the reads to the read replicas.
 
     Returns:
         Blueprint: The configured API blueprint.
@@ -34,7 +39,7 @@ def create_api_blueprint(db: SQLAlchemy, app_logger:Logger) -> Blueprint:
     api = Api(api_bp)
 
     # Import the resources (endpoinst) of the API
-    from .resource import EndpointProduct
+    from .resource import EndpointProduct, EndpointProductLookup
 
     # Import the models, services, and repository
     from ..models.model import Products
@@ -42,11 +47,12 @@ def create_api_blueprint(db: SQLAlchemy, app_logger:Logger) -> Blueprint:
     from ..repository.repository import Repository
 
     # Create the repository and service instances
-    repository = Repository(db.session, Products, app_logger)
-    product_service = ProductService(repository, app_logger)
+    repository = Repository(db.session, Products, app_logger, router)
+    product_service = ProductService(repository, app_logger, max_batch_ids=app_config['PRODUCTS_BATCH_MAX_IDS'])
 
     # Register the resources in the API
     api.add_resource(EndpointProduct, '/products', resource_class_kwargs={'product_service': product_service, 'logger': resource_logger})
+    api.add_resource(EndpointProductLookup, '/products/lookup', resource_class_kwargs={'product_service': product_service, 'logger': resource_logger})
     resource_logger.info('Resources registered in the API blueprint')
 
 
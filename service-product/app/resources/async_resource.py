@@ -0,0 +1,127 @@
+from logging import Logger
+from typing import Any, Dict, List
+
+from flask_restful import abort
+from quart import Blueprint, Response, jsonify, request
+from quart.views import MethodView
+from werkzeug.exceptions import HTTPException
+
+from ..services.async_service import AsyncProductService
+from .resource import parse_ids
+
+class AsyncEndpointProduct(MethodView):
+    """
+    Async counterpart of `EndpointProduct`: products page by page, with an ETag built from the
+    row versions of the page, or the products listed in `?ids=`.
+
+    Args:
+        product_service (AsyncProductService): The service for managing products.
+        logger (Logger): The logger for logging messages.
+    """
+
+    def __init__(self, product_service: AsyncProductService, logger: Logger):
+        self.product_service = product_service
+        self.logger = logger
+
+    async def get(self) -> Response:
+        """Get a list of products with pagination, or the products listed in `?ids=`."""
+        self.logger.info("GET /products request received")
+
+        if 'ids' in request.args:
+            return await lookup_products(self.product_service, parse_ids(request.args['ids'].split(',')), self.logger)
+
+        offset = query_int('offset', 0, 'Offset for pagination')
+        limit = query_int('limit', 10, 'Number of items to return')
+        self.logger.info("GET /products - Pagination parameters: offset=%s, limit=%s", offset, limit)
+
+        try:
+            # Answer conditional requests from the row versions before loading the products
+            etag = await self.product_service.get_products_etag(offset, limit)
+            if request.if_none_match.contains_weak(etag):
+                self.logger.info("GET /products - Not modified")
+                not_modified = Response("", status=304)
+                not_modified.set_etag(etag)
+                return not_modified
+
+            products = await self.product_service.get_product(offset, limit)
+            self.logger.info("GET /products - Found %s products", len(products))
+            response = jsonify(products)
+            response.set_etag(etag)
+            return response
+        except Exception as e:
+            self.logger.error("GET /products - Error: %s", str(e), exc_info=True)
+            return jsonify({"error": "An error occurred while fetching products."})
+
+
+class AsyncEndpointProductLookup(MethodView):
+    """
+    Async counterpart of `EndpointProductLookup`: the products whose ids are sent as `{"ids": [1, 2, 3]}`.
+
+    Args:
+        product_service (AsyncProductService): The service for managing products.
+        logger (Logger): The logger for logging messages.
+    """
+
+    def __init__(self, product_service: AsyncProductService, logger: Logger):
+        self.product_service = product_service
+        self.logger = logger
+
+    async def post(self) -> Response:
+        """Get the products listed in the request body."""
+        self.logger.info("POST /products/lookup request received")
+
+        payload = await request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('ids'), list):
+            abort(400, message='The request body must be an object with an "ids" list')
+
+        return await lookup_products(self.product_service, parse_ids(payload['ids']), self.logger)
+
+
+def query_int(name: str, default: int, help: str) -> int:
+    """Read an integer query parameter, aborting with 400 (reqparse-style message) if it is not one."""
+    try:
+        return int(request.args.get(name, default))
+    except ValueError:
+        abort(400, message={name: help})
+
+
+async def lookup_products(product_service: AsyncProductService, ids: List[int], logger: Logger) -> Response:
+    """Resolve many products in a single service call and build the JSON response."""
+    try:
+        products = await product_service.get_products_by_ids(ids)
+    except ValueError as e:
+        abort(400, message=str(e))
+
+    logger.info("Product lookup - Found %s of %s requested products", len(products), len(ids))
+    return jsonify(products)
+
+
+def handle_http_exception(e: HTTPException) -> Response:
+    """Answer HTTP errors with the `{"message": ...}` body of Flask-RESTful."""
+    body: Dict[str, Any] = getattr(e, 'data', None) or {'message': e.description}
+    response = jsonify(body)
+    response.status_code = e.code
+    return response
+
+
+def create_async_api_blueprint(product_service: AsyncProductService, app_logger: Logger) -> Blueprint:
+    """Create the async API blueprint, injecting the product service into each view.
+
+    Args:
+        product_service: The async product service.
+        app_logger: The main application logger.
+
+    Returns:
+        Blueprint: The configured API blueprint.
+    """
+    resource_logger = app_logger.getChild('resources')
+
+    api_bp = Blueprint('async_api', __name__)
+    api_bp.add_url_rule('/products', view_func=AsyncEndpointProduct.as_view('products', product_service, resource_logger))
+    api_bp.add_url_rule(
+        '/products/lookup',
+        view_func=AsyncEndpointProductLookup.as_view('products_lookup', product_service, resource_logger)
+    )
+
+    resource_logger.info('Async API blueprint created successfully')
+    return api_bp
@@ -1,8 +1,8 @@
 from logging import Logger
 from typing import Dict, List, Any
 
-from flask_restful import Resource, reqparse
-from flask import jsonify
+from flask_restful import Resource, reqparse, abort
+from flask import Response, jsonify, request
 
 from ..interfaces.interface_service import IProductService
 
@@ -14,7 +14,10 @@ class EndpointProduct(Resource):
     a list of products with pagination.
 
     Available HTTP methods:
-        - GET: Retrieve a list of products with pagination.
+        - GET: Retrieve a list of products with pagination. Responses carry an ETag built from
+          the row versions of the page, and a matching `If-None-Match` gets `304 Not Modified`
+          without loading or serializing the products.
+        - GET with `?ids=1,2,3`: Retrieve the given products in a single query.
 
     Args:
         product_service (IProductService): The service for managing products.
@@ -26,9 +29,12 @@ class EndpointProduct(Resource):
         self.logger = logger
 
     def get(self) -> List[Dict[str, Any]]:
-        """Get a list of products with pagination."""
+        """Get a list of products with pagination, or the products listed in `?ids=`."""
         self.logger.info("GET /products request received")
 
+        if 'ids' in request.args:
+            return lookup_products(self.product_service, parse_ids(request.args['ids'].split(',')), self.logger)
+
         # Define the request parser for pagination
         parser = reqparse.RequestParser()
         parser.add_argument('offset', type=int,  default=0,  location='args', help='Offset for pagination')
@@ -42,10 +48,90 @@ class EndpointProduct(Resource):
         self.logger.info("GET /products - Pagination parameters: offset=%s, limit=%s", offset, limit)
 
         try:
+            # Answer conditional requests from the row versions before loading the products
+            etag = self.product_service.get_products_etag(offset, limit)
+            if request.if_none_match.contains_weak(etag):
+                self.logger.info("GET /products - Not modified")
+                not_modified = Response(status=304)
+                not_modified.set_etag(etag)
+                return not_modified
+
             # Fetch products from the service 
             products = self.product_service.get_product(offset, limit)
             self.logger.info("GET /products - Found %s products", len(products))
-            return jsonify(products)
+            response = jsonify(products)
+            response.set_etag(etag)
+            return response
         except Exception as e:
             self.logger.error("GET /products - Error: %s", str(e), exc_info=True)
-            return jsonify({"error": "An error occurred while fetching products."})
\ No newline at end of file
+            return jsonify({"error": "An error occurred while fetching products."})
+
+
+class EndpointProductLookup(Resource):
+    """
+    Endpoint for resolving many products at once.
+
+    It is the POST counterpart of `GET /products?ids=`, meant for id sets too large
+    to fit in a query string.
+
+    Available HTTP methods:
+        - POST: Retrieve the products whose ids are sent as `{"ids": [1, 2, 3]}`.
+
+    Args:
+        product_service (IProductService): The service for managing products.
+        logger (Logger): The logger for logging messages.
+    """
+
+    def __init__(self, product_service: IProductService, logger: Logger):
+        self.product_service = product_service
+        self.logger = logger
+
+    def post(self) -> Response:
+        """Get the products listed in the request body."""
+        self.logger.info("POST /products/lookup request received")
+
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('ids'), list):
+            abort(400, message='The request body must be an object with an "ids" list')
+
+        return lookup_products(self.product_service, parse_ids(payload['ids']), self.logger)
+
+
+def parse_ids(raw_ids: List[Any]) -> List[int]:
+    """Validate a list of raw product ids, aborting with 400 if any of them is not a positive integer.
+
+    Args:
+        raw_ids (List[Any]): Ids as received in the query string or in the JSON body.
+
+    Returns:
+        List[int]: The ids as integers, in the order received.
+    """
+    try:
+        ids = [int(raw_id) for raw_id in raw_ids if not isinstance(raw_id, bool)]
+    except (TypeError, ValueError):
+        abort(400, message='Product ids must be integers')
+
+    if not ids or len(ids) != len(raw_ids) or any(product_id <= 0 for product_id in ids):
+        abort(400, message='Product ids must be a non-empty list of positive integers')
+
+    return ids
+
+
+def lookup_products(product_service: IProductService, ids: List[int], logger: Logger) -> Response:
+    """Resolve many products in a single service call and build the JSON response.
+
+    Args:
+        product_service (IProductService): The service for managing products.
+        ids (List[int]): Identifiers of the products to fetch.
+        logger (Logger): The logger for logging messages.
+
+    Returns:
+        Response: JSON list of the products found.
+    """
+    try:
+        products = product_service.get_products_by_ids(ids)
+    except ValueError as e:
+        abort(400, message=str(e))
+
+    logger.info("Product lookup - Found %s of %s requested products", len(products), len(ids))
+    return jsonify(products)
@@ -0,0 +1,35 @@
+from typing import Dict, List, Any
+
+from .service import ProductService
+
+class AsyncProductService(ProductService):
+    """Asynchronous counterpart of `ProductService`, used by the async (ASGI) mode.
+
+    Same rules and helpers, on top of `AsyncRepository`: the read methods are coroutines.
+    """
+
+    async def get_product(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Get products from the repository with pagination."""
+        try:
+            products = await self.repository.get(offset, limit)
+            return [dict(product) for product in products]
+        except Exception as e:
+            self.logger.error("Error fetching products: %s", e, exc_info=True)
+            raise
+
+    async def get_products_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get many products by id in a single repository round trip, in the order requested.
+
+        Raises:
+            ValueError: If more than `max_batch_ids` distinct ids are requested.
+        """
+        unique_ids = self._unique_ids(ids)
+        try:
+            return self._in_request_order(unique_ids, await self.repository.get_by_ids(unique_ids))
+        except Exception as e:
+            self.logger.error("Error fetching products by id: %s", e, exc_info=True)
+            raise
+
+    async def get_products_etag(self, offset: int, limit: int) -> str:
+        """Build the entity tag of a page of products from the row versions only."""
+        return self._etag(offset, limit, await self.repository.get_versions(offset, limit))
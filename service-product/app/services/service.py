@@ -1,3 +1,4 @@
+import hashlib
 from logging import Logger
 from typing import Dict, List, Any
 
@@ -7,9 +8,10 @@ from ..repository.repository import Repository
 class ProductService(IProductService):
     """"Service class for managing products."""
 
-    def __init__(self, repository: Repository, logger: Logger):
+    def __init__(self, repository: Repository, logger: Logger, max_batch_ids: int = 200):
         self.repository = repository
         self.logger = logger.getChild('ProductService') 
+        self.max_batch_ids = max_batch_ids
 
     def get_product(self, offset: int, limit: int) -> List[Dict[str, Any]]:
         """Get products from the repository with pagination.
@@ -34,6 +36,61 @@ class ProductService(IProductService):
             self.logger.error("Error fetching products: %s", e, exc_info=True)
             raise
 
+    def get_products_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get many products by id in a single repository round trip.
+
+        Duplicated ids are removed before querying. Products are returned in the order their
+        ids were first requested; ids that do not exist are left out.
+
+        Args:
+            ids (List[int]): Identifiers of the products to fetch.
+
+        Returns:
+            list[Dict[str,T]]: The products found.
+
+        Raises:
+            ValueError: If more than `max_batch_ids` distinct ids are requested.
+        """
+        unique_ids = self._unique_ids(ids)
+        try:
+            return self._in_request_order(unique_ids, self.repository.get_by_ids(unique_ids))
+        except Exception as e:
+            self.logger.error("Error fetching products by id: %s", e, exc_info=True)
+            raise
+
+    def get_products_etag(self, offset: int, limit: int) -> str:
+        """Build the entity tag of a page of products from the row versions only.
+
+        Args:
+            offset (int): The starting point for pagination.
+            limit (int): The number of products in the page.
+
+        Returns:
+            str: A tag that changes whenever a product of the page is added, removed or updated.
+        """
+        return self._etag(offset, limit, self.repository.get_versions(offset, limit))
+
+    def _unique_ids(self, ids: List[int]) -> List[int]:
+        """Remove the duplicated ids, raising ValueError above `max_batch_ids` distinct ids."""
+        unique_ids = list(dict.fromkeys(ids))
+        if len(unique_ids) > self.max_batch_ids:
+            raise ValueError(f"A lookup cannot contain more than {self.max_batch_ids} distinct ids")
+        return unique_ids
+
+    def _in_request_order(self, unique_ids: List[int], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order the products found as their ids were requested."""
+        products = {product["id"]: dict(product) for product in rows}
+        self.logger.debug("Found %s of %s requested products", len(products), len(unique_ids))
+
+        return [products[product_id] for product_id in unique_ids if product_id in products]
+
+    def _etag(self, offset: int, limit: int, versions: List[tuple[int, int]]) -> str:
+        """Hash the row versions of a page into its entity tag."""
+        digest = hashlib.sha1(repr((offset, limit, versions)).encode()).hexdigest()
+
+        self.logger.debug("Computed ETag for %s products", len(versions))
+        return digest
+
     def add_product(self, cake_data):
         pass
 
@@ -1,6 +1,9 @@
-from typing import Callable, Any
+import time
+from logging import Logger
+from typing import Callable, Any, Optional
 
-from utils.exceptions import ComponentInitializationError
+from .exceptions import ComponentInitializationError
+from .startup import StartupTimings
 
 class SafeInit:
     """
@@ -16,12 +19,22 @@ class SafeInit:
         _args (tuple): Positional arguments for the initialization function.
         _init_fn (Callable): The initialization function (e.g., db.init_app).
         _name (str): Human-readable name of the component, for error messages.
+        _logger (Optional[Logger]): Logger used to report the outcome of the initialization.
+        duration (float): Seconds spent in the initialization function, also recorded in the
+            optional startup timings under the component name.
     """
-    def __init__(self, *args: Any, init_fn: Callable[..., Any], name: str):
+    def __init__(
+        self, *args: Any, init_fn: Callable[..., Any], name: str, app_logger: Optional[Logger] = None,
+        timings: Optional[StartupTimings] = None
+    ):
         self._args = args
         self._init_fn = init_fn
         self._name = name
+        self._logger = app_logger
+        self.duration = 0.0
         self._run()
+        if timings is not None:
+            timings.record(name, self.duration)
 
     def _run(self) -> None:
         """
@@ -30,7 +43,12 @@ class SafeInit:
         Calls the provided function with its arguments. If an exception occurs,
         it wraps it in a ComponentInitializationError with the component name.
         """
+        started = time.perf_counter()
         try:
             self._init_fn(*self._args)
+            self.duration = time.perf_counter() - started
+            if self._logger:
+                self._logger.debug("%s initialized in %.1f ms", self._name, self.duration * 1000)
         except Exception as e:
+            self.duration = time.perf_counter() - started
             raise ComponentInitializationError(f"Failed to initialize {self._name}: {e}")
\ No newline at end of file
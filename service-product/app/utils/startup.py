@@ -0,0 +1,44 @@
+import time
+from contextlib import contextmanager
+from logging import Logger
+from typing import Iterator
+
+class StartupTimings:
+    """
+    Wall-clock duration of each phase of the application startup.
+
+    Phases are recorded in the order they run, either around a block with `phase()` or by the
+    components themselves (see `InitializationComponent`), and reported once startup is over.
+
+    Attributes:
+        phases (dict[str, float]): Seconds spent in each phase, by name.
+    """
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as the phase `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add `seconds` to the phase `name`."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        """Seconds elapsed since the timings were created."""
+        return time.perf_counter() - self._started
+
+    def report(self, logger: Logger) -> None:
+        """Log the total startup time and the duration of every phase."""
+        logger.info(
+            "Startup completed in %.1f ms (%s)",
+            self.total * 1000,
+            ", ".join(f"{name}: {seconds * 1000:.1f} ms" for name, seconds in self.phases.items())
+        )
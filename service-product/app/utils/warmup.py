@@ -0,0 +1,24 @@
+from logging import Logger
+
+from flask import Flask
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.repository.repository import Repository
+
+def warm_up_queries(app: Flask, repository: Repository, logger: Logger) -> None:
+    """
+    Pay, before the application serves traffic, the one-off cost of the first product queries:
+    configuring the ORM mappers and compiling the SQL (`Repository.warm_up`).
+
+    A database failure (e.g. the table does not exist yet) is only logged.
+
+    Args:
+        app (Flask): The application being started.
+        repository (Repository): A product repository bound to the application session.
+        logger (Logger): Logger used to report the outcome.
+    """
+    with app.app_context():
+        try:
+            repository.warm_up()
+        except SQLAlchemyError as e:
+            logger.warning("Could not warm up the product queries: %s", e)
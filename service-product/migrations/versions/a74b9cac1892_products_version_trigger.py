@@ -0,0 +1,76 @@
+"""products version trigger
+
+Revision ID: a74b9cac1892
+Revises: 3094e00f79fa
+Create Date: 2026-10-17 15:30:12.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a74b9cac1892'
+down_revision = '3094e00f79fa'
+branch_labels = None
+depends_on = None
+
+# Bump `products.version` on the updates that leave it unchanged (the ones made outside the ORM)
+UPGRADE = {
+    'mysql': [
+        """
+        CREATE TRIGGER products_bump_version BEFORE UPDATE ON products FOR EACH ROW
+        SET NEW.version = IF(NEW.version = OLD.version, OLD.version + 1, NEW.version)
+        """,
+    ],
+    'sqlite': [
+        """
+        CREATE TRIGGER products_bump_version AFTER UPDATE OF name, description, price, created_at, updated_at
+        ON products FOR EACH ROW WHEN NEW.version = OLD.version
+        BEGIN
+            UPDATE products SET version = OLD.version + 1 WHERE id = NEW.id;
+        END
+        """,
+    ],
+    'postgresql': [
+        """
+        CREATE FUNCTION products_bump_version() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.version = OLD.version THEN
+                NEW.version := OLD.version + 1;
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER products_bump_version BEFORE UPDATE ON products
+        FOR EACH ROW EXECUTE FUNCTION products_bump_version()
+        """,
+    ],
+}
+
+DOWNGRADE = {
+    'mysql': ["DROP TRIGGER IF EXISTS products_bump_version"],
+    'sqlite': ["DROP TRIGGER IF EXISTS products_bump_version"],
+    'postgresql': [
+        "DROP TRIGGER IF EXISTS products_bump_version ON products",
+        "DROP FUNCTION IF EXISTS products_bump_version()",
+    ],
+}
+
+
+def _run(statements):
+    dialect = op.get_bind().dialect.name
+    if dialect not in statements:
+        raise NotImplementedError(f"No products version trigger for the {dialect} dialect")
+    for statement in statements[dialect]:
+        op.execute(statement)
+
+
+def upgrade():
+    _run(UPGRADE)
+
+
+def downgrade():
+    _run(DOWNGRADE)